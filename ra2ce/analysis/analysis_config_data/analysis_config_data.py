@@ -38,6 +38,9 @@ from ra2ce.analysis.analysis_config_data.enums.loss_type_enum import LossTypeEnu
 from ra2ce.analysis.analysis_config_data.enums.risk_calculation_mode_enum import (
     RiskCalculationModeEnum,
 )
+from ra2ce.analysis.analysis_config_data.enums.routing_engine_enum import (
+    RoutingEngineEnum,
+)
 from ra2ce.analysis.analysis_config_data.enums.traffic_period_enum import (
     TrafficPeriodEnum,
 )
@@ -65,6 +68,7 @@ class ProjectSection:
     """
 
     name: str = ""
+    cache_criticality_results: bool = False
 
 
 @dataclass
@@ -89,6 +93,10 @@ class AnalysisSectionLosses(AnalysisSectionBase):
     )
     # general
     weighing: WeighingEnum = field(default_factory=lambda: WeighingEnum.NONE)
+    routing_engine: RoutingEngineEnum = field(
+        default_factory=lambda: RoutingEngineEnum.NONE
+    )
+    n_workers: int = 1
     loss_per_distance: str = ""
     loss_type: LossTypeEnum = field(default_factory=lambda: LossTypeEnum.NONE)
     disruption_per_category: str = ""
@@ -45,6 +45,9 @@ from ra2ce.analysis.analysis_config_data.enums.loss_type_enum import LossTypeEnu
 from ra2ce.analysis.analysis_config_data.enums.risk_calculation_mode_enum import (
     RiskCalculationModeEnum,
 )
+from ra2ce.analysis.analysis_config_data.enums.routing_engine_enum import (
+    RoutingEngineEnum,
+)
 from ra2ce.analysis.analysis_config_data.enums.traffic_period_enum import (
     TrafficPeriodEnum,
 )
@@ -106,7 +109,13 @@ class AnalysisConfigDataReader(ConfigDataReaderProtocol):
         }
 
     def get_project_section(self) -> ProjectSection:
-        return ProjectSection(**self._parser["project"])
+        _section = ProjectSection(**self._parser["project"])
+        _section.cache_criticality_results = self._parser.getboolean(
+            "project",
+            "cache_criticality_results",
+            fallback=_section.cache_criticality_results,
+        )
+        return _section
 
     def _get_analysis_section_losses(self, section_name: str) -> AnalysisSectionLosses:
         _section = AnalysisSectionLosses(**self._parser[section_name])
@@ -125,6 +134,12 @@ class AnalysisConfigDataReader(ConfigDataReaderProtocol):
             _section.weighing = WeighingEnum.LENGTH
         else:
             _section.weighing = WeighingEnum.get_enum(_weighing)
+        _section.routing_engine = RoutingEngineEnum.get_enum(
+            self._parser.get(section_name, "routing_engine", fallback=None)
+        )
+        _section.n_workers = self._parser.getint(
+            section_name, "n_workers", fallback=_section.n_workers
+        )
         _section.loss_type = LossTypeEnum.get_enum(
             self._parser.get(section_name, "loss_type", fallback=None)
         )
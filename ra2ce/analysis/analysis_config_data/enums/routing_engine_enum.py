@@ -0,0 +1,15 @@
+from __future__ import annotations
+
+from ra2ce.configuration.ra2ce_enum_base import Ra2ceEnumBase
+
+
+class RoutingEngineEnum(Ra2ceEnumBase):
+    NONE = 0
+    NETWORKX = 1
+    CSR = 2
+    REPLACEMENT_PATHS = 3
+    INVALID = 99
+
+    @classmethod
+    def get_enum(cls, input: str | None) -> RoutingEngineEnum:
+        return super().get_enum(input)
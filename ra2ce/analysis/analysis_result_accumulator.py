@@ -0,0 +1,72 @@
+"""
+                    GNU GENERAL PUBLIC LICENSE
+                      Version 3, 29 June 2007
+
+    Risk Assessment and Adaptation for Critical Infrastructure (RA2CE).
+    Copyright (C) 2023 Stichting Deltares
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+from typing import Any, Optional
+
+import pandas as pd
+
+
+class AnalysisResultAccumulator:
+    """
+    Collects the results of an analysis row by row into columns (lists),
+    so the `DataFrame` is built only once when all results are known
+    (instead of concatenating a new `DataFrame` per row).
+    """
+
+    columns: list[str]
+
+    def __init__(self, columns: list[str]) -> None:
+        self.columns = columns
+        self._values = {_column: [] for _column in columns}
+
+    def __len__(self) -> int:
+        return len(self._values[self.columns[0]]) if self.columns else 0
+
+    def add_row(self, row: dict[str, Any]) -> None:
+        """
+        Adds the results of a single row.
+
+        Args:
+            row (dict[str, Any]): Value of each column.
+
+        Raises:
+            ValueError: When the row does not contain a value for all (and only the) columns.
+        """
+        if row.keys() != self._values.keys():
+            raise ValueError(
+                "Row columns {} do not match the result columns {}.".format(
+                    list(row.keys()), self.columns
+                )
+            )
+        for _column, _value in row.items():
+            self._values[_column].append(_value)
+
+    def to_dataframe(self, index: Optional[pd.Index] = None) -> pd.DataFrame:
+        """
+        Builds the `DataFrame` with all collected results.
+
+        Args:
+            index (Optional[pd.Index]): Index of the rows. Defaults to None (range index).
+
+        Returns:
+            pd.DataFrame: The collected results, with the columns in the given order.
+        """
+        return pd.DataFrame(self._values, index=index, columns=self.columns)
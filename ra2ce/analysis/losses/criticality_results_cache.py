@@ -0,0 +1,138 @@
+"""
+                    GNU GENERAL PUBLIC LICENSE
+                      Version 3, 29 June 2007
+
+    Risk Assessment and Adaptation for Critical Infrastructure (RA2CE).
+    Copyright (C) 2023 Stichting Deltares
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import pickle
+import weakref
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import geopandas as gpd
+import pandas as pd
+from networkx import MultiGraph
+
+from ra2ce.analysis.losses.multi_link_redundancy import MultiLinkRedundancy
+from ra2ce.analysis.losses.single_link_redundancy import SingleLinkRedundancy
+
+
+@dataclass
+class CriticalityResultsCache:
+    """
+    Cache of the results of the criticality (redundancy) analyses of a run, so a
+    redundancy analysis requested on its own and by the losses analyses
+    (with the same graph, weighing, threshold and hazards) is executed only once.
+
+    With a `cache_path` the results are also stored on disk, to be reused
+    by reruns with unchanged inputs.
+    """
+
+    cache_path: Path | None = None
+    _results: dict[str, gpd.GeoDataFrame] = field(default_factory=dict)
+    _graph_hashes: weakref.WeakKeyDictionary[MultiGraph, str] = field(
+        default_factory=weakref.WeakKeyDictionary
+    )
+
+    def get_key(self, analysis: SingleLinkRedundancy | MultiLinkRedundancy) -> str:
+        """
+        Gets the key of the result of the analysis: a hash of the analysis type, the content
+        of its graph, its weighing, its routing engine, its threshold and the hazard names.
+
+        Args:
+            analysis (SingleLinkRedundancy | MultiLinkRedundancy): The criticality analysis.
+
+        Returns:
+            str: The key of the result.
+        """
+        if isinstance(analysis, MultiLinkRedundancy):
+            _graph = analysis.graph_file_hazard.get_graph()
+        else:
+            _graph = analysis.graph_file.get_graph()
+        _hazard_names = analysis.hazard_names.names
+        _key = (
+            type(analysis).__name__,
+            self._get_graph_hash(_graph),
+            analysis.analysis.weighing.config_value,
+            analysis.analysis.routing_engine.config_value,
+            float(analysis.analysis.threshold),
+            [
+                (_hazard, analysis.hazard_names.get_name(_hazard))
+                for _hazard in _hazard_names
+            ],
+        )
+        return hashlib.sha256(repr(_key).encode()).hexdigest()
+
+    def _get_graph_hash(self, graph: MultiGraph) -> str:
+        # The same graph (object) is hashed only once per run.
+        # The graphs are weakly referenced, so the hash of a released graph
+        # is never reused for another graph (at the same address).
+        # Only its content is hashed, as (networkx) graphs also cache views of it.
+        if graph not in self._graph_hashes:
+            _content = (
+                type(graph).__name__,
+                graph.graph,
+                list(graph.nodes(data=True)),
+                list(
+                    graph.edges(keys=True, data=True)
+                    if graph.is_multigraph()
+                    else graph.edges(data=True)
+                ),
+            )
+            self._graph_hashes[graph] = hashlib.sha256(
+                pickle.dumps(_content, protocol=pickle.HIGHEST_PROTOCOL)
+            ).hexdigest()
+        return self._graph_hashes[graph]
+
+    def get_result(
+        self, analysis: SingleLinkRedundancy | MultiLinkRedundancy
+    ) -> gpd.GeoDataFrame:
+        """
+        Gets the result of the criticality analysis from the cache,
+        executing (and caching) it when it is not found.
+
+        Args:
+            analysis (SingleLinkRedundancy | MultiLinkRedundancy): The criticality analysis.
+
+        Returns:
+            gpd.GeoDataFrame: A copy of the result, so it can be altered by the caller.
+        """
+        _key = self.get_key(analysis)
+        if _key not in self._results:
+            _cache_file = (
+                self.cache_path.joinpath(f"{_key}.pkl") if self.cache_path else None
+            )
+            if _cache_file and _cache_file.is_file():
+                logging.info(
+                    "Reusing the cached %s result from %s.",
+                    type(analysis).__name__,
+                    _cache_file,
+                )
+                self._results[_key] = pd.read_pickle(_cache_file)
+            else:
+                self._results[_key] = analysis.execute()
+                if _cache_file:
+                    _cache_file.parent.mkdir(parents=True, exist_ok=True)
+                    self._results[_key].to_pickle(_cache_file)
+        else:
+            logging.info("Reusing the %s result of this run.", type(analysis).__name__)
+        return self._results[_key].copy()
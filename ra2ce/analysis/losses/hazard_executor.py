@@ -0,0 +1,68 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Optional
+
+import networkx as nx
+
+# Graph and calculation loaded once by each worker process (see `_load_worker`).
+_worker_graph: Optional[nx.MultiGraph] = None
+_worker_run_hazard: Optional[Callable[[nx.MultiGraph, str], Any]] = None
+
+
+def _load_worker(
+    graph: nx.MultiGraph, run_hazard: Callable[[nx.MultiGraph, str], Any]
+) -> None:
+    global _worker_graph, _worker_run_hazard
+    _worker_graph = graph
+    _worker_run_hazard = run_hazard
+
+
+def _run_hazard_in_worker(hazard_name: str) -> Any:
+    return _worker_run_hazard(_worker_graph, hazard_name)
+
+
+class HazardExecutor:
+    """
+    Runs the (independent) calculation of each hazard of a multi-link analysis,
+    in a pool of worker processes when more than one worker is configured.
+
+    Each worker receives the graph and the calculation (including the inputs bound to it)
+    once, not per hazard, and the results are returned in the order of the hazards,
+    so they are identical to a serial run. The calculation should therefore not alter
+    the graph and it should be picklable (e.g. a `functools.partial` of a static method),
+    without referring to the graph itself.
+    """
+
+    graph: nx.MultiGraph
+    n_workers: int
+
+    def __init__(self, graph: nx.MultiGraph, n_workers: int = 1) -> None:
+        self.graph = graph
+        self.n_workers = n_workers if n_workers > 0 else os.cpu_count()
+
+    def map(
+        self,
+        run_hazard: Callable[[nx.MultiGraph, str], Any],
+        hazard_names: list[str],
+    ) -> list[Any]:
+        """
+        Runs the calculation for each hazard.
+
+        Args:
+            run_hazard (Callable[[nx.MultiGraph, str], Any]): Calculation of a hazard, given the graph and the hazard name.
+            hazard_names (list[str]): Names of the hazards (as in the graph).
+
+        Returns:
+            list[Any]: Result of each hazard, in the same order.
+        """
+        if self.n_workers < 2 or len(hazard_names) < 2:
+            return [
+                run_hazard(self.graph, _hazard_name) for _hazard_name in hazard_names
+            ]
+
+        with ProcessPoolExecutor(
+            max_workers=min(self.n_workers, len(hazard_names)),
+            initializer=_load_worker,
+            initargs=(self.graph, run_hazard),
+        ) as _executor:
+            return list(_executor.map(_run_hazard_in_worker, hazard_names))
@@ -20,11 +20,11 @@
 """
 
 import logging
-import math
 from abc import ABC, abstractmethod
 from pathlib import Path
 
 import geopandas as gpd
+import numpy as np
 import pandas as pd
 
 from ra2ce.analysis.analysis_config_data.analysis_config_data import (
@@ -37,6 +37,11 @@ from ra2ce.analysis.analysis_config_data.enums.trip_purpose_enum import TripPurp
 from ra2ce.analysis.analysis_config_wrapper import AnalysisConfigWrapper
 from ra2ce.analysis.analysis_input_wrapper import AnalysisInputWrapper
 from ra2ce.analysis.losses.analysis_losses_protocol import AnalysisLossesProtocol
+from ra2ce.analysis.losses.criticality_results_cache import CriticalityResultsCache
+from ra2ce.analysis.losses.losses_ensemble import LossesEnsemble
+from ra2ce.analysis.losses.resilience_curves.compiled_resilience_curves import (
+    CompiledResilienceCurves,
+)
 from ra2ce.analysis.losses.resilience_curves.resilience_curves_reader import (
     ResilienceCurvesReader,
 )
@@ -107,6 +112,9 @@ class LossesBase(AnalysisLossesProtocol, ABC):
         self.output_path = analysis_input.output_path
         self.hazard_names = analysis_input.hazard_names
 
+        # Shared with the other analyses of the run (see `LossesAnalysisRunner`).
+        self.criticality_results_cache: CriticalityResultsCache | None = None
+
         self.result = gpd.GeoDataFrame()
 
     def _check_validity_analysis_files(self):
@@ -168,10 +176,17 @@ class LossesBase(AnalysisLossesProtocol, ABC):
             self.criticality_analysis_non_disrupted.reset_index()
         )
 
-    def calculate_vehicle_loss_hours(self) -> gpd.GeoDataFrame:
+    def calculate_vehicle_loss_hours(
+        self, ensemble: LossesEnsemble | None = None
+    ) -> gpd.GeoDataFrame:
         """
         This function opens an existing table with traffic data and value of time to calculate losses based on
         detouring values. It also includes a traffic jam estimation.
+
+        Args:
+            ensemble (LossesEnsemble | None, optional): Alternative values of time and resilience curves
+                to calculate the losses of (per member or their quantiles), instead of those of the analysis.
+                Defaults to None.
         """
 
         def _check_validity_criticality_analysis():
@@ -181,13 +196,6 @@ class LossesBase(AnalysisLossesProtocol, ABC):
             {self.link_type_column} is passed as link_type_column"""
                 )
 
-        def _get_range(height: float) -> tuple[float, float]:
-            for range_tuple in _hazard_intensity_ranges:
-                x, y = range_tuple
-                if x <= height <= y:
-                    return (x, y)
-            raise ValueError(f"No matching range found for height {height}")
-
         def _create_result(vlh: gpd.GeoDataFrame) -> gpd.GeoDataFrame:
             """
 
@@ -235,7 +243,6 @@ class LossesBase(AnalysisLossesProtocol, ABC):
 
         _check_validity_criticality_analysis()
 
-        _hazard_intensity_ranges = self.resilience_curves.ranges
         events = self.criticality_analysis.filter(regex=r"^EV(?!1_fr)")
         # Read the performance_change stating the functionality drop
         if "key" in self.criticality_analysis.columns:
@@ -293,223 +300,602 @@ class LossesBase(AnalysisLossesProtocol, ABC):
             geometry="geometry",
             crs=self.criticality_analysis.crs,
         )
-        for event in events.columns.tolist():
-            for _, vlh_row in vehicle_loss_hours.iterrows():
-                row_hazard_range = _get_range(vlh_row[event])
-                row_connectivity = vlh_row[connectivity_attribute]
-                row_performance_changes = performance_change.loc[
-                    [vlh_row[self.link_id]]
-                ]
-                if "key" in vlh_row.index:
-                    key = vlh_row["key"]
-                else:
-                    key = 0
-                (u, v, k) = (
-                    vlh_row["u"],
-                    vlh_row["v"],
-                    key,
-                )
-                # allow link_id not to be unique in the graph (results reliability is up to the user)
-                # this can happen for instance when a directed graph should be made from an input network
-                for performance_row in row_performance_changes.iterrows():
-                    row_performance_change = performance_row[-1][
-                        f"{self.performance_metric}"
-                    ]
-                    if "key" in performance_row[-1].index:
-                        performance_key = performance_row[-1]["key"]
-                    else:
-                        performance_key = 0
-                    row_u_v_k = (
-                        performance_row[-1]["u"],
-                        performance_row[-1]["v"],
-                        performance_key,
+        if ensemble is None:
+            _vehicle_loss_hours = self._get_vehicle_loss_hours(
+                vehicle_loss_hours,
+                performance_change,
+                connectivity_attribute,
+                events.columns.tolist(),
+            )
+        else:
+            _vehicle_loss_hours = self._get_ensemble_vehicle_loss_hours(
+                vehicle_loss_hours,
+                performance_change,
+                connectivity_attribute,
+                events.columns.tolist(),
+                ensemble,
+            )
+        # Add all (possibly many ensemble) columns at once.
+        vehicle_loss_hours = pd.concat(
+            [
+                vehicle_loss_hours.drop(
+                    columns=vehicle_loss_hours.columns.intersection(
+                        list(_vehicle_loss_hours)
                     )
-                    if (
-                        math.isnan(row_performance_change) and row_connectivity == 0
-                    ) or row_performance_change == 0:
-                        self._calculate_production_loss_per_capita(
-                            vehicle_loss_hours, row_hazard_range, vlh_row, event
-                        )
-                    elif not (
-                        math.isnan(row_performance_change)
-                        and math.isnan(row_connectivity)
-                    ) and ((u, v, k) == row_u_v_k):
-                        self._populate_vehicle_loss_hour(
-                            vehicle_loss_hours,
-                            row_hazard_range,
-                            vlh_row,
-                            row_performance_change,
-                            event,
-                        )
+                ),
+                pd.DataFrame(_vehicle_loss_hours, index=vehicle_loss_hours.index),
+            ],
+            axis=1,
+        )
 
         vehicle_loss_hours_result = _create_result(vehicle_loss_hours)
         return vehicle_loss_hours_result
 
-    def _get_relevant_link_type(
-        self, vlh_row: pd.Series, row_hazard_range: tuple[float, float]
-    ) -> RoadTypeEnum:
-        # Check if the resilience curve is present for the link type and hazard intensity
-        _relevant_link_type = None
-        if isinstance(vlh_row[self.link_type_column], list):
-            # Find the link type with the highest disruption for the given hazard intensity
-            _max_disruption = 0
-            for _row_link_type in vlh_row[self.link_type_column]:
-                _link_type = RoadTypeEnum.get_enum(_row_link_type)
-                disruption = self.resilience_curves.get_disruption(
-                    _link_type, row_hazard_range
-                )
-                if disruption > _max_disruption:
-                    _relevant_link_type = _link_type
-        else:
-            _link_type = RoadTypeEnum.get_enum(vlh_row[self.link_type_column])
-            if self.resilience_curves.has_resilience_curve(
-                _link_type,
-                row_hazard_range,
-            ):
-                _relevant_link_type = _link_type
+    def _get_vehicle_loss_hours(
+        self,
+        vehicle_loss_hours: gpd.GeoDataFrame,
+        performance_change: pd.DataFrame,
+        connectivity_attribute: str | None,
+        events: list[str],
+    ) -> dict[str, np.ndarray]:
+        """
+        Calculates the vehicle loss hours of all links, trip purposes and events at once,
+        for the pairs of links and performance changes found by `_get_loss_pairs`.
 
-        if not _relevant_link_type:
-            raise ValueError(
-                f"'{_link_type}' with range {row_hazard_range} was not found in the introduced resilience_curves"
-            )
+        Args:
+            vehicle_loss_hours (gpd.GeoDataFrame): Disrupted links, with their link type, connectivity and hazard intensities.
+            performance_change (pd.DataFrame): Performance change of the edges, indexed by their link id.
+            connectivity_attribute (str | None): Name of the connectivity column (`detour` or `connected`).
+            events (list[str]): Names of the hazard intensity columns of the events.
 
-        return _relevant_link_type
+        Returns:
+            dict[str, np.ndarray]: The `vlh_{trip_purpose}_{event}` and `vlh_{event}_total` columns (`NaN` for rows without losses).
+        """
+        if not events or vehicle_loss_hours.empty:
+            return {}
 
-    def _get_divisor(
-        self, relevant_link_type: RoadTypeEnum, row_hazard_range: tuple[float, float]
-    ):
-        if all(
-            ratio <= 1
-            for ratio in self.resilience_curves.get_functionality_loss_ratio(
-                relevant_link_type, row_hazard_range
+        _loss_pairs = self._get_loss_pairs(
+            vehicle_loss_hours, performance_change, connectivity_attribute
+        )
+        if not _loss_pairs:
+            return {}
+        (
+            _row_winners,
+            _winner_rows,
+            _is_result_row,
+            _performance_changes,
+            _is_production_loss,
+        ) = _loss_pairs
+
+        _resilience_curves = self.resilience_curves.compile()
+        (
+            _link_type_codes,
+            _relevant_link_types,
+            _link_type_errors,
+        ) = self._get_relevant_link_types(
+            vehicle_loss_hours[self.link_type_column], _resilience_curves
+        )
+        _intensities = self._get_link_intensities(
+            vehicle_loss_hours[self.link_id].iloc[_winner_rows].tolist()
+        )
+
+        _vehicle_loss_hours = {}
+        for _event in events:
+            _event_intensities = vehicle_loss_hours[_event]
+            _range_ids = _resilience_curves.get_range_ids(
+                _event_intensities.to_numpy(dtype=float)
             )
-        ):
-            return 1
-        return 100  # high value assuming the road is almost inaccessible
+            _link_type_ids = np.where(
+                _range_ids >= 0,
+                _relevant_link_types[_link_type_codes, _range_ids],
+                -1,
+            )
+            self._check_resilience_curves_found(
+                _event_intensities,
+                _range_ids,
+                _is_result_row & (_link_type_ids < 0),
+                _link_type_codes,
+                _link_type_errors,
+            )
+
+            _curves = (
+                _link_type_ids[_winner_rows],
+                _range_ids[_winner_rows],
+            )
+            _losses = self._get_losses(
+                _resilience_curves.durations[_curves],
+                _resilience_curves.loss_ratios[_curves],
+                _resilience_curves.has_step[_curves],
+                _resilience_curves.divisors[_curves],
+                _intensities,
+                _performance_changes,
+                _is_production_loss,
+            )
+            _total = np.zeros(len(_winner_rows))
+            for _trip_id, _trip_type in enumerate(self.trip_purposes):
+                _vehicle_loss_hours[f"vlh_{_trip_type}_{_event}"] = np.where(
+                    _row_winners >= 0, _losses[_row_winners, _trip_id], np.nan
+                )
+                _total = _total + _losses[:, _trip_id]
+            _vehicle_loss_hours[f"vlh_{_event}_total"] = np.where(
+                _row_winners >= 0, _total[_row_winners], np.nan
+            )
+        return _vehicle_loss_hours
 
-    def _calculate_production_loss_per_capita(
+    def _get_ensemble_vehicle_loss_hours(
         self,
         vehicle_loss_hours: gpd.GeoDataFrame,
-        row_hazard_range: tuple[float, float],
-        vlh_row: pd.Series,
-        hazard_col_name: str,
-    ):
+        performance_change: pd.DataFrame,
+        connectivity_attribute: str | None,
+        events: list[str],
+        ensemble: LossesEnsemble,
+    ) -> dict[str, np.ndarray]:
         """
-        In cases where there is no alternative route in the event of disruption of the road, we propose to use a
-        proxy for the assessment of losses from the interruption of services from the road in these cases where no
-        alternative routes exist.
-        The assumption for the proxy is that a loss of production will occur from the
-        interruption of the road, equal to the size of the added value from the persons that cannot make use of the
-        road, measured in the regional GDP per capita. This assumption constitutes both the loss of production within
-        the area that cannot be reached, as well the loss of production outside the area due to the inability of the
-        workers from within the cut-off area to arrive at their place of production outside this area.
-
-        The daily loss of productivity for each link section without detour routes, when they are
-        disrupted is then obtained multiplying the traffic intensity by the total occupancy per vehicle type,
-        including drivers, by the daily loss of productivity per capita per hour.
-
-        The unit of time is hour.
+        Calculates the vehicle loss hours of all members of the ensemble at once,
+        for the pairs of links and performance changes found by `_get_loss_pairs`.
+
+        The losses are linear in the value of time (detour) or the occupancy (production loss)
+        and in the sum over the duration steps of the resilience curve (see `_get_losses`).
+        These are combined per member beforehand, so the losses of all members, links and trip purposes
+        are a single broadcasted product (the sums may differ from `_get_vehicle_loss_hours` by rounding).
+
+        Args:
+            vehicle_loss_hours (gpd.GeoDataFrame): Disrupted links, with their link type, connectivity and hazard intensities.
+            performance_change (pd.DataFrame): Performance change of the edges, indexed by their link id.
+            connectivity_attribute (str | None): Name of the connectivity column (`detour` or `connected`).
+            events (list[str]): Names of the hazard intensity columns of the events.
+            ensemble (LossesEnsemble): Values of time and resilience curves of the members.
+
+        Returns:
+            dict[str, np.ndarray]: The `vlh_{trip_purpose}_{event}_member_{member}` and `vlh_{event}_total_member_{member}` columns,
+                or `..._q{quantile}` columns with quantiles (`NaN` for rows without losses).
         """
-        vlh_total = 0
-        _relevant_link_type = self._get_relevant_link_type(vlh_row, row_hazard_range)
-        _divisor = self._get_divisor(_relevant_link_type, row_hazard_range)
+        if not events or vehicle_loss_hours.empty:
+            return {}
 
-        duration_steps = self.resilience_curves.get_duration_steps(
-            _relevant_link_type, row_hazard_range
+        _loss_pairs = self._get_loss_pairs(
+            vehicle_loss_hours, performance_change, connectivity_attribute
         )
-        functionality_loss_ratios = self.resilience_curves.get_functionality_loss_ratio(
-            _relevant_link_type, row_hazard_range
+        if not _loss_pairs:
+            return {}
+        (
+            _row_winners,
+            _winner_rows,
+            _is_result_row,
+            _performance_changes,
+            _is_production_loss,
+        ) = _loss_pairs
+
+        _members = ensemble.get_members()
+        _resilience_curves = CompiledResilienceCurves.stack(
+            [_member_curves.compile() for _, _member_curves in _members]
+        )
+        (
+            _link_type_codes,
+            _relevant_link_types,
+            _link_type_errors,
+        ) = self._get_relevant_link_types(
+            vehicle_loss_hours[self.link_type_column], _resilience_curves
+        )
+        _intensities = self._get_link_intensities(
+            vehicle_loss_hours[self.link_id].iloc[_winner_rows].tolist()
         )
 
-        for trip_type in self.trip_purposes:
-            intensity_trip_type = (
-                self.intensities.calculate_intensity(
-                    vlh_row[self.link_id], self.traffic_period, trip_type
-                )
-                / self.hours_per_traffic_period
+        # Hours of each member and curve, summed over the duration steps.
+        _durations = np.where(
+            _resilience_curves.has_step, _resilience_curves.durations, 0.0
+        )
+        _detour_hours = (_durations * _resilience_curves.loss_ratios).sum(
+            axis=-1
+        ) / _resilience_curves.divisors
+        _production_loss_hours = (_durations**2 * _resilience_curves.loss_ratios).sum(
+            axis=-1
+        ) / _resilience_curves.divisors
+        _occupancies = np.zeros((len(_members), len(self.trip_purposes)))
+        if _is_production_loss.any():
+            _occupancies = np.array(
+                [
+                    [_values.get_occupants(_trip) for _trip in self.trip_purposes]
+                    for _values, _ in _members
+                ]
+            )
+        _values_of_time = np.zeros((len(_members), len(self.trip_purposes)))
+        if not _is_production_loss.all():
+            _values_of_time = np.array(
+                [
+                    [_values.get_value_of_time(_trip) for _trip in self.trip_purposes]
+                    for _values, _ in _members
+                ]
             )
 
-            occupancy_trip_type = self.values_of_time.get_occupants(trip_type)
-            vlh_trip_type_event = sum(
-                (
-                    intensity_trip_type
-                    * duration**2
-                    * loss_ratio
-                    * occupancy_trip_type
-                    * self.production_loss_per_capita_per_hour
-                )
-                / _divisor
-                for duration, loss_ratio in zip(
-                    duration_steps, functionality_loss_ratios
-                )
+        if ensemble.quantiles:
+            _names = [f"q{_quantile}" for _quantile in ensemble.quantiles]
+        else:
+            _names = [f"member_{_member}" for _member in range(len(_members))]
+
+        _vehicle_loss_hours = {}
+        for _event in events:
+            _event_intensities = vehicle_loss_hours[_event]
+            _range_ids = _resilience_curves.get_range_ids(
+                _event_intensities.to_numpy(dtype=float)
+            )
+            _link_type_ids = np.where(
+                _range_ids >= 0,
+                _relevant_link_types[:, _link_type_codes, _range_ids],
+                -1,
+            )
+            self._check_resilience_curves_found(
+                _event_intensities,
+                _range_ids,
+                _is_result_row & (_link_type_ids < 0).any(axis=0),
+                _link_type_codes,
+                _link_type_errors,
+            )
+
+            _curves = (
+                np.arange(len(_members))[:, None],
+                _link_type_ids[:, _winner_rows],
+                _range_ids[_winner_rows],
             )
+            # Losses of each member (first axis), link and trip purpose.
+            _losses = _intensities * np.where(
+                _is_production_loss[:, None],
+                _occupancies[:, None, :]
+                * self.production_loss_per_capita_per_hour
+                * _production_loss_hours[_curves][..., None],
+                _performance_changes[:, None]
+                * _values_of_time[:, None, :]
+                * _detour_hours[_curves][..., None],
+            )
+            _losses = np.concatenate(
+                [_losses, _losses.sum(axis=-1, keepdims=True)], axis=-1
+            )
+            if ensemble.quantiles:
+                _losses = np.quantile(_losses, ensemble.quantiles, axis=0)
 
-            vehicle_loss_hours.loc[
-                [vlh_row.name], f"vlh_{trip_type}_{hazard_col_name}"
-            ] = vlh_trip_type_event
-            vlh_total += vlh_trip_type_event
-        vehicle_loss_hours.loc[
-            [vlh_row.name], f"vlh_{hazard_col_name}_total"
-        ] = vlh_total
+            for _name, _member_losses in zip(_names, _losses):
+                _member_losses = np.where(
+                    _row_winners[:, None] >= 0, _member_losses[_row_winners], np.nan
+                )
+                for _trip_id, _trip_type in enumerate(self.trip_purposes):
+                    _vehicle_loss_hours[
+                        f"vlh_{_trip_type}_{_event}_{_name}"
+                    ] = _member_losses[:, _trip_id]
+                _vehicle_loss_hours[f"vlh_{_event}_total_{_name}"] = _member_losses[
+                    :, -1
+                ]
+        return _vehicle_loss_hours
+
+    @staticmethod
+    def _check_resilience_curves_found(
+        hazard_intensities: pd.Series,
+        range_ids: np.ndarray,
+        is_missing_link_type: np.ndarray,
+        link_type_codes: np.ndarray,
+        link_type_errors: dict[tuple[int, int], str],
+    ) -> None:
+        """
+        Raises the error of the first link without a hazard range for its intensity,
+        or without a resilience curve for its link type and hazard range.
+
+        Args:
+            hazard_intensities (pd.Series): Hazard intensity of each link.
+            range_ids (np.ndarray): Hazard range of each link (-1 if none).
+            is_missing_link_type (np.ndarray): Whether the resilience curve of the link is missing.
+            link_type_codes (np.ndarray): Code of the link type of each link.
+            link_type_errors (dict[tuple[int, int], str]): Error of each missing link type code and hazard range.
+
+        Raises:
+            ValueError: When a hazard range or resilience curve is missing.
+        """
+        _is_invalid_range = range_ids < 0
+        _is_invalid = _is_invalid_range | is_missing_link_type
+        if not _is_invalid.any():
+            return
+        _row = np.flatnonzero(_is_invalid)[0]
+        if _is_invalid_range[_row]:
+            raise ValueError(
+                f"No matching range found for height {hazard_intensities.iloc[_row]}"
+            )
+        raise ValueError(link_type_errors[(link_type_codes[_row], range_ids[_row])])
 
-    def _populate_vehicle_loss_hour(
+    def _get_loss_pairs(
         self,
         vehicle_loss_hours: gpd.GeoDataFrame,
-        row_hazard_range: tuple[float, float],
-        vlh_row: pd.Series,
-        performance_change: float,
-        hazard_col_name: str,
-    ):
+        performance_change: pd.DataFrame,
+        connectivity_attribute: str | None,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray] | None:
+        """
+        Pairs each row of `vehicle_loss_hours` with the performance changes of its link id
+        (link_id is allowed not to be unique in the graph, results reliability is up to the user,
+        this can happen for instance when a directed graph should be made from an input network).
+        A pair results in a production loss when there is no detour for the link
+        (see `_get_losses`), or in vehicle loss hours when the performance change
+        belongs to the same edge (u, v, key). The last resulting pair determines the losses
+        of all rows with the same index.
+
+        Args:
+            vehicle_loss_hours (gpd.GeoDataFrame): Disrupted links, with their link type, connectivity and hazard intensities.
+            performance_change (pd.DataFrame): Performance change of the edges, indexed by their link id.
+            connectivity_attribute (str | None): Name of the connectivity column (`detour` or `connected`).
+
+        Returns:
+            tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray] | None: The resulting pair of each row
+                (-1 if none), the row of each resulting pair, whether each row results in a pair itself, and the
+                performance change and whether it is a production loss of each resulting pair. None without any resulting pair.
+        """
+        # Pair each row with all performance changes of its link id (in order).
+        _link_codes, _ = pd.factorize(
+            np.concatenate(
+                [
+                    performance_change.index.to_numpy(dtype=object),
+                    vehicle_loss_hours[self.link_id].to_numpy(dtype=object),
+                ]
+            )
+        )
+        _performance_codes = _link_codes[: len(performance_change)]
+        _row_codes = _link_codes[len(performance_change) :]
+        _performance_counts = np.bincount(
+            _performance_codes, minlength=_link_codes.max() + 1
+        )
+        _row_counts = _performance_counts[_row_codes]
+        _pair_rows = np.repeat(np.arange(len(vehicle_loss_hours)), _row_counts)
+        _pair_offsets = np.arange(len(_pair_rows)) - np.repeat(
+            np.cumsum(_row_counts) - _row_counts, _row_counts
+        )
+        _pair_performance_rows = np.argsort(_performance_codes, kind="stable")[
+            np.repeat(
+                (np.cumsum(_performance_counts) - _performance_counts)[_row_codes],
+                _row_counts,
+            )
+            + _pair_offsets
+        ]
 
-        vlh_total = 0
-        _relevant_link_type = self._get_relevant_link_type(vlh_row, row_hazard_range)
-        _divisor = self._get_divisor(_relevant_link_type, row_hazard_range)
+        _performance = performance_change[self.performance_metric].to_numpy(
+            dtype=float
+        )[_pair_performance_rows]
+        _connectivity = vehicle_loss_hours[connectivity_attribute].to_numpy(
+            dtype=float
+        )[_pair_rows]
+        _is_same_edge = np.logical_and.reduce(
+            [
+                vehicle_loss_hours[_col].to_numpy()[_pair_rows]
+                == performance_change[_col].to_numpy()[_pair_performance_rows]
+                for _col in ["u", "v", "key"]
+                if _col in performance_change.columns
+            ]
+        )
+        _is_production_loss = (np.isnan(_performance) & (_connectivity == 0)) | (
+            _performance == 0
+        )
+        _is_detour = (
+            ~_is_production_loss
+            & ~(np.isnan(_performance) & np.isnan(_connectivity))
+            & _is_same_edge
+        )
 
-        duration_steps = self.resilience_curves.get_duration_steps(
-            _relevant_link_type, row_hazard_range
+        # The last resulting pair of the rows with the same index determines their losses.
+        _row_labels, _ = pd.factorize(vehicle_loss_hours.index)
+        _result_pairs = np.flatnonzero(_is_production_loss | _is_detour)[::-1]
+        if not len(_result_pairs):
+            return None
+        _result_labels, _last = np.unique(
+            _row_labels[_pair_rows[_result_pairs]], return_index=True
         )
-        functionality_loss_ratios = self.resilience_curves.get_functionality_loss_ratio(
-            _relevant_link_type, row_hazard_range
+        _winners = _result_pairs[_last]
+        _winner_rows = _pair_rows[_winners]
+        _row_winners = np.full(_row_labels.max() + 1, -1)
+        _row_winners[_result_labels] = np.arange(len(_winners))
+        _row_winners = _row_winners[_row_labels]
+        _is_result_row = np.zeros(len(vehicle_loss_hours), dtype=bool)
+        _is_result_row[_pair_rows[_result_pairs]] = True
+
+        return (
+            _row_winners,
+            _winner_rows,
+            _is_result_row,
+            _performance[_winners],
+            _is_production_loss[_winners],
         )
 
-        # get vlh_trip_type_event
-        for trip_type in self.trip_purposes:
-            intensity_trip_type = (
-                self.intensities.calculate_intensity(
-                    vlh_row[self.link_id], self.traffic_period, trip_type
+    @staticmethod
+    def _get_relevant_link_types(
+        link_types: pd.Series, resilience_curves: CompiledResilienceCurves
+    ) -> tuple[np.ndarray, np.ndarray, dict[tuple[int, int], str]]:
+        """
+        Gets the link type of which the resilience curve is relevant, for each (distinct)
+        link type and hazard range. For a list of link types this is the link type
+        with the highest disruption for the hazard range.
+        For stacked resilience curves this is done for each member (leading axis).
+
+        Args:
+            link_types (pd.Series): Link type (or list of link types) of each link.
+            resilience_curves (CompiledResilienceCurves): The compiled resilience curves.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray, dict[tuple[int, int], str]]: The code of the link type of each link,
+                the relevant link type (position in `resilience_curves.link_types`) of each code
+                and hazard range (-1 if none), and the error of the missing ones (of any member).
+        """
+        _link_type_codes, _link_type_values = pd.factorize(
+            link_types.map(lambda x: tuple(x) if isinstance(x, list) else x).to_numpy(
+                dtype=object
+            )
+        )
+        # Links without link type are coded after the distinct link types.
+        _link_type_codes = np.where(
+            _link_type_codes < 0, len(_link_type_values), _link_type_codes
+        )
+
+        _nr_ranges = len(resilience_curves.ranges)
+        _members = resilience_curves.has_curve.shape[:-2]
+        _relevant_link_types = np.full(
+            _members + (len(_link_type_values) + 1, _nr_ranges), -1
+        )
+        _link_type_errors = {}
+        for _code, _link_type_value in enumerate(list(_link_type_values) + [np.nan]):
+            _row_link_types = list(
+                map(
+                    RoadTypeEnum.get_enum,
+                    (
+                        _link_type_value
+                        if isinstance(_link_type_value, tuple)
+                        else (_link_type_value,)
+                    ),
                 )
-                / self.hours_per_traffic_period
             )
+            _ids = resilience_curves.get_link_type_ids(_row_link_types)
+            _is_known = _ids >= 0
+            _has_curve = np.zeros(_members + (len(_ids), _nr_ranges), bool)
+            _has_curve[..., _is_known, :] = resilience_curves.has_curve[
+                ..., _ids[_is_known], :
+            ]
+            if isinstance(_link_type_value, tuple):
+                # Find the link type with the highest disruption for the given hazard intensity
+                # (the disruption of a missing curve is 0).
+                _disruptions = np.zeros(_has_curve.shape)
+                _disruptions[..., _is_known, :] = resilience_curves.disruptions[
+                    ..., _ids[_is_known], :
+                ]
+                _relevant = _disruptions.argmax(axis=-2)
+                _is_relevant = _disruptions.max(axis=-2, initial=0) > 0
+            else:
+                _relevant = np.zeros(_members + (_nr_ranges,), dtype=int)
+                _is_relevant = _has_curve[..., 0, :]
+
+            _relevant_link_types[..., _code, :] = np.where(
+                _is_relevant, _ids[_relevant], -1
+            )
+            for _range_id in np.flatnonzero(
+                ~np.all(_is_relevant, axis=tuple(range(len(_members))))
+            ):
+                _link_type_errors[
+                    (_code, _range_id)
+                ] = f"'{_row_link_types[-1]}' with range {resilience_curves.ranges[_range_id]} was not found in the introduced resilience_curves"
 
-            vot_trip_type = self.values_of_time.get_value_of_time(trip_type)
+        return _link_type_codes, _relevant_link_types, _link_type_errors
 
-            vlh_trip_type_event = sum(
-                (
-                    intensity_trip_type
-                    * duration
-                    * loss_ratio
-                    * performance_change
-                    * vot_trip_type
-                )
-                / _divisor
-                for duration, loss_ratio in zip(
-                    duration_steps, functionality_loss_ratios
-                )
+    def _get_link_intensities(
+        self, link_ids: list[int | tuple[int, int]]
+    ) -> np.ndarray:
+        """
+        Gets the traffic intensity per hour of the links for each trip purpose.
+        For a tuple of link ids (simplified graph) the maximum intensity of the links is used.
+
+        Args:
+            link_ids (list[int | tuple[int, int]]): Link id(s) of each link.
+
+        Returns:
+            np.ndarray: Intensity of each link (rows) and trip purpose (columns).
+        """
+        return np.column_stack(
+            [
+                self.intensities.calculate_intensities(
+                    link_ids, self.traffic_period, _trip_type
+                ).astype(float)
+                / self.hours_per_traffic_period
+                for _trip_type in self.trip_purposes
+            ]
+        ).reshape(len(link_ids), len(self.trip_purposes))
+
+    def _get_losses(
+        self,
+        durations: np.ndarray,
+        loss_ratios: np.ndarray,
+        has_step: np.ndarray,
+        divisors: np.ndarray,
+        intensities: np.ndarray,
+        performance_changes: np.ndarray,
+        is_production_loss: np.ndarray,
+    ) -> np.ndarray:
+        """
+        Calculates the losses of the links for each trip purpose, summed over the duration steps
+        of their resilience curve. The unit of time is hour.
+
+        With a detour the vehicle loss hours are the traffic intensity times the performance change
+        (e.g. the extra length) times the value of time of the trip purpose.
+
+        In cases where there is no alternative route in the event of disruption of the road, we propose to use a
+        proxy for the assessment of losses from the interruption of services from the road in these cases where no
+        alternative routes exist.
+        The assumption for the proxy is that a loss of production will occur from the
+        interruption of the road, equal to the size of the added value from the persons that cannot make use of the
+        road, measured in the regional GDP per capita. This assumption constitutes both the loss of production within
+        the area that cannot be reached, as well the loss of production outside the area due to the inability of the
+        workers from within the cut-off area to arrive at their place of production outside this area.
+
+        The daily loss of productivity for each link section without detour routes, when they are
+        disrupted is then obtained multiplying the traffic intensity by the total occupancy per vehicle type,
+        including drivers, by the daily loss of productivity per capita per hour.
+
+        Args:
+            durations (np.ndarray): Duration steps of the resilience curve of each link (rows, padded).
+            loss_ratios (np.ndarray): Functionality loss ratio steps of the resilience curve of each link (rows, padded).
+            has_step (np.ndarray): Whether the (padded) step exists in the resilience curve of the link.
+            divisors (np.ndarray): Divisor of the resilience curve of each link.
+            intensities (np.ndarray): Traffic intensity per hour of each link (rows) and trip purpose (columns).
+            performance_changes (np.ndarray): Performance change of each link.
+            is_production_loss (np.ndarray): Whether the link has no detour (production loss).
+
+        Returns:
+            np.ndarray: Losses of each link (rows) and trip purpose (columns).
+        """
+        if is_production_loss.any():
+            _occupancies = np.array(
+                [
+                    self.values_of_time.get_occupants(_trip)
+                    for _trip in self.trip_purposes
+                ]
             )
-            vehicle_loss_hours.loc[
-                [vlh_row.name], f"vlh_{trip_type}_{hazard_col_name}"
-            ] = vlh_trip_type_event
-            vlh_total += vlh_trip_type_event
-        vehicle_loss_hours.loc[
-            [vlh_row.name], f"vlh_{hazard_col_name}_total"
-        ] = vlh_total
+        if not is_production_loss.all():
+            _values_of_time = np.array(
+                [
+                    self.values_of_time.get_value_of_time(_trip)
+                    for _trip in self.trip_purposes
+                ]
+            )
+        _losses = np.zeros(intensities.shape)
+        for _step in range(durations.shape[1]):
+            _duration = durations[:, _step, None]
+            _loss_ratio = loss_ratios[:, _step, None]
+            _step_losses = np.zeros(intensities.shape)
+            if is_production_loss.any():
+                _step_losses[is_production_loss] = (
+                    (
+                        intensities
+                        * _duration**2
+                        * _loss_ratio
+                        * _occupancies
+                        * self.production_loss_per_capita_per_hour
+                    )
+                    / divisors[:, None]
+                )[is_production_loss]
+            if not is_production_loss.all():
+                _step_losses[~is_production_loss] = (
+                    (
+                        intensities
+                        * _duration
+                        * _loss_ratio
+                        * performance_changes[:, None]
+                        * _values_of_time
+                    )
+                    / divisors[:, None]
+                )[~is_production_loss]
+            _losses = _losses + np.where(has_step[:, _step, None], _step_losses, 0.0)
+        return _losses
 
     @abstractmethod
     def _get_criticality_analysis(self) -> AnalysisLossesProtocol:
         pass
 
+    def _get_criticality_analysis_result(self) -> gpd.GeoDataFrame:
+        _criticality_analysis = self._get_criticality_analysis()
+        if self.criticality_results_cache is not None:
+            return self.criticality_results_cache.get_result(_criticality_analysis)
+        return _criticality_analysis.execute()
+
     def execute(self) -> gpd.GeoDataFrame:
-        criticality_analysis = self._get_criticality_analysis().execute()
+        criticality_analysis = self._get_criticality_analysis_result()
 
         self._get_disrupted_criticality_analysis_results(
             criticality_analysis=criticality_analysis
@@ -517,3 +903,23 @@ class LossesBase(AnalysisLossesProtocol, ABC):
 
         self.result = self.calculate_vehicle_loss_hours()
         return self.result
+
+    def execute_ensemble(self, ensemble: LossesEnsemble) -> gpd.GeoDataFrame:
+        """
+        Executes the criticality analysis once and calculates the losses
+        of all members of the ensemble with its result.
+
+        Args:
+            ensemble (LossesEnsemble): Values of time and resilience curves of the members.
+
+        Returns:
+            gpd.GeoDataFrame: The losses per member (or their quantiles).
+        """
+        criticality_analysis = self._get_criticality_analysis_result()
+
+        self._get_disrupted_criticality_analysis_results(
+            criticality_analysis=criticality_analysis
+        )
+
+        self.result = self.calculate_vehicle_loss_hours(ensemble)
+        return self.result
@@ -0,0 +1,111 @@
+"""
+                    GNU GENERAL PUBLIC LICENSE
+                      Version 3, 29 June 2007
+
+    Risk Assessment and Adaptation for Critical Infrastructure (RA2CE).
+    Copyright (C) 2023 Stichting Deltares
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from ra2ce.analysis.losses.resilience_curves.resilience_curves import ResilienceCurves
+from ra2ce.analysis.losses.resilience_curves.resilience_curves_reader import (
+    ResilienceCurvesReader,
+)
+from ra2ce.analysis.losses.time_values.time_values import TimeValues
+from ra2ce.analysis.losses.time_values.time_values_reader import TimeValuesReader
+
+
+@dataclass(kw_only=True)
+class LossesEnsemble:
+    """
+    Parameter sets (members) of a sensitivity analysis of the losses, each a pair
+    of values of time and resilience curves, evaluated against the same
+    criticality analysis result (see `LossesBase.calculate_vehicle_loss_hours`).
+
+    A single set of values of time or resilience curves is shared by all members.
+    Without quantiles the vehicle loss hours of each member are returned,
+    otherwise only the given quantiles (0 to 1) over the members.
+    """
+
+    values_of_time: list[TimeValues]
+    resilience_curves: list[ResilienceCurves]
+    quantiles: list[float] = field(default_factory=list)
+
+    def __post_init__(self) -> None:
+        if not self.values_of_time or not self.resilience_curves:
+            raise ValueError(
+                "At least one set of values of time and resilience curves should be given"
+            )
+        if len(self.values_of_time) != len(self.resilience_curves) and 1 not in (
+            len(self.values_of_time),
+            len(self.resilience_curves),
+        ):
+            raise ValueError(
+                "The number of values of time and resilience curves sets should be equal (or one of them 1)"
+            )
+        if any(not 0 <= _quantile <= 1 for _quantile in self.quantiles):
+            raise ValueError("Quantiles should be between 0 and 1")
+
+    @classmethod
+    def from_files(
+        cls,
+        values_of_time_files: list[Path],
+        resilience_curves_files: list[Path],
+        quantiles: list[float] | None = None,
+    ) -> LossesEnsemble:
+        """
+        Reads the members from alternative `values_of_time_file`s and `resilience_curves_file`s.
+
+        Args:
+            values_of_time_files (list[Path]): Values of time csv file of each member (or of all members).
+            resilience_curves_files (list[Path]): Resilience curves csv file of each member (or of all members).
+            quantiles (list[float] | None, optional): Quantiles to summarize the members with. Defaults to None.
+
+        Returns:
+            LossesEnsemble: The ensemble.
+        """
+        _time_values_reader = TimeValuesReader()
+        _resilience_curves_reader = ResilienceCurvesReader()
+        return cls(
+            values_of_time=list(map(_time_values_reader.read, values_of_time_files)),
+            resilience_curves=list(
+                map(_resilience_curves_reader.read, resilience_curves_files)
+            ),
+            quantiles=quantiles or [],
+        )
+
+    @property
+    def nr_members(self) -> int:
+        return max(len(self.values_of_time), len(self.resilience_curves))
+
+    def get_members(self) -> list[tuple[TimeValues, ResilienceCurves]]:
+        """
+        Gets the values of time and resilience curves of each member.
+
+        Returns:
+            list[tuple[TimeValues, ResilienceCurves]]: The values of time and resilience curves of each member.
+        """
+        return [
+            (
+                self.values_of_time[_member % len(self.values_of_time)],
+                self.resilience_curves[_member % len(self.resilience_curves)],
+            )
+            for _member in range(self.nr_members)
+        ]
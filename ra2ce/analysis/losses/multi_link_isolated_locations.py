@@ -1,10 +1,10 @@
-import copy
+from functools import partial
 from pathlib import Path
 
 import networkx as nx
 import numpy as np
 import pandas as pd
-from geopandas import GeoDataFrame, overlay, read_feather
+from geopandas import GeoDataFrame, read_feather
 from pyproj import CRS
 
 from ra2ce.analysis.analysis_config_data.analysis_config_data import (
@@ -12,6 +12,8 @@ from ra2ce.analysis.analysis_config_data.analysis_config_data import (
 )
 from ra2ce.analysis.analysis_input_wrapper import AnalysisInputWrapper
 from ra2ce.analysis.losses.analysis_losses_protocol import AnalysisLossesProtocol
+from ra2ce.analysis.losses.hazard_executor import HazardExecutor
+from ra2ce.analysis.losses.routing_engine.connectivity_utils import get_component_labels
 from ra2ce.network.graph_files.graph_file import GraphFile
 from ra2ce.network.hazard.hazard_names import HazardNames
 from ra2ce.network.networks_utils import buffer_geometry, graph_to_gdf
@@ -60,31 +62,29 @@ class MultiLinkIsolatedLocations(AnalysisLossesProtocol):
         epsg = CRS(proj="utm", datum="WGS84", ellps="WGS84", **kwargs).to_epsg()
         return CRS.from_epsg(epsg)
 
-    def remove_edges_from_largest_component(self, disconnected_graph: nx.Graph) -> None:
+    @staticmethod
+    def get_isolated_edges(
+        nr_nodes: int, edge_nodes: np.ndarray, is_removed: np.ndarray
+    ) -> np.ndarray:
         """
-        This function removes all edges from the largest connected component of a graph.
+        This function finds the edges that are not part of the largest connected component of a graph,
+        once the removed edges are taken out of it.
 
         Args:
-            disconnected_graph (nx.Graph): The graph from which to remove the edges.
-        """
-        connected_components = list(
-            c for c in nx.connected_components(disconnected_graph)
-        )
-        connected_components_size = list(
-            len(c) for c in nx.connected_components(disconnected_graph)
-        )
+            nr_nodes (int): The number of nodes of the graph.
+            edge_nodes (np.ndarray): The (integer) end nodes of each edge of the graph.
+            is_removed (np.ndarray): Whether each edge is removed from the graph.
 
-        largest_comp_index = connected_components_size.index(
-            max(connected_components_size)
-        )
-        edges_from_lagest_component = list(
-            disconnected_graph.subgraph(
-                connected_components[largest_comp_index]
-            ).edges()
-        )
-        disconnected_graph.remove_edges_from(edges_from_lagest_component)
+        Returns:
+            np.ndarray: Whether each edge is isolated (removed edges are not).
+        """
+        _labels = get_component_labels(nr_nodes, edge_nodes[~is_removed])
+        # The first largest component, as the labels follow the order of the nodes.
+        _largest_component = np.argmax(np.bincount(_labels, minlength=nr_nodes))
+        return ~is_removed & (_labels[edge_nodes[:, 0]] != _largest_component)
 
-    def get_network_with_edge_fid(self, graph: nx.Graph) -> GeoDataFrame:
+    @staticmethod
+    def get_network_with_edge_fid(graph: nx.Graph) -> GeoDataFrame:
         """
         This function converts a NetworkX graph into a GeoDataFrame representing the network.
         It also constructs an 'edge_fid' column based on the 'node_A' and 'node_B' columns, following a specific convention.
@@ -106,8 +106,51 @@ class MultiLinkIsolatedLocations(AnalysisLossesProtocol):
             ]
         return network[["edge_fid", "geometry"]]
 
+    @staticmethod
+    def intersect_locations(
+        locations: GeoDataFrame, roads: GeoDataFrame
+    ) -> GeoDataFrame:
+        """
+        This function relates the (point) locations to the (buffered) roads they intersect,
+        with the same result as `overlay(locations, roads, how="intersection")`.
+        It queries the spatial index of the locations, which is built once and reused for every hazard.
+
+        Args:
+            locations (gpd.GeoDataFrame): The point locations.
+            roads (gpd.GeoDataFrame): The buffered roads, in the same CRS as the locations.
+
+        Returns:
+            gpd.GeoDataFrame: A row for each pair of location and road that intersect, with the attributes of both.
+        """
+        _road_idx, _location_idx = locations.sindex.query(
+            roads.geometry, predicate="intersects"
+        )
+        _order = np.lexsort((_road_idx, _location_idx))
+        _pairs = pd.DataFrame(
+            {"__idx1": _location_idx[_order], "__idx2": _road_idx[_order]}
+        )
+        _locations = locations.reset_index(drop=True)
+        _roads = roads.reset_index(drop=True)
+        _intersections = _pairs.merge(
+            _locations.drop(columns=_locations.geometry.name),
+            left_on="__idx1",
+            right_index=True,
+        ).merge(
+            _roads.drop(columns=_roads.geometry.name),
+            left_on="__idx2",
+            right_index=True,
+            suffixes=("_1", "_2"),
+        )
+        # The intersection of a point and a polygon is the point itself.
+        return GeoDataFrame(
+            _intersections.drop(columns=["__idx1", "__idx2"]),
+            geometry=_locations.geometry.take(_pairs["__idx1"]).reset_index(drop=True),
+            crs=locations.crs,
+        ).reset_index(drop=True)
+
+    @staticmethod
     def _summarize_locations(
-        self, locations: GeoDataFrame, cat_col: str, hazard_id: str
+        locations: GeoDataFrame, cat_col: str, hazard_id: str
     ) -> pd.DataFrame:
         """
         This function summarizes the hazard impacts on different categories of locations.
@@ -133,12 +176,106 @@ class MultiLinkIsolatedLocations(AnalysisLossesProtocol):
         df_aggregation.rename(columns={f"i_{hazard_id}": "nr_isolated"}, inplace=True)
         return df_aggregation
 
+    @staticmethod
+    def _get_hazard_isolated_locations(
+        analysis: AnalysisSectionLosses,
+        locations: GeoDataFrame,
+        road_buffers: GeoDataFrame,
+        edge_nodes: np.ndarray,
+        output_path: Path,
+        graph: nx.Graph,
+        hazard_name: str,
+    ) -> tuple[GeoDataFrame, pd.DataFrame]:
+        """
+        Identifies the locations that are flooded or isolated by a single hazard
+        (see `multi_link_isolated_locations`).
+        The `road_buffers` and the `edge_nodes` follow the order of the edges of the graph.
+
+        Returns:
+            tuple[GeoDataFrame, pd.DataFrame]: The impacted locations and their summary per category.
+        """
+
+        def _is_not_none(value):
+            return (
+                value is not None
+                and value is not pd.NA
+                and not pd.isna(value)
+                and not np.isnan(value)
+            )
+
+        # filter graph edges that are directly disrupted by the hazard(s), i.e. flooded
+        edges_data = [e[-1] for e in graph.edges.data()]
+        is_hazard_edge = np.array([hazard_name in e for e in edges_data], dtype=bool)
+        is_hz_direct = np.array(
+            [
+                (hazard_name in e)
+                and (
+                    _is_not_none(e[hazard_name])
+                    and (e[hazard_name] > float(analysis.threshold))
+                    & (("bridge" not in e) or ("bridge" in e and e["bridge"] != "yes"))
+                )
+                for e in edges_data
+            ],
+            dtype=bool,
+        )
+        is_hz_indirect = is_hazard_edge & ~is_hz_direct
+
+        # get isolated network - the edges outside the largest component,
+        # once the edges that are impacted by hazard directly are removed
+        is_isolated = MultiLinkIsolatedLocations.get_isolated_edges(
+            graph.number_of_nodes(), edge_nodes, is_hz_direct
+        )
+        network_hz_indirect = GeoDataFrame()
+        if is_isolated.any():
+            network_hz_indirect = road_buffers[is_isolated].copy()
+            network_hz_indirect[f"i_type_{hazard_name[:-3]}"] = "isolated"
+
+        # get flooded network - all edges but the ones that are impacted by hazard indirectly
+        network_hz_direct = GeoDataFrame()
+        if not is_hz_indirect.all():
+            network_hz_direct = road_buffers[~is_hz_indirect].copy()
+            network_hz_direct[f"i_type_{hazard_name[:-3]}"] = "flooded"
+
+        # get hazard roads (already buffered)
+        results_hz_roads = GeoDataFrame(
+            pd.concat([network_hz_direct, network_hz_indirect])
+        )
+        # Save the output
+        results_hz_roads.to_file(
+            output_path.joinpath(
+                analysis.analysis.config_value,
+                f"flooded_and_isolated_roads_{hazard_name}.gpkg",
+            )
+        )
+
+        # relate the locations to network disruption due to hazard by a spatial join
+        results_hz_roads.reset_index(inplace=True)
+        locations_hz = MultiLinkIsolatedLocations.intersect_locations(
+            locations, results_hz_roads
+        )
+
+        # Replace nan with 0 for the water depth columns
+        # TODO: this should always be done in hazard class
+        locations_hz[hazard_name] = locations_hz[hazard_name].fillna(0)
+
+        # TODO: Put in analyses.ini file a variable to set the threshold for locations that are not isolated when they are flooded.
+        # Extract the flood depth of the locations
+        # intersect = intersect.loc[intersect[hazard_name] > analysis.threshold_locations]
+
+        # get location stats
+        df_aggregation = MultiLinkIsolatedLocations._summarize_locations(
+            locations_hz,
+            cat_col=analysis.category_field_name,
+            hazard_id=hazard_name[:-3],
+        )
+        return locations_hz, df_aggregation
+
     def multi_link_isolated_locations(
         self, graph: nx.Graph, analysis: AnalysisSectionLosses, crs=4326
     ) -> tuple[GeoDataFrame, pd.DataFrame]:
         """
         This function identifies locations that are flooded or isolated due to the disruption of the network caused by a hazard.
-        It iterates over multiple hazard scenarios, modifies the graph to represent direct and indirect impacts, and then
+        It iterates over multiple hazard scenarios, labels the edges of the network that are directly and indirectly impacted, and then
         spatially joins the impacted network with the location data to find out which locations are affected.
 
         Args:
@@ -150,15 +287,6 @@ class MultiLinkIsolatedLocations(AnalysisLossesProtocol):
             tuple (gpd.GeoDataFrame, pd.DataFrame): A tuple containing the location GeoDataFrame updated with hazard impacts,
                 and a DataFrame summarizing the impacts per location category.
         """
-
-        def _is_not_none(value):
-            return (
-                value is not None
-                and value is not pd.NA
-                and not pd.isna(value)
-                and not np.isnan(value)
-            )
-
         # Load the point shapefile with the locations of which the isolated locations should be identified.
         locations = read_feather(
             self.static_path.joinpath("output_graph", "locations_hazard.feather")
@@ -167,99 +295,34 @@ class MultiLinkIsolatedLocations(AnalysisLossesProtocol):
         # reproject the datasets to be able to make a buffer in meters
         nearest_utm = self.utm_crs(locations.total_bounds)
 
+        # The buffered roads and their connectivity are shared by all hazards.
+        network = (
+            self.get_network_with_edge_fid(graph)
+            .set_crs(crs=crs, allow_override=True)
+            .to_crs(crs=nearest_utm)
+        )
+        road_buffers = buffer_geometry(network, analysis.buffer_meters).to_crs(crs=crs)
+        node_index = {node: i for i, node in enumerate(graph.nodes)}
+        edge_nodes = np.array(
+            [(node_index[u], node_index[v]) for u, v in graph.edges()], dtype=int
+        ).reshape(-1, 2)
+
+        # The hazards are independent, so they can be calculated in parallel.
+        _hazard_results = HazardExecutor(graph, analysis.n_workers).map(
+            partial(
+                self._get_hazard_isolated_locations,
+                analysis,
+                locations,
+                road_buffers,
+                edge_nodes,
+                self.output_path,
+            ),
+            [self.hazard_names.get_name(hazard) for hazard in self.hazard_names.names],
+        )
+
         # create an empty list to append the df_aggregation to
         aggregation = pd.DataFrame()
-        for hazard in self.hazard_names.names:
-            # for each hazard event
-            hazard_name = self.hazard_names.get_name(hazard)
-
-            graph_hz_direct = copy.deepcopy(graph)
-            graph_hz_indirect = copy.deepcopy(graph)
-
-            # filter graph edges that are directly disrupted by the hazard(s), i.e. flooded
-            edges = [e for e in graph.edges.data(keys=True) if hazard_name in e[-1]]
-            edges_hz_direct = [
-                e
-                for e in edges
-                if (hazard_name in e[-1])
-                and (
-                    _is_not_none(e[-1][hazard_name])
-                    and (e[-1][hazard_name] > float(analysis.threshold))
-                    & (
-                        ("bridge" not in e[-1])
-                        or ("bridge" in e[-1] and e[-1]["bridge"] != "yes")
-                    )
-                )
-            ]
-            edges_hz_indirect = [e for e in edges if e not in edges_hz_direct]
-
-            # get indirect graph - remove the edges that are impacted by hazard directly
-            graph_hz_indirect.remove_edges_from(edges_hz_direct)
-            # get indirect graph without the largest component, i.e. isolated graph
-            self.remove_edges_from_largest_component(graph_hz_indirect)
-
-            # get direct graph - romove the edges that are impacted by hazard indirectly
-            graph_hz_direct.remove_edges_from(edges_hz_indirect)
-
-            # get isolated network
-            network_hz_indirect = GeoDataFrame()
-            if len(graph_hz_indirect.edges) > 0:
-                network_hz_indirect = self.get_network_with_edge_fid(graph_hz_indirect)
-                network_hz_indirect[f"i_type_{hazard_name[:-3]}"] = "isolated"
-                # reproject the datasets to be able to make a buffer in meters
-                network_hz_indirect = network_hz_indirect.set_crs(
-                    crs=crs, allow_override=True
-                )
-                network_hz_indirect.to_crs(crs=nearest_utm, inplace=True)
-
-            # get flooded network
-            network_hz_direct = GeoDataFrame()
-            if len(graph_hz_direct.edges) > 0:
-                network_hz_direct = self.get_network_with_edge_fid(graph_hz_direct)
-                network_hz_direct[f"i_type_{hazard_name[:-3]}"] = "flooded"
-                # reproject the datasets to be able to make a buffer in meters
-                network_hz_direct = network_hz_direct.set_crs(
-                    crs=crs, allow_override=True
-                )
-                network_hz_direct.to_crs(crs=nearest_utm, inplace=True)
-
-            # get hazard roads
-            # merge buffer and set original crs
-            results_hz_roads = GeoDataFrame(
-                pd.concat([network_hz_direct, network_hz_indirect])
-            )
-            results_hz_roads = buffer_geometry(
-                results_hz_roads, analysis.buffer_meters
-            ).to_crs(crs=crs)
-            # Save the output
-            results_hz_roads.to_file(
-                self.output_path.joinpath(
-                    analysis.analysis.config_value,
-                    f"flooded_and_isolated_roads_{hazard_name}.gpkg",
-                )
-            )
-
-            # relate the locations to network disruption due to hazard by spatial overlay
-            results_hz_roads.reset_index(inplace=True)
-            locations_hz = overlay(
-                locations, results_hz_roads, how="intersection", keep_geom_type=True
-            )
-
-            # Replace nan with 0 for the water depth columns
-            # TODO: this should always be done in hazard class
-            locations_hz[hazard_name] = locations_hz[hazard_name].fillna(0)
-
-            # TODO: Put in analyses.ini file a variable to set the threshold for locations that are not isolated when they are flooded.
-            # Extract the flood depth of the locations
-            # intersect = intersect.loc[intersect[hazard_name] > analysis.threshold_locations]
-
-            # get location stats
-            df_aggregation = self._summarize_locations(
-                locations_hz,
-                cat_col=analysis.category_field_name,
-                hazard_id=hazard_name[:-3],
-            )
-
+        for locations_hz, df_aggregation in _hazard_results:
             # add to exisiting results
             aggregation = pd.concat([aggregation, df_aggregation], axis=0)
 
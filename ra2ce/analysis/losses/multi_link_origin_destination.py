@@ -1,5 +1,7 @@
-import copy
+from collections import defaultdict
+from functools import partial
 from pathlib import Path
+from typing import Any, Callable, Hashable, Optional
 
 import networkx as nx
 import numpy as np
@@ -11,9 +13,11 @@ from ra2ce.analysis.analysis_config_data.analysis_config_data import (
 )
 from ra2ce.analysis.analysis_input_wrapper import AnalysisInputWrapper
 from ra2ce.analysis.losses.analysis_losses_protocol import AnalysisLossesProtocol
+from ra2ce.analysis.losses.hazard_executor import HazardExecutor
 from ra2ce.analysis.losses.optimal_route_origin_destination import (
     OptimalRouteOriginDestination,
 )
+from ra2ce.analysis.losses.origin_destination_pairs import OriginDestinationPairs
 from ra2ce.network.graph_files.graph_file import GraphFile
 from ra2ce.network.hazard.hazard_names import HazardNames
 from ra2ce.network.network_config_data.network_config_data import (
@@ -44,97 +48,136 @@ class MultiLinkOriginDestination(AnalysisLossesProtocol):
         self.origins_destinations = analysis_input.origins_destinations
         self._analysis_input = analysis_input
 
-    @staticmethod
-    def extract_od_nodes_from_graph(
-        graph: nx.MultiGraph,
-    ) -> list[tuple[str, str]]:
-        """
-        Extracts all Origin - Destination nodes from the graph, prevents from entries
-        with list of nodes for a node.
-
-        Args:
-            graph (nx.MultiGraph): Graph containing origin-destination nodes.
-
-        Returns:
-            list[tuple[str, str]]]: List containing tuples of origin - destination node combinations.
-        """
-        _od_nodes = []
-        for n, v in graph.nodes(data=True):
-            if "od_id" not in v:
-                continue
-            _o_node_list = list(map(lambda x: (n, x), v["od_id"].split(",")))
-            _od_nodes.extend(_o_node_list)
-        return _od_nodes
-
     def _get_origin_destination_pairs(
         self, graph: nx.MultiGraph
-    ) -> list[tuple[str, str], tuple[str, str]]:
+    ) -> OriginDestinationPairs:
         od_path = self.static_path.joinpath(
             "output_graph", "origin_destination_table.feather"
         )
         od = read_feather(od_path)
-        od_pairs = [
-            (a, b)
-            for a in od.loc[od["o_id"].notnull(), "o_id"]
-            for b in od.loc[od["d_id"].notnull(), "d_id"]
-        ]
-        all_nodes = self.extract_od_nodes_from_graph(graph)
-        od_nodes = []
-        for aa, bb in od_pairs:
-            # it is possible that there are multiple origins/destinations at the same 'entry-point' in the road
-            od_nodes.append(
-                (
-                    [
-                        (n, n_name)
-                        for n, n_name in all_nodes
-                        if (n_name == aa) | (aa in n_name)
-                    ][0],
-                    [
-                        (n, n_name)
-                        for n, n_name in all_nodes
-                        if (n_name == bb) | (bb in n_name)
-                    ][0],
-                )
-            )
-        return od_nodes
+        # it is possible that there are multiple origins/destinations at the same 'entry-point' in the road
+        return OriginDestinationPairs.from_graph(graph, od)
 
-    def multi_link_origin_destination(
+    def _get_undisrupted_routes(
         self, graph: nx.MultiGraph, analysis: AnalysisSectionLosses
-    ) -> GeoDataFrame:
-        """Calculates the connectivity between origins and destinations"""
+    ) -> tuple[OriginDestinationPairs, list[Optional[tuple[float, list[Any]]]]]:
         od_nodes = self._get_origin_destination_pairs(graph)
+        od_routes = OptimalRouteOriginDestination.get_shortest_routes(
+            graph, ((o[0], d[0]) for o, d in od_nodes), analysis.weighing.config_value
+        )
+        return od_nodes, od_routes
 
-        all_results = []
-        for hazard in self.hazard_names.names:
-            hazard_name = self.hazard_names.get_name(hazard)
-
-            graph_hz = copy.deepcopy(graph)
-
-            # Check if the o/d pairs are still connected while some links are disrupted by the hazard(s)
-            edges_remove = [
-                e for e in graph.edges.data(keys=True) if hazard_name in e[-1]
-            ]
-            edges_remove = [e for e in edges_remove if (e[-1][hazard_name] is not None)]
-            edges_remove = [
-                e
-                for e in edges_remove
-                if (e[-1][hazard_name] > float(analysis.threshold))
-                & ("bridge" not in e[-1])
-            ]
-            graph_hz.remove_edges_from(edges_remove)
+    @staticmethod
+    def _get_edge_route_index(
+        od_routes: list[Optional[tuple[float, list[Any]]]], is_directed: bool
+    ) -> dict[Hashable, list[int]]:
+        """
+        Gets the routes (by their index) that pass each pair of nodes.
+        For undirected graphs the pair is a frozenset, so it does not depend on the direction of the route.
+        """
+        _edge_routes = defaultdict(list)
+        for _route_id, _od_route in enumerate(od_routes):
+            if _od_route is None:
+                continue
+            _route_nodes = _od_route[1]
+            for _edge in zip(_route_nodes[0:], _route_nodes[1:]):
+                _edge_routes[_edge if is_directed else frozenset(_edge)].append(
+                    _route_id
+                )
+        return dict(_edge_routes)
 
-            # convert the networkx graph to igraph object to speed up the route finding algorithm
-            # igraph_hz = ig.Graph.from_networkx(igraph_hz)
+    @staticmethod
+    def _get_hazard_routes(
+        od_nodes: OriginDestinationPairs,
+        od_routes: list[Optional[tuple[float, list[Any]]]],
+        edge_routes: dict[Hashable, list[int]],
+        analysis: AnalysisSectionLosses,
+        graph: nx.MultiGraph,
+        hazard_name: str,
+    ) -> GeoDataFrame:
+        """
+        Finds the routes between the origin-destination pairs with the edges disrupted by a single hazard removed.
+        Only the routes passing a disrupted edge are searched again, the others remain optimal.
+        """
+        # Check if the o/d pairs are still connected while some links are disrupted by the hazard(s)
+        edges_remove = [e for e in graph.edges.data(keys=True) if hazard_name in e[-1]]
+        edges_remove = [e for e in edges_remove if (e[-1][hazard_name] is not None)]
+        edges_remove = [
+            e
+            for e in edges_remove
+            if (e[-1][hazard_name] > float(analysis.threshold))
+            & ("bridge" not in e[-1])
+        ]
 
-            # Find the routes
-            od_routes = OptimalRouteOriginDestination.find_route_ods(
-                graph_hz, od_nodes, analysis.weighing
+        # Find the routes that pass a disrupted edge (no other route can become shorter)
+        _is_directed = graph.is_directed()
+        _rerouted_ids = sorted(
+            set(
+                _route_id
+                for u, v, *_ in edges_remove
+                for _route_id in edge_routes.get(
+                    (u, v) if _is_directed else frozenset((u, v)), []
+                )
             )
-            od_routes["hazard"] = hazard_name
-            all_results.append(od_routes)
+        )
+        graph_hz = graph
+        if _rerouted_ids:
+            # the attribute values are shared, as they are not altered
+            graph_hz = graph.copy()
+            graph_hz.remove_edges_from(edges_remove)
+
+        hazard_routes = list(od_routes)
+        for _route_id, _od_route in zip(
+            _rerouted_ids,
+            OptimalRouteOriginDestination.get_shortest_routes(
+                graph_hz,
+                (
+                    (od_routes[_route_id][1][0], od_routes[_route_id][1][-1])
+                    for _route_id in _rerouted_ids
+                ),
+                analysis.weighing.config_value,
+            ),
+        ):
+            hazard_routes[_route_id] = _od_route
+
+        od_routes_hz = OptimalRouteOriginDestination.get_pref_routes(
+            graph_hz,
+            od_nodes,
+            hazard_routes,
+            analysis.weighing,
+            with_geometry=analysis.save_gpkg,
+        )
+        od_routes_hz["hazard"] = hazard_name
+        return od_routes_hz
+
+    def _get_hazards_routes(
+        self,
+        graph: nx.MultiGraph,
+        analysis: AnalysisSectionLosses,
+        od_nodes: OriginDestinationPairs,
+        od_routes: list[Optional[tuple[float, list[Any]]]],
+    ) -> GeoDataFrame:
+        # The hazards are independent, so they can be calculated in parallel.
+        all_results = HazardExecutor(graph, analysis.n_workers).map(
+            partial(
+                self._get_hazard_routes,
+                od_nodes,
+                od_routes,
+                self._get_edge_route_index(od_routes, graph.is_directed()),
+                analysis,
+            ),
+            [self.hazard_names.get_name(hazard) for hazard in self.hazard_names.names],
+        )
 
         return pd.concat(all_results, ignore_index=True)
 
+    def multi_link_origin_destination(
+        self, graph: nx.MultiGraph, analysis: AnalysisSectionLosses
+    ) -> GeoDataFrame:
+        """Calculates the connectivity between origins and destinations"""
+        od_nodes, od_routes = self._get_undisrupted_routes(graph, analysis)
+        return self._get_hazards_routes(graph, analysis, od_nodes, od_routes)
+
     def multi_link_origin_destination_impact(
         self, gdf: GeoDataFrame, gdf_ori: GeoDataFrame
     ) -> tuple[pd.DataFrame, GeoDataFrame]:
@@ -162,24 +205,27 @@ class MultiLinkOriginDestination(AnalysisLossesProtocol):
             - max_increase_pc, mean_increase_pc, median_increase_pc (%): same as above three, but as a percentage relative to no-hazard
         """
 
-        hazard_list = np.unique(gdf["hazard"])
+        hazard_list = np.sort(gdf["hazard"].unique())
 
         # calculate number of disconnected origin, destination, and origin-destination pair
         # TODO: there seems to be an issue in calculating origin_count and destination_count where origin and destination nodes are the same, e.g., A_25,B_1
         gdf["OD"] = gdf["origin"] + gdf["destination"]
         gdf_ori["OD"] = gdf_ori["origin"] + gdf_ori["destination"]
-        # origin
-        gdf_ori["origin_count"] = gdf_ori["origin"].apply(lambda x: len(x.split(",")))
-        init_origins = gdf_ori.groupby("origin")["origin_count"].sum()
-        del gdf_ori["origin_count"]
-        # destination
-        gdf_ori["destination_count"] = gdf_ori["destination"].apply(
-            lambda x: len(x.split(","))
-        )
-        init_destinations = gdf_ori.groupby("destination")["destination_count"].sum()
-        del gdf_ori["destination_count"]
-        # od pairs
+
+        def _count_per_node(df: pd.DataFrame, col: str, by: list[str]) -> pd.Series:
+            # each node is counted once per od pair for each of its (comma separated) ids
+            _nr_pairs = df.groupby(by)[col].size()
+            _nr_ids = _nr_pairs.index.get_level_values(col).str.count(",") + 1
+            return (_nr_pairs * _nr_ids).rename(f"{col}_count")
+
+        init_origins = _count_per_node(gdf_ori, "origin", ["origin"])
+        init_destinations = _count_per_node(gdf_ori, "destination", ["destination"])
         init_od_pairs = init_origins * init_destinations
+        # the remaining counts of all hazards at once
+        hazard_origins = _count_per_node(gdf, "origin", ["hazard", "origin"])
+        hazard_destinations = _count_per_node(
+            gdf, "destination", ["hazard", "destination"]
+        )
         abs_od_disconnected = []
         share_od_disconnected = []
         abs_origin_disconnected = []
@@ -187,22 +233,12 @@ class MultiLinkOriginDestination(AnalysisLossesProtocol):
         abs_destination_disconnected = []
         share_destination_disconnected = []
         for hz in hazard_list:
-            gdf_ = gdf.loc[gdf["hazard"] == hz]
-
-            gdf_["origin_count"] = gdf_["origin"].apply(lambda x: len(x.split(",")))
-            remaining_origins = gdf_.groupby("origin")["origin_count"].sum()
-            del gdf_["origin_count"]
+            remaining_origins = hazard_origins.loc[hz]
             diff_origins = init_origins - remaining_origins
             abs_origin_disconnected.append(diff_origins)
             share_origin_disconnected.append(100 * diff_origins / init_origins)
 
-            gdf_["destination_count"] = gdf_["destination"].apply(
-                lambda x: len(x.split(","))
-            )
-            remaining_destinations = gdf_.groupby("destination")[
-                "destination_count"
-            ].sum()
-            del gdf_["destination_count"]
+            remaining_destinations = hazard_destinations.loc[hz]
             diff_destinations = init_destinations - remaining_destinations
             abs_destination_disconnected.append(diff_destinations)
             share_destination_disconnected.append(
@@ -215,35 +251,21 @@ class MultiLinkOriginDestination(AnalysisLossesProtocol):
             share_od_disconnected.append(100 * diff_od_pairs / init_od_pairs)
 
         # calculate change in travel time/distance
-        max_increase_abs = []
-        min_increase_abs = []
-        mean_increase_abs = []
-        median_increase_abs = []
-        max_increase_pc = []
-        min_increase_pc = []
-        mean_increase_pc = []
-        median_increase_pc = []
-        for hz in hazard_list:
-            gdf_ = gdf.loc[gdf["hazard"] == hz][["OD", "length"]]
-            gdf_.columns = ["OD", "length_" + hz]
-            gdf_ori = gdf_ori.merge(gdf_, how="left", on="OD")
-            gdf_ori.drop_duplicates(subset="OD", inplace=True)
-            gdf_ori["diff_length_" + hz] = gdf_ori["length_" + hz] - gdf_ori["length"]
-            gdf_ori["diff_length_" + hz + "_pc"] = (
-                100 * gdf_ori["diff_length_" + hz] / gdf_ori["length"]
-            )
-
-            max_increase_abs.append(np.nanmax(gdf_ori["diff_length_" + hz]))
-            min_increase_abs.append(np.nanmin(gdf_ori["diff_length_" + hz]))
-            mean_increase_abs.append(np.nanmean(gdf_ori["diff_length_" + hz]))
-            median_increase_abs.append(np.nanmedian(gdf_ori["diff_length_" + hz]))
-
-            max_increase_pc.append(np.nanmax(gdf_ori["diff_length_" + hz + "_pc"]))
-            min_increase_pc.append(np.nanmin(gdf_ori["diff_length_" + hz + "_pc"]))
-            mean_increase_pc.append(np.nanmean(gdf_ori["diff_length_" + hz + "_pc"]))
-            median_increase_pc.append(
-                np.nanmedian(gdf_ori["diff_length_" + hz + "_pc"])
-            )
+        # the length of each od pair (rows) with each hazard (columns)
+        gdf_ori = gdf_ori.drop_duplicates(subset="OD").reset_index(drop=True)
+        hazard_lengths = (
+            gdf.drop_duplicates(subset=["hazard", "OD"])
+            .pivot(index="OD", columns="hazard", values="length")
+            .reindex(index=gdf_ori["OD"], columns=hazard_list)
+            .to_numpy(dtype=float)
+        )
+        init_lengths = gdf_ori["length"].to_numpy(dtype=float)[:, None]
+        diff_lengths = hazard_lengths - init_lengths
+        diff_lengths_pc = 100 * diff_lengths / init_lengths
+        for i, hz in enumerate(hazard_list):
+            gdf_ori["length_" + hz] = hazard_lengths[:, i]
+            gdf_ori["diff_length_" + hz] = diff_lengths[:, i]
+            gdf_ori["diff_length_" + hz + "_pc"] = diff_lengths_pc[:, i]
 
         diff_df = pd.DataFrame()
         diff_df["hazard"] = hazard_list
@@ -255,14 +277,20 @@ class MultiLinkOriginDestination(AnalysisLossesProtocol):
         diff_df["destination_disconnected_abs"] = abs_destination_disconnected
         diff_df["destination_disconnected_pc (%)"] = share_destination_disconnected
 
-        diff_df["max_increase_abs"] = max_increase_abs
-        diff_df["min_increase_abs"] = min_increase_abs
-        diff_df["mean_increase_abs"] = mean_increase_abs
-        diff_df["median_increase_abs"] = median_increase_abs
-        diff_df["max_increase_pc (%)"] = max_increase_pc
-        diff_df["min_increase_pc (%)"] = min_increase_pc
-        diff_df["mean_increase_pc (%)"] = mean_increase_pc
-        diff_df["median_increase_pc (%)"] = median_increase_pc
+        def _get_stat(func: Callable, values: np.ndarray) -> np.ndarray:
+            # the statistics of the hazards are undefined (nan) without od pairs
+            if len(values) == 0:
+                return np.full(values.shape[1], np.nan)
+            return func(values, axis=0)
+
+        diff_df["max_increase_abs"] = _get_stat(np.nanmax, diff_lengths)
+        diff_df["min_increase_abs"] = _get_stat(np.nanmin, diff_lengths)
+        diff_df["mean_increase_abs"] = _get_stat(np.nanmean, diff_lengths)
+        diff_df["median_increase_abs"] = _get_stat(np.nanmedian, diff_lengths)
+        diff_df["max_increase_pc (%)"] = _get_stat(np.nanmax, diff_lengths_pc)
+        diff_df["min_increase_pc (%)"] = _get_stat(np.nanmin, diff_lengths_pc)
+        diff_df["mean_increase_pc (%)"] = _get_stat(np.nanmean, diff_lengths_pc)
+        diff_df["median_increase_pc (%)"] = _get_stat(np.nanmedian, diff_lengths_pc)
 
         return diff_df, gdf_ori
 
@@ -288,8 +316,6 @@ class MultiLinkOriginDestination(AnalysisLossesProtocol):
             - hazardName_pc_disconnect: average number of OD pairs disconnected (relative to initial number of OD pairs, for each origin node and for each region)
         """
 
-        gdf_ori_ = gdf_ori.copy()
-
         # read origin points
         origin_fn = Path(self.static_path).joinpath(
             "output_graph", "origin_destination_table.gpkg"
@@ -299,47 +325,40 @@ class MultiLinkOriginDestination(AnalysisLossesProtocol):
         origin = origin[index]
         origin.reset_index(inplace=True, drop=True)
 
-        # record where each origin point resides
-        origin_mapping = {}
-        for o in np.unique(origin["o_id"]):
-            r = origin.loc[origin["o_id"] == o, "region"].values[0]
-            origin_mapping.update({o: r})
-
-        # record impact to each region
-        origin_impact_master = pd.DataFrame()
-        for r in np.unique(origin["region"]):
-            origin_points = list(origin.loc[origin["region"] == r, "o_id"].values)
-            for o in origin_points:
-                origin_impact_tosave = pd.DataFrame()
-                origin_impact_tosave.loc[0, "o_id"] = o
-                origin_impact_tosave.loc[0, "region"] = r
-
-                origin_impact = gdf_ori_.loc[gdf_ori_["origin"].str.contains(o)]
-
-                # initial condition
-                origin_impact_tosave.loc[0, "init_length"] = np.mean(
-                    origin_impact["length"]
-                )
-                origin_impact_tosave.loc[0, "init_destination"] = len(
-                    np.unique(origin_impact["destination"])
-                )
-
-                # impact of each hazard
-                for col in origin_impact.columns:
-                    if "_pc" in col:
-                        delta = np.nanmean(origin_impact[col])
-                        if delta < 0:
-                            delta = 0
-                        origin_impact_tosave.loc[0, col[12:] + "_increase"] = delta
-
-                        disconnected = origin_impact[col].isna().sum()
-                        origin_impact_tosave.loc[0, col[12:] + "_disconnect"] = (
-                            100
-                            * disconnected
-                            / origin_impact_tosave["init_destination"].values[0]
-                        )
+        # relate each od pair to each of the (comma separated) origins of its origin node
+        pc_cols = [col for col in gdf_ori.columns if "_pc" in col]
+        od_origins = gdf_ori[["origin", "destination", "length"] + pc_cols].assign(
+            o_id=gdf_ori["origin"].str.split(",")
+        )
+        od_origins = od_origins.explode("o_id")
+        od_per_origin = od_origins.groupby("o_id")
+
+        # initial condition
+        origin_stats = pd.DataFrame(
+            {
+                "init_length": od_per_origin["length"].mean(),
+                "init_destination": od_per_origin["destination"].nunique(),
+            }
+        )
+        # impact of each hazard
+        increase = od_per_origin[pc_cols].mean().clip(lower=0)
+        disconnected = od_origins[pc_cols].isna().groupby(od_origins["o_id"]).sum()
+        for col in pc_cols:
+            origin_stats[col[12:] + "_increase"] = increase[col]
+            origin_stats[col[12:] + "_disconnect"] = (
+                100 * disconnected[col] / origin_stats["init_destination"]
+            )
 
-                origin_impact_master = origin_impact_master.append(origin_impact_tosave)
+        # record impact to each origin, per region
+        origin_impact_master = (
+            origin[["o_id", "region"]]
+            .sort_values("region", kind="stable")
+            .join(origin_stats, on="o_id")
+            .reset_index(drop=True)
+        )
+        origin_impact_master["init_destination"] = (
+            origin_impact_master["init_destination"].fillna(0).astype(float)
+        )
 
         region_impact_master = origin_impact_master[origin_impact_master.columns[1:]]
         region_impact_master = region_impact_master.groupby(by="region").mean()
@@ -348,13 +367,23 @@ class MultiLinkOriginDestination(AnalysisLossesProtocol):
 
     def execute(self) -> GeoDataFrame:
         _output_path = self.output_path.joinpath(self.analysis.analysis.config_value)
-        gdf = self.multi_link_origin_destination(
-            self.graph_file_hazard.get_graph(), self.analysis
-        )
+        _graph = self.graph_file_hazard.get_graph()
+
+        # The routes without disruption are searched once, for both the disrupted and the undisrupted results.
+        od_nodes, od_routes = self._get_undisrupted_routes(_graph, self.analysis)
+        gdf = self._get_hazards_routes(_graph, self.analysis, od_nodes, od_routes)
+
         self._analysis_input.graph_file = self._analysis_input.graph_file_hazard
-        gdf_not_disrupted = OptimalRouteOriginDestination(
-            self._analysis_input
-        ).execute()
+        gdf_not_disrupted = OptimalRouteOriginDestination.get_pref_routes(
+            _graph,
+            od_nodes,
+            od_routes,
+            self.analysis.weighing,
+            with_geometry=self.analysis.save_gpkg,
+        )
+        OptimalRouteOriginDestination(self._analysis_input).save_link_traffic(
+            gdf_not_disrupted
+        )
         (
             disruption_impact_df,
             gdf_ori,
@@ -1,5 +1,7 @@
-import copy
+import logging
+from functools import partial
 from pathlib import Path
+from typing import Any
 
 import geopandas as gpd
 import networkx as nx
@@ -10,9 +12,16 @@ import pandas as pd
 from ra2ce.analysis.analysis_config_data.analysis_config_data import (
     AnalysisSectionLosses,
 )
+from ra2ce.analysis.analysis_config_data.enums.routing_engine_enum import (
+    RoutingEngineEnum,
+)
 from ra2ce.analysis.analysis_config_data.enums.weighing_enum import WeighingEnum
 from ra2ce.analysis.analysis_input_wrapper import AnalysisInputWrapper
+from ra2ce.analysis.analysis_result_accumulator import AnalysisResultAccumulator
 from ra2ce.analysis.losses.analysis_losses_protocol import AnalysisLossesProtocol
+from ra2ce.analysis.losses.hazard_executor import HazardExecutor
+from ra2ce.analysis.losses.routing_engine.connectivity_utils import get_components
+from ra2ce.analysis.losses.routing_engine.csr_graph import CsrGraph
 from ra2ce.analysis.losses.weighing_analysis.weighing_analysis_factory import (
     WeighingAnalysisFactory,
 )
@@ -58,32 +67,88 @@ class MultiLinkRedundancy(AnalysisLossesProtocol):
         gdf_graph[WeighingEnum.TIME.config_value] = df_calculated[
             WeighingEnum.TIME.config_value
         ]
-        for i, row in gdf_graph.iterrows():
-            row_avgspeed = row.get("avgspeed", None)
-            row_length = row.get("length", None)
-            if (
-                pd.isna(row[WeighingEnum.TIME.config_value])
-                and row_avgspeed
-                and row_length
-            ):
-                gdf_graph.at[i, WeighingEnum.TIME.config_value] = (
-                    row_length * 1e-3 / row_avgspeed
-                )
-            else:
-                gdf_graph.at[i, WeighingEnum.TIME.config_value] = row.get(
-                    WeighingEnum.TIME.config_value, None
-                )
+        if "avgspeed" not in gdf_graph.columns or "length" not in gdf_graph.columns:
+            return df_calculated, gdf_graph
+
+        # Fill the missing times from the length and average speed (when both are known and non-zero).
+        _avgspeed = pd.to_numeric(gdf_graph["avgspeed"], errors="coerce")
+        _length = pd.to_numeric(gdf_graph["length"], errors="coerce")
+        _fill = (
+            gdf_graph[WeighingEnum.TIME.config_value].isna()
+            & (_avgspeed != 0)
+            & (_length != 0)
+        )
+        gdf_graph.loc[_fill, WeighingEnum.TIME.config_value] = (
+            _length[_fill] * 1e-3 / _avgspeed[_fill]
+        )
         return df_calculated, gdf_graph
 
-    def execute(self) -> gpd.GeoDataFrame:
-        """Calculates the multi-link redundancy of a NetworkX graph.
+    @staticmethod
+    def _get_alternative_routes(
+        graph: nx.MultiGraph,
+        edges: list[tuple[Any, Any]],
+        initial_limits: list[float],
+        analysis: AnalysisSectionLosses,
+    ) -> list[tuple[float, list[Any]]]:
+        """
+        Gets the alternative route between the end nodes of each (disrupted) edge
+        with the configured routing engine. All disrupted edges are unavailable at once,
+        so the CSR engine (also used for `replacement_paths`, which handles a single disrupted edge)
+        searches the routes of all edges sharing an end node with a single search.
+        Otherwise each route is searched with `nx.single_source_dijkstra`.
 
-        The function removes all links of a variable that have a minimum value
-        of min_threshold. For each link it calculates the alternative path, if
-        any available. This function only removes one group at the time and saves the data from removing that group.
+        Args:
+            graph (nx.MultiGraph): Graph without the disrupted edges.
+            edges (list[tuple[Any, Any]]): End nodes (u, v) of the disrupted edges.
+            initial_limits (list[float]): Initial distance limit of each route (only used by the CSR engine).
+            analysis (AnalysisSectionLosses): Configuration of the analysis.
 
         Returns:
-            aggregated_results (GeoDataFrame): The results of the analysis aggregated into a table.
+            list[tuple[float, list[Any]]]: Value and nodes of each route (`[]` nodes when unreachable).
+        """
+        if analysis.routing_engine in [
+            RoutingEngineEnum.CSR,
+            RoutingEngineEnum.REPLACEMENT_PATHS,
+        ]:
+            return CsrGraph.from_graph(
+                graph, analysis.weighing.config_value
+            ).get_routes(
+                edges,
+                initial_limits=initial_limits,
+                symmetric=not graph.is_directed(),
+            )
+
+        _routes = []
+        for u, v in edges:
+            try:
+                _routes.append(
+                    nx.single_source_dijkstra(
+                        graph, u, v, weight=analysis.weighing.config_value
+                    )
+                )
+            except nx.NetworkXNoPath:
+                _routes.append((np.inf, []))
+        return _routes
+
+    @staticmethod
+    def _get_hazard_results(
+        analysis: AnalysisSectionLosses,
+        has_rfid: bool,
+        graph: nx.MultiGraph,
+        hazard_name: str,
+    ) -> pd.DataFrame:
+        """
+        Calculates the alternative routes of the edges disrupted by a single hazard.
+        The graph is not altered, so it can be shared by all hazards.
+
+        Args:
+            analysis (AnalysisSectionLosses): Configuration of the analysis.
+            has_rfid (bool): Whether the edges have an `rfid` to identify them.
+            graph (nx.MultiGraph): Graph with the hazard data.
+            hazard_name (str): Name of the hazard (in the graph).
+
+        Returns:
+            pd.DataFrame: Results of the disrupted edges.
         """
 
         def _is_not_none(value):
@@ -94,97 +159,145 @@ class MultiLinkRedundancy(AnalysisLossesProtocol):
                 and not np.isnan(value)
             )
 
-        results = []
-        master_graph = copy.deepcopy(self.graph_file_hazard.get_graph())
-        for hazard in self.hazard_names.names:
-            hazard_name = self.hazard_names.get_name(hazard)
-
-            _graph = copy.deepcopy(master_graph)
-            # Create a geodataframe from the full graph
-            gdf = osmnx.graph_to_gdfs(master_graph, nodes=False)
-            if "rfid" in gdf:
-                gdf["rfid"] = gdf["rfid"].astype(str)
-
-            # Create the edgelist that consist of edges that should be removed
-            edges_remove = []
-            for e in _graph.edges.data(keys=True):
-                if (hazard_name in e[-1]) and (
+        # Create the edgelist that consist of edges that should be removed
+        edges_remove = []
+        for e in graph.edges.data(keys=True):
+            if (hazard_name in e[-1]) and (
+                ("bridge" not in e[-1])
+                or ("bridge" in e[-1] and e[-1]["bridge"] != "yes")
+            ):
+                edges_remove.append(e)
+        edges_remove = [e for e in edges_remove if (e[-1][hazard_name] is not None)]
+        edges_remove = [
+            e
+            for e in edges_remove
+            if (hazard_name in e[-1])
+            and (
+                _is_not_none(e[-1][hazard_name])
+                and (e[-1][hazard_name] > float(analysis.threshold))
+                and (
                     ("bridge" not in e[-1])
                     or ("bridge" in e[-1] and e[-1]["bridge"] != "yes")
-                ):
-                    edges_remove.append(e)
-            edges_remove = [e for e in edges_remove if (e[-1][hazard_name] is not None)]
-            edges_remove = [
-                e
-                for e in edges_remove
-                if (hazard_name in e[-1])
-                and (
-                    _is_not_none(e[-1][hazard_name])
-                    and (e[-1][hazard_name] > float(self.analysis.threshold))
-                    and (
-                        ("bridge" not in e[-1])
-                        or ("bridge" in e[-1] and e[-1]["bridge"] != "yes")
-                    )
                 )
-            ]
+            )
+        ]
 
-            _graph.remove_edges_from(edges_remove)
+        # View of the graph without the disrupted edges.
+        _graph = nx.restricted_view(
+            graph, [], [(u, v, k) for u, v, k, _ in edges_remove]
+        )
 
-            columns = [
-                "u",
-                "v",
-                f"alt_{self.analysis.weighing.config_value}",
-                "alt_nodes",
-                f"diff_{self.analysis.weighing.config_value}",
-                "connected",
-            ]
+        # End nodes in different components of the disrupted graph have no alternative route
+        _components = get_components(_graph)
+        _n_searches_avoided = sum(
+            _components[e[0]] != _components[e[1]] for e in edges_remove
+        )
+        logging.info(
+            "%s of %s disrupted edges for %s have no alternative route, their detour search is skipped.",
+            _n_searches_avoided,
+            len(edges_remove),
+            hazard_name,
+        )
 
-            if "rfid" in gdf:
-                columns.insert(2, "rfid")
+        columns = [
+            "u",
+            "v",
+            f"alt_{analysis.weighing.config_value}",
+            "alt_nodes",
+            f"diff_{analysis.weighing.config_value}",
+            "connected",
+        ]
 
-            df_calculated = pd.DataFrame(columns=columns)
-            _weighing_analyser = WeighingAnalysisFactory.get_analysis(
-                self.analysis.weighing
-            )
+        if has_rfid:
+            columns.insert(2, "rfid")
+
+        columns.append(analysis.weighing.config_value)
+        _results = AnalysisResultAccumulator(columns)
+        _weighing_analyser = WeighingAnalysisFactory.get_analysis(analysis.weighing)
 
-            for edges in edges_remove:
-                u, v, _, _weighing_analyser.edge_data = edges
-                _current_value = _weighing_analyser.get_current_value()
-
-                _alt_value, _alt_nodes, _connected, _diff = np.nan, np.nan, 0, np.nan
-                if nx.has_path(_graph, u, v):
-                    [_alt_value, _alt_nodes] = nx.single_source_dijkstra(
-                        _graph,
-                        u,
-                        v,
-                        weight=self.analysis.weighing.config_value,
+        # The weighing analyser may add missing values, which must not alter the shared graph.
+        _current_values = []
+        for _, _, _, _edge_data in edges_remove:
+            _weighing_analyser.edge_data = dict(_edge_data)
+            _current_values.append(_weighing_analyser.get_current_value())
+
+        # Search the alternative routes of all edges with a possible detour.
+        _searched_edges = [
+            (u, v) for u, v, _, _ in edges_remove if _components[u] == _components[v]
+        ]
+        _found_routes = iter(
+            MultiLinkRedundancy._get_alternative_routes(
+                _graph,
+                _searched_edges,
+                [
+                    2 * _current_value
+                    for (u, v, _, _), _current_value in zip(
+                        edges_remove, _current_values
                     )
-                    _connected = 1
+                    if _components[u] == _components[v]
+                ],
+                analysis,
+            )
+        )
 
+        for (u, v, _, _edge_data), _current_value in zip(edges_remove, _current_values):
+            _alt_value, _alt_nodes, _connected, _diff = np.nan, np.nan, 0, np.nan
+            if _components[u] == _components[v]:
+                _route_value, _route_nodes = next(_found_routes)
+                if _route_nodes:
+                    _alt_value, _alt_nodes = _route_value, _route_nodes
+                    _connected = 1
                     _diff = round(_alt_value - _current_value, 3)
 
-                data = {
-                    "u": u,
-                    "v": v,
-                    self.analysis.weighing.config_value: _current_value,
-                    f"alt_{self.analysis.weighing.config_value}": _alt_value,
-                    "alt_nodes": [_alt_nodes],
-                    f"diff_{self.analysis.weighing.config_value}": _diff,
-                    "connected": _connected,
-                }
-
-                if "rfid" in gdf:
-                    data["rfid"] = [str(_weighing_analyser.edge_data["rfid"])]
-
-                df_calculated = pd.concat(
-                    [df_calculated, pd.DataFrame(data)], ignore_index=True
-                )
+            data = {
+                "u": u,
+                "v": v,
+                analysis.weighing.config_value: _current_value,
+                f"alt_{analysis.weighing.config_value}": _alt_value,
+                "alt_nodes": _alt_nodes,
+                f"diff_{analysis.weighing.config_value}": _diff,
+                "connected": _connected,
+            }
 
-            df_calculated[f"alt_{self.analysis.weighing.config_value}"] = pd.to_numeric(
-                df_calculated[f"alt_{self.analysis.weighing.config_value}"],
-                errors="coerce",
-            )
+            if has_rfid:
+                data["rfid"] = str(_edge_data["rfid"])
 
+            _results.add_row(data)
+
+        df_calculated = _results.to_dataframe()
+        df_calculated[f"alt_{analysis.weighing.config_value}"] = pd.to_numeric(
+            df_calculated[f"alt_{analysis.weighing.config_value}"],
+            errors="coerce",
+        )
+        return df_calculated
+
+    def execute(self) -> gpd.GeoDataFrame:
+        """Calculates the multi-link redundancy of a NetworkX graph.
+
+        The function removes all links of a variable that have a minimum value
+        of min_threshold. For each link it calculates the alternative path, if
+        any available. This function only removes one group at the time and saves the data from removing that group.
+
+        Returns:
+            aggregated_results (GeoDataFrame): The results of the analysis aggregated into a table.
+        """
+        results = []
+        # The graph is shared (not copied) by all hazards, it is only read.
+        master_graph = self.graph_file_hazard.get_graph()
+        # Create a geodataframe from the full graph
+        master_gdf = osmnx.graph_to_gdfs(master_graph, nodes=False)
+        if "rfid" in master_gdf:
+            master_gdf["rfid"] = master_gdf["rfid"].astype(str)
+
+        _hazard_names = [
+            self.hazard_names.get_name(hazard) for hazard in self.hazard_names.names
+        ]
+        _hazard_results = HazardExecutor(master_graph, self.analysis.n_workers).map(
+            partial(self._get_hazard_results, self.analysis, "rfid" in master_gdf),
+            _hazard_names,
+        )
+        for hazard_name, df_calculated in zip(_hazard_names, _hazard_results):
+            gdf = master_gdf.copy(deep=False)
             df_calculated, gdf = self._update_time(df_calculated, gdf)
 
             # Merge the dataframes
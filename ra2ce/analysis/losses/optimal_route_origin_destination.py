@@ -1,9 +1,15 @@
+import logging
+from itertools import groupby
+from operator import itemgetter
 from pathlib import Path
+from typing import Any, Iterable, Optional
 
 import networkx as nx
 import pandas as pd
+import shapely
 from geopandas import GeoDataFrame, read_feather
 from shapely.geometry import LineString, MultiLineString
+from shapely.geometry.base import BaseGeometry
 from tqdm import tqdm
 
 from ra2ce.analysis.analysis_config_data.analysis_config_data import (
@@ -12,6 +18,7 @@ from ra2ce.analysis.analysis_config_data.analysis_config_data import (
 from ra2ce.analysis.analysis_config_data.enums.weighing_enum import WeighingEnum
 from ra2ce.analysis.analysis_input_wrapper import AnalysisInputWrapper
 from ra2ce.analysis.losses.analysis_losses_protocol import AnalysisLossesProtocol
+from ra2ce.analysis.losses.origin_destination_pairs import OriginDestinationPairs
 from ra2ce.analysis.losses.traffic_analysis.traffic_analysis_factory import (
     TrafficAnalysisFactory,
 )
@@ -65,12 +72,125 @@ class OptimalRouteOriginDestination(AnalysisLossesProtocol):
             _od_nodes.extend(_o_node_list)
         return _od_nodes
 
+    @staticmethod
+    def get_shortest_routes(
+        graph: nx.MultiGraph, node_pairs: Iterable[tuple[Any, Any]], weight: str
+    ) -> list[Optional[tuple[float, list[Any]]]]:
+        """
+        Gets the shortest route between each pair of (origin, destination) nodes.
+        Instead of a search per pair, a single search is done per run of consecutive pairs with the same origin node,
+        which yields the routes to all its destinations. The pairs are read lazily, so only the pairs of a single run are kept;
+        pairs of an origin node that are not consecutive are searched again.
+        The search is always done from the origin, so the same routes are found as with `nx.single_source_dijkstra` from the origin to the destination,
+        also when several routes are equally short.
+
+        Args:
+            graph (nx.MultiGraph): Graph to route on.
+            node_pairs (Iterable[tuple[Any, Any]]): Pairs of (origin, destination) nodes, preferably grouped by origin node.
+            weight (str): Edge attribute used as weight.
+
+        Returns:
+            list[Optional[tuple[float, list[Any]]]]: Distance and nodes of the route of each pair, None when the pair is not connected.
+        """
+        _routes = []
+        for _source, _pairs in tqdm(
+            groupby(node_pairs, key=itemgetter(0)), desc="Finding optimal routes."
+        ):
+            # the first predecessor of a node is the one on its (dijkstra) shortest path
+            _predecessors, _distances = nx.dijkstra_predecessor_and_distance(
+                graph, _source, weight=weight
+            )
+            for _, _target in _pairs:
+                if _target not in _distances:
+                    _routes.append(None)
+                    continue
+                _path = [_target]
+                while _path[-1] != _source:
+                    _path.append(_predecessors[_path[-1]][0])
+                _routes.append((_distances[_target], _path[::-1]))
+        return _routes
+
+    @staticmethod
+    def get_route_geometry(
+        graph: nx.MultiGraph, route_nodes: list[Any], route_edges: list[dict]
+    ) -> BaseGeometry:
+        """
+        Gets the geometry of a route as the union of the geometries of its edges,
+        or of the line between its nodes for edges without geometry.
+
+        Args:
+            graph (nx.MultiGraph): Graph the route is found on.
+            route_nodes (list[Any]): Nodes of the route.
+            route_edges (list[dict]): Data of the edges between the nodes of the route.
+
+        Returns:
+            BaseGeometry: Geometry of the route.
+        """
+        _edge_geometries = [
+            (
+                _edge["geometry"]
+                if "geometry" in _edge
+                else LineString(
+                    [graph.nodes[u]["geometry"], graph.nodes[v]["geometry"]]
+                )
+            )
+            for u, v, _edge in zip(route_nodes[0:], route_nodes[1:], route_edges)
+        ]
+        if not _edge_geometries:
+            return MultiLineString([])
+        # a single union of all edges, instead of adding the edges one by one
+        return shapely.union_all(_edge_geometries)
+
     @staticmethod
     def find_route_ods(
         graph: nx.MultiGraph,
-        od_nodes: list[tuple[tuple[str, str], tuple[str, str]]],
+        od_nodes: Iterable[tuple[tuple[str, str], tuple[str, str]]],
+        weighing: WeighingEnum,
+        with_geometry: bool = True,
+    ) -> GeoDataFrame:
+        """
+        Finds the optimal route between each origin-destination pair.
+
+        Args:
+            graph (nx.MultiGraph): Graph to route on.
+            od_nodes (Iterable[tuple[tuple[str, str], tuple[str, str]]]): Origin-destination pairs, as ((node, origin), (node, destination)).
+            weighing (WeighingEnum): Weighing used as edge weight.
+            with_geometry (bool, optional): Whether to build the geometry of the routes,
+                which is only needed to save them as geopackage. Defaults to True.
+
+        Returns:
+            GeoDataFrame: The optimal routes (without geometry when not requested).
+        """
+        # a single search per origin (or destination) node finds the routes of all its pairs
+        od_routes = OptimalRouteOriginDestination.get_shortest_routes(
+            graph, ((o[0], d[0]) for o, d in od_nodes), weighing.config_value
+        )
+        return OptimalRouteOriginDestination.get_pref_routes(
+            graph, od_nodes, od_routes, weighing, with_geometry
+        )
+
+    @staticmethod
+    def get_pref_routes(
+        graph: nx.MultiGraph,
+        od_nodes: Iterable[tuple[tuple[str, str], tuple[str, str]]],
+        od_routes: list[Optional[tuple[float, list[Any]]]],
         weighing: WeighingEnum,
+        with_geometry: bool = True,
     ) -> GeoDataFrame:
+        """
+        Collects the given routes of the origin-destination pairs (see `get_shortest_routes`).
+
+        Args:
+            graph (nx.MultiGraph): Graph the routes are found on.
+            od_nodes (Iterable[tuple[tuple[str, str], tuple[str, str]]]): Origin-destination pairs, as ((node, origin), (node, destination)).
+            od_routes (list[Optional[tuple[float, list[Any]]]]): Distance and nodes of the route of each pair, None when the pair is not connected.
+            weighing (WeighingEnum): Weighing used as edge weight.
+            with_geometry (bool, optional): Whether to build the geometry of the routes,
+                which is only needed to save them as geopackage. Defaults to True.
+
+        Returns:
+            GeoDataFrame: The optimal routes (without geometry when not requested).
+        """
         # create the routes between all OD pairs
         (
             o_node_list,
@@ -82,46 +202,34 @@ class OptimalRouteOriginDestination(AnalysisLossesProtocol):
             match_ids_list,
             geometries_list,
         ) = ([], [], [], [], [], [], [], [])
-        for o, d in tqdm(od_nodes, desc="Finding optimal routes."):
-            if nx.has_path(graph, o[0], d[0]):
-                # calculate the length of the preferred route and preferred route nodes
-                [pref_route, pref_nodes] = nx.single_source_dijkstra(
-                    graph, o[0], d[0], weight=weighing.config_value
-                )
+        for (o, d), od_route in zip(od_nodes, od_routes):
+            if od_route is not None:
+                # the length of the preferred route and preferred route nodes
+                [pref_route, pref_nodes] = od_route
 
-                # found out which edges belong to the preferred path
-                edgesinpath = list(zip(pref_nodes[0:], pref_nodes[1:]))
-
-                pref_edges = []
-                match_list = []
-                for u, v in edgesinpath:
-                    # get edge with the lowest weighing if there are multiple edges that connect u and v
-                    _uv_graph = graph[u][v]
-                    edge_key = sorted(
-                        _uv_graph,
-                        key=lambda x, _fgraph=_uv_graph: _fgraph[x][
-                            weighing.config_value
-                        ],
-                    )[0]
-                    _uv_graph_edge = _uv_graph[edge_key]
-                    if "geometry" in _uv_graph_edge:
-                        pref_edges.append(_uv_graph_edge["geometry"])
-                    else:
-                        pref_edges.append(
-                            LineString(
-                                [graph.nodes[u]["geometry"], graph.nodes[v]["geometry"]]
-                            )
-                        )
-                    if "rfid" in _uv_graph_edge:
-                        match_list.append(_uv_graph_edge["rfid"])
-
-                combined_pref_edges = MultiLineString([])
-                for geometry in pref_edges:
-                    combined_pref_edges = combined_pref_edges.union(geometry)
+                # get edge with the lowest weighing if there are multiple edges that connect u and v
+                pref_edges = [
+                    min(
+                        graph[u][v].values(),
+                        key=lambda _edge: _edge[weighing.config_value],
+                    )
+                    for u, v in zip(pref_nodes[0:], pref_nodes[1:])
+                ]
+                match_list = [_edge["rfid"] for _edge in pref_edges if "rfid" in _edge]
 
-                if not combined_pref_edges.is_valid:
-                    print(combined_pref_edges.is_valid)
-                    print(o[0], d[0])
+                combined_pref_edges = None
+                if with_geometry:
+                    combined_pref_edges = (
+                        OptimalRouteOriginDestination.get_route_geometry(
+                            graph, pref_nodes, pref_edges
+                        )
+                    )
+                    if not combined_pref_edges.is_valid:
+                        logging.debug(
+                            "Invalid route geometry between nodes %s and %s.",
+                            o[0],
+                            d[0],
+                        )
 
                 # save all data to lists (of lists)
                 o_node_list.append(o[0])
@@ -158,42 +266,22 @@ class OptimalRouteOriginDestination(AnalysisLossesProtocol):
 
     def _get_origin_destination_pairs(
         self, graph: nx.MultiGraph
-    ) -> list[tuple[tuple[str, str], tuple[str, str]]]:
+    ) -> OriginDestinationPairs:
         od_path = self.static_path.joinpath(
             "output_graph", "origin_destination_table.feather"
         )
         od = read_feather(od_path)
-        od_pairs = [
-            (a, b)
-            for a in od.loc[od["o_id"].notnull(), "o_id"]
-            for b in od.loc[od["d_id"].notnull(), "d_id"]
-        ]
-        all_nodes = self.extract_od_nodes_from_graph(graph)
-        od_nodes = []
-        for aa, bb in od_pairs:
-            # it is possible that there are multiple origins/destinations at the same 'entry-point' in the road
-            od_nodes.append(
-                (
-                    [
-                        (n, n_name)
-                        for n, n_name in all_nodes
-                        if (n_name == aa) | (aa in n_name)
-                    ][0],
-                    [
-                        (n, n_name)
-                        for n, n_name in all_nodes
-                        if (n_name == bb) | (bb in n_name)
-                    ][0],
-                )
-            )
-        return od_nodes
+        # it is possible that there are multiple origins/destinations at the same 'entry-point' in the road
+        return OriginDestinationPairs.from_graph(graph, od)
 
     def optimal_route_origin_destination(
         self, graph: nx.MultiGraph, analysis: AnalysisSectionLosses
     ) -> GeoDataFrame:
         # create list of origin-destination pairs
         od_nodes = self._get_origin_destination_pairs(graph)
-        pref_routes = self.find_route_ods(graph, od_nodes, analysis.weighing)
+        pref_routes = self.find_route_ods(
+            graph, od_nodes, analysis.weighing, with_geometry=analysis.save_gpkg
+        )
         return pref_routes
 
     def optimal_route_od_link(
@@ -209,34 +297,43 @@ class OptimalRouteOriginDestination(AnalysisLossesProtocol):
             equity,
         ).optimal_route_od_link()
 
-    def execute(self) -> GeoDataFrame:
-        _output_path = self.output_path.joinpath(self.analysis.analysis.config_value)
-
-        gdf = self.optimal_route_origin_destination(
-            self.graph_file.get_graph(), self.analysis
-        )
+    def save_link_traffic(self, gdf: GeoDataFrame) -> None:
+        """
+        Saves the traffic on each link of the optimal routes, when requested (`save_traffic`).
 
-        if self.analysis.save_traffic and hasattr(
-            self.origins_destinations, "origin_count"
+        Args:
+            gdf (GeoDataFrame): The optimal routes.
+        """
+        if not (
+            self.analysis.save_traffic
+            and hasattr(self.origins_destinations, "origin_count")
         ):
-            od_table = read_feather(
-                self.static_path.joinpath(
-                    "output_graph", "origin_destination_table.feather"
-                )
-            )
-            _equity_weights_file = None
-            if self.analysis.equity_weight:
-                _equity_weights_file = self.static_path.joinpath(
-                    "network", self.analysis.equity_weight
-                )
-            route_traffic_df = self.optimal_route_od_link(
-                gdf,
-                od_table,
-                TrafficAnalysisFactory.read_equity_weights(_equity_weights_file),
+            return
+
+        _output_path = self.output_path.joinpath(self.analysis.analysis.config_value)
+        od_table = read_feather(
+            self.static_path.joinpath(
+                "output_graph", "origin_destination_table.feather"
             )
-            impact_csv_path = _output_path.joinpath(
-                (self.analysis.name.replace(" ", "_") + "_link_traffic.csv"),
+        )
+        _equity_weights_file = None
+        if self.analysis.equity_weight:
+            _equity_weights_file = self.static_path.joinpath(
+                "network", self.analysis.equity_weight
             )
-            route_traffic_df.to_csv(impact_csv_path, index=False)
+        route_traffic_df = self.optimal_route_od_link(
+            gdf,
+            od_table,
+            TrafficAnalysisFactory.read_equity_weights(_equity_weights_file),
+        )
+        impact_csv_path = _output_path.joinpath(
+            (self.analysis.name.replace(" ", "_") + "_link_traffic.csv"),
+        )
+        route_traffic_df.to_csv(impact_csv_path, index=False)
 
+    def execute(self) -> GeoDataFrame:
+        gdf = self.optimal_route_origin_destination(
+            self.graph_file.get_graph(), self.analysis
+        )
+        self.save_link_traffic(gdf)
         return gdf
@@ -23,15 +23,17 @@
 import copy
 import logging
 from collections import defaultdict
-from typing import Any
+from typing import Any, Hashable
 
 import geopandas as gpd
 import networkx as nx
+import numpy as np
 import pandas as pd
 from shapely.geometry import LineString, MultiLineString
 from tqdm import tqdm
 
 from ra2ce.analysis.analysis_input_wrapper import AnalysisInputWrapper
+from ra2ce.analysis.losses.routing_engine.csr_graph import CsrGraph
 
 
 class OriginClosestDestination:
@@ -293,14 +295,6 @@ class OriginClosestDestination:
 
         return base_graph, origins, destinations, aggregated, opt_routes_aggregated
 
-    def get_route_length(
-        self, graph: nx.MultiGraph, origin_node: int, destination_node: int
-    ) -> float:
-        # calculate the length of the preferred route
-        return nx.dijkstra_path_length(
-            graph, origin_node, destination_node, weight=self.weighing
-        )
-
     def compare_route_with_without_disruption(
         self,
         pref_routes: gpd.GeoDataFrame,
@@ -352,22 +346,14 @@ class OriginClosestDestination:
     def get_route_path(
         self,
         graph: nx.MultiGraph,
-        base_graph: nx.MultiGraph,
-        origin_node: int,
-        destination_node: int,
-        nr_from_origin: float,
-        col_name: str,
-    ) -> tuple[nx.MultiGraph, float, MultiLineString]:
-        # Get the nodes of the optimal route
-        route_nodes = nx.dijkstra_path(
-            graph, origin_node, destination_node, weight=self.weighing
-        )
-
+        route_nodes: list[Hashable],
+    ) -> tuple[list[tuple[Hashable, Hashable, Any]], float, MultiLineString]:
         # find out which edges belong to the preferred path
         edgesinpath = list(zip(route_nodes[0:], route_nodes[1:]))
 
         # calculate the total length of the alternative route
         # Find the road segments that are used for the detour to the same or another destination
+        route_edges = []
         pref_edges = []
         length_list = []
         for u, v in edgesinpath:
@@ -376,6 +362,7 @@ class OriginClosestDestination:
             edge_key = sorted(
                 _uv_graph, key=lambda x, _fgraph=_uv_graph: _fgraph[x][self.weighing]
             )[0]
+            route_edges.append((u, v, edge_key))
             _uv_graph_edge = _uv_graph[edge_key]
             if "geometry" in _uv_graph_edge:
                 pref_edges.append(_uv_graph_edge["geometry"])
@@ -387,106 +374,114 @@ class OriginClosestDestination:
             if "length" in _uv_graph_edge:
                 length_list.append(_uv_graph_edge["length"])
 
-            # Add the number of people that need to go to a destination to the road segments. For now, each road segment in a route
-            # gets attributed all the people that are taking that route.
-            base_graph[u][v][edge_key][col_name] = (
-                base_graph[u][v][edge_key][col_name] + nr_from_origin
-            )
-
         pref_edges = MultiLineString(pref_edges)
 
-        return base_graph, sum(length_list), pref_edges
-
-    def get_nr_people_on_route(
-        self, origins: gpd.GeoDataFrame, origin_node: str
-    ) -> float:
-        # Find the number of people per neighborhood
-        try:
-            nr_people_per_route_total = origins.loc[
-                origins[self.od_id] == int(origin_node.split("_")[-1]),
-                self.origin_count,
-            ].iloc[0]
-        except IndexError:
-            origin_node = [a for a in origin_node.split(",") if self.o_name in a][0]
-            nr_people_per_route_total = origins.loc[
-                origins[self.od_id] == int(origin_node.split("_")[-1]),
-                self.origin_count,
-            ].iloc[0]
-        nr_per_route = nr_people_per_route_total * self.origin_out_fraction
-        return nr_per_route
+        return route_edges, sum(length_list), pref_edges
+
+    def get_od_ids(self, od_name: str, name: str) -> list[int]:
+        # Get the ids of the origins or destinations (with `name`) of a node, e.g. "A_1,B_3"
+        return [int(od.split("_")[-1]) for od in od_name.split(",") if name in od]
+
+    def get_nr_people_per_origin(self, origins: gpd.GeoDataFrame) -> dict[int, float]:
+        # Find the number of people per neighborhood that go to a destination
+        return dict(
+            zip(
+                origins[self.od_id],
+                origins[self.origin_count] * self.origin_out_fraction,
+            )
+        )
 
     def update_destinations(
         self,
         destinations: gpd.GeoDataFrame,
-        destination_name: str,
-        nr_per_route: float,
+        nr_per_destination: dict[tuple[int, ...], list[float]],
         col_name: str,
     ) -> gpd.GeoDataFrame:
-        dest_ids = [
-            int(d.split("_")[-1])
-            for d in [dest for dest in destination_name.split(",")]
-            if self.d_name in d
-        ]
-
-        # Add the number of people to the total number of people that go to that destination
-        destinations.loc[destinations[self.od_id].isin(dest_ids), col_name] = (
-            destinations.loc[destinations[self.od_id].isin(dest_ids), col_name].sum()
-            + nr_per_route
-        )
+        # Add the number of people of each route to the total number of people that go to the destinations of its node:
+        # all destinations of the node are set to the total of these destinations plus the number of people of the route.
+        for _dest_ids, _nr_per_route in nr_per_destination.items():
+            _is_destination = destinations[self.od_id].isin(_dest_ids)
+            _total = destinations.loc[_is_destination, col_name].sum()
+            for _nr in _nr_per_route:
+                _value = _total + _nr
+                _total = _value * _is_destination.sum()
+            destinations.loc[_is_destination, col_name] = _value
         return destinations
 
     def update_origins(
-        self, origins: gpd.GeoDataFrame, other: list, col_name: str
+        self,
+        origins: gpd.GeoDataFrame,
+        origins_without_access: list[int],
+        col_name: str,
     ) -> gpd.GeoDataFrame:
         # Attribute to the origins that don't have access that they do not have any access
-        if len(other) > 0:
-            for oth in other:
-                od_id_list = oth[-1].split(",")
-                for od_id in od_id_list:
-                    origins.loc[
-                        origins[self.od_id] == int(od_id.split("_")[-1]),
-                        col_name,
-                    ] = "no access"
+        origins.loc[
+            origins[self.od_id].isin(origins_without_access), col_name
+        ] = "no access"
         return origins
 
     def get_nr_without_access(
         self,
         origins: gpd.GeoDataFrame,
-        origins_without_access: list,
+        origins_without_access: list[int],
         add_key_name: str = None,
     ) -> None:
         # Calculate the number of people that cannot access any destination
-        origins_no_access = [
-            o
-            for o in [
-                oth[-1].split(",") if len(origins_without_access) > 0 else 0
-                for oth in origins_without_access
-            ]
-        ]
-        origins_no_access = [
-            int(item.split("_")[-1])
-            for sublist in origins_no_access
-            for item in sublist
-        ]
-
         pp_no_access = [
-            (
-                round(
-                    (
-                        origins.loc[
-                            origins[self.od_id].isin(origins_no_access),
-                            self.origin_count,
-                        ]
-                        * self.origin_out_fraction
-                    ).sum()
-                )
-                if len(origins_no_access) > 0
-                else 0
+            round(
+                (
+                    origins.loc[
+                        origins[self.od_id].isin(origins_without_access),
+                        self.origin_count,
+                    ]
+                    * self.origin_out_fraction
+                ).sum()
             )
         ]
 
         self.results_dict[f"Nr. no access{add_key_name}"] = pp_no_access
 
+    def get_closest_routes(
+        self,
+        graph: nx.MultiGraph,
+        destination_nodes: list[Hashable],
+        origin_nodes: list[Hashable],
+    ) -> dict[Hashable, tuple[float, list[Hashable]]]:
+        """
+        Gets the route of each origin node to its closest destination node,
+        with a single search from all destination nodes at once (on the reversed graph),
+        instead of a search per origin node.
+
+        Args:
+            graph (nx.MultiGraph): Graph to route on.
+            destination_nodes (list[Hashable]): Nodes of the destinations.
+            origin_nodes (list[Hashable]): Nodes of the origins.
+
+        Returns:
+            dict[Hashable, tuple[float, list[Hashable]]]: Distance and nodes of the route of each origin node that can reach a destination.
+        """
+        if not destination_nodes:
+            return {}
+
+        _csr_graph = CsrGraph.from_graph(graph, self.weighing)
+        _distances, _predecessors = _csr_graph.get_closest_sources(
+            [_csr_graph.node_index[_node] for _node in destination_nodes],
+            reverse=graph.is_directed(),
+        )
+        _closest_routes = {}
+        for _origin_node in origin_nodes:
+            _route = [_csr_graph.node_index[_origin_node]]
+            if not np.isfinite(_distances[_route[0]]):
+                continue
+            # the predecessors lead from the origin to its closest destination
+            while _predecessors[_route[-1]] >= 0:
+                _route.append(_predecessors[_route[-1]])
+            _closest_routes[_origin_node] = (
+                float(_distances[_route[0]]),
+                _csr_graph.get_node_ids(_route),
+            )
+        return _closest_routes
+
     def find_closest_location(
         self,
         disrupted_graph: nx.MultiGraph,
@@ -519,189 +514,188 @@ class OriginClosestDestination:
             destinations: the updated destinations GeoDataFrame
             list_disrupted_destinations [list of tuples]: list of the origin and destination node id and node name from the origins/nodes that do not have a route between them
         """
-        name_save = column_name + "_{}"
-        nx.set_edge_attributes(base_graph, 0, name_save.format("P"))
-
-        # Add a column to the neighborhoods, to indicate if they have access to any destination POI.
-        # The origins without access are indicated later
-        origins[name_save.format("A")] = "access"
-
-        disrupted_graph.add_node("special", speciallabel="special")
-
-        special_edges = []
-        for n, ndat in disrupted_graph.nodes.data():
-            if self.od_key in ndat and self.d_name in ndat[self.od_key]:
-                special_edges.append((n, "special", {self.weighing: 0}))
-
-        disrupted_graph.add_edges_from(special_edges)
-
-        optimal_routes = []
-        list_disrupted_destinations = []
-        list_no_path = []
-        node_checked_has_path = dict()
-        for n_ndat in tqdm(disrupted_graph.nodes.data(), desc="Finding optimal routes"):
-            _new_origins = self._find_optimal_routes(
-                node_checked_has_path,
-                list_no_path,
-                n_ndat,
-                disrupted_graph,
-                hazard_name,
-                list_disrupted_destinations,
-                pref_routes,
-                "special",
-                name_save,
-                optimal_routes,
-                origins,
-                base_graph,
-                destinations,
-            )
-
-            if _new_origins is not None:
-                origins = _new_origins
-                self.get_nr_without_access(origins, list_no_path)
-
-        # Remove the special edges
-        disrupted_graph.remove_edges_from(
-            [(n[0], n[1]) for n in disrupted_graph.edges.data() if n[1] == "special"]
+        # The closest destination of all origins is found with a single search.
+        closest_routes = self.get_closest_routes(
+            disrupted_graph,
+            [
+                n
+                for n, ndat in disrupted_graph.nodes.data()
+                if self.od_key in ndat and self.d_name in ndat[self.od_key]
+            ],
+            [
+                n
+                for n, ndat in disrupted_graph.nodes.data()
+                if self.od_key in ndat and self.o_name in ndat[self.od_key]
+            ],
         )
 
-        # Remove the closest attribute from the nodes
-        origin_closest_dst = [
-            nn[0] for nn in disrupted_graph.nodes.data() if "closest" in nn[-1]
-        ]
-
-        if origin_closest_dst:
-            for o in origin_closest_dst:
-                del disrupted_graph.nodes[o]["closest"]
-
-            optimal_routes_gdf = pd.concat(optimal_routes)
-
-        return (
-            base_graph,
+        return self._find_optimal_routes(
+            disrupted_graph,
+            closest_routes,
+            hazard_name,
+            pref_routes,
+            "special",
+            column_name + "_{}",
             origins,
+            base_graph,
             destinations,
-            list_disrupted_destinations,
-            optimal_routes_gdf,
         )
 
     def _find_optimal_routes(
         self,
-        node_checked_has_path: dict,
-        list_no_path: list,
-        n_ndat: tuple[int, dict[str, Any]],
         disrupted_graph: nx.MultiGraph,
+        closest_routes: dict[Hashable, tuple[float, list[Hashable]]],
         hazard_name: str,
-        list_disrupted_destinations: list,
         pref_routes: gpd.GeoDataFrame,
         dest_name: str,
         name_save: str,
-        optimal_routes: list,
         origins: gpd.GeoDataFrame,
         base_graph: nx.MultiGraph,
         destinations: gpd.GeoDataFrame,
-    ) -> gpd.GeoDataFrame:
+        add_key_name: str = None,
+    ) -> tuple[
+        nx.MultiGraph,
+        gpd.GeoDataFrame,
+        gpd.GeoDataFrame,
+        list,
+        gpd.GeoDataFrame,
+    ]:
         """
         Refactored method to avoid duplication of code between `find_closest_location` and `find_multiple_closest_locations` with subtile differences:
         - The first would not use a `dest_name` attribute.
-        - The second one would use 'ndat["closest"]' instead of the assigned 'closest_dest'
+        - The second one would use the category as `dest_name`
+
+        The results of all origins are first collected and then applied at once
+        to the origins, the destinations and the edges of the `base_graph`.
 
         Returns:
-            Optional[gpd.GeoDataFrame]: When the wrapper for-loop needs to go into the next iteration it will return 'None'. Otherwise a resulting `gpd.GeoDataFrame`.
+            tuple[nx.MultiGraph, gpd.GeoDataFrame, gpd.GeoDataFrame, list, gpd.GeoDataFrame]: The updated `base_graph`, origins and destinations, the list of disrupted destinations and the optimal routes.
         """
-        n, ndat = n_ndat
-        if self.od_key in ndat and self.o_name in ndat[self.od_key]:
-            if nx.has_path(disrupted_graph, n, dest_name):
-                # Add elements to the dictionary this way to prevent an exception when
-                # their key is not present.
-                node_checked_has_path.setdefault(ndat[self.od_key], []).append(n)
-                path = nx.shortest_path(
-                    disrupted_graph,
-                    source=n,
-                    target=dest_name,
-                    weight=self.weighing,
-                )
-                # Closest node with destLabelContains in keyName
-                ndat["closest"] = path[-2]
-                closest_dest = ndat["closest"]
-
-                # Check if the destination that is accessed, is flooded
-                if hazard_name:
-                    try:
-                        if (
-                            disrupted_graph.nodes[closest_dest][hazard_name]
-                            > self.threshold_destinations
-                        ):
-                            list_disrupted_destinations.append(
+        nr_per_origin = self.get_nr_people_per_origin(origins)
+        nr_per_edge = defaultdict(float)
+        nr_per_destination = defaultdict(list)
+        list_disrupted_destinations = []
+        list_no_path = []
+        optimal_routes = []
+        for n, ndat in tqdm(
+            disrupted_graph.nodes.data(),
+            desc=(
+                f"Finding optimal routes to {dest_name}"
+                if add_key_name
+                else "Finding optimal routes"
+            ),
+        ):
+            if not (self.od_key in ndat and self.o_name in ndat[self.od_key]):
+                continue
+            if n not in closest_routes:
+                list_no_path.extend(self.get_od_ids(ndat[self.od_key], self.o_name))
+                continue
+
+            route_length, route_nodes = closest_routes[n]
+            # Closest node with destLabelContains in keyName
+            closest_dest = route_nodes[-1]
+
+            # Check if the destination that is accessed, is flooded
+            if hazard_name:
+                try:
+                    if (
+                        disrupted_graph.nodes[closest_dest][hazard_name]
+                        > self.threshold_destinations
+                    ):
+                        list_disrupted_destinations.append(
+                            (
+                                (n, ndat[self.od_key]),
                                 (
-                                    (n, ndat[self.od_key]),
-                                    (
-                                        closest_dest,
-                                        disrupted_graph.nodes[closest_dest][
-                                            self.od_key
-                                        ],
-                                    ),
-                                )
+                                    closest_dest,
+                                    disrupted_graph.nodes[closest_dest][self.od_key],
+                                ),
                             )
-                            return None
-                    except KeyError as e:
-                        logging.error(
-                            f"The destination nodes do not contain the required attribute '{hazard_name}',"
-                            f" please make sure that the hazard overlay is done correctly by rerunning the 'network.ini'"
-                            f" and checking the output files."
                         )
-                        raise e
+                        continue
+                except KeyError as e:
+                    logging.error(
+                        f"The destination nodes do not contain the required attribute '{hazard_name}',"
+                        f" please make sure that the hazard overlay is done correctly by rerunning the 'network.ini'"
+                        f" and checking the output files."
+                    )
+                    raise e
 
-                nr_per_route = self.get_nr_people_on_route(origins, ndat[self.od_key])
-                base_graph, route_path, route_geoms = self.get_route_path(
-                    disrupted_graph,
-                    base_graph,
-                    n,
-                    closest_dest,
+            nr_per_route = nr_per_origin[
+                self.get_od_ids(ndat[self.od_key], self.o_name)[0]
+            ]
+            route_edges, route_path, route_geoms = self.get_route_path(
+                disrupted_graph, route_nodes
+            )
+            # Each road segment in a route gets attributed all the people that are taking that route.
+            for u, v, k in route_edges:
+                # (u, v, k) and (v, u, k) are the same edge of an undirected graph
+                if not base_graph.is_directed() and (v, u, k) in nr_per_edge:
+                    u, v = v, u
+                nr_per_edge[(u, v, k)] += nr_per_route
+            if pref_routes:
+                self.compare_route_with_without_disruption(
+                    pref_routes,
                     nr_per_route,
-                    name_save.format("P"),
+                    ndat[self.od_key],
+                    disrupted_graph.nodes[closest_dest],
+                    route_length,
+                    route_path,
                 )
-                if pref_routes:
-                    route_length = self.get_route_length(
-                        disrupted_graph, n, closest_dest
+            nr_per_destination[
+                tuple(
+                    self.get_od_ids(
+                        disrupted_graph.nodes[closest_dest][self.od_key], self.d_name
                     )
-                    self.compare_route_with_without_disruption(
-                        pref_routes,
-                        nr_per_route,
-                        ndat[self.od_key],
-                        disrupted_graph.nodes[closest_dest],
-                        route_length,
-                        route_path,
-                    )
-                destinations = self.update_destinations(
-                    destinations,
-                    disrupted_graph.nodes[closest_dest][self.od_key],
-                    nr_per_route,
-                    name_save.format("P"),
+                )
+            ].append(nr_per_route)
+
+            if route_geoms:
+                optimal_routes.append(
+                    {
+                        "o_node": n,
+                        "d_node": closest_dest,
+                        "origin": ndat[self.od_key],
+                        "destination": disrupted_graph.nodes[closest_dest][self.od_key],
+                        self.weighing: route_path,
+                        "origin_cnt": nr_per_route,
+                        "geometry": route_geoms,
+                        "category": dest_name,
+                    }
                 )
 
-                if route_geoms:
-                    optimal_routes.append(
-                        gpd.GeoDataFrame(
-                            {
-                                "o_node": n,
-                                "d_node": closest_dest,
-                                "origin": ndat[self.od_key],
-                                "destination": disrupted_graph.nodes[closest_dest][
-                                    self.od_key
-                                ],
-                                self.weighing: route_path,
-                                "origin_cnt": nr_per_route,
-                                "geometry": [route_geoms],
-                                "category": dest_name,
-                            },
-                            crs=self.crs,
-                        )
-                    )
-            else:
-                if ndat[self.od_key] not in node_checked_has_path:
-                    list_no_path.append((n, ndat[self.od_key]))
+        nx.set_edge_attributes(base_graph, 0, name_save.format("P"))
+        nx.set_edge_attributes(base_graph, nr_per_edge, name_save.format("P"))
+        destinations = self.update_destinations(
+            destinations, nr_per_destination, name_save.format("P")
+        )
+        # Add a column to the neighborhoods, to indicate if they have access to any destination POI.
+        origins[name_save.format("A")] = "access"
+        origins = self.update_origins(origins, list_no_path, name_save.format("A"))
+        self.get_nr_without_access(origins, list_no_path, add_key_name)
+
+        optimal_routes_gdf = gpd.GeoDataFrame(
+            optimal_routes,
+            columns=[
+                "o_node",
+                "d_node",
+                "origin",
+                "destination",
+                self.weighing,
+                "origin_cnt",
+                "geometry",
+                "category",
+            ],
+            geometry="geometry",
+            crs=self.crs,
+        )
 
-        return self.update_origins(origins, list_no_path, name_save.format("A"))
+        return (
+            base_graph,
+            origins,
+            destinations,
+            list_disrupted_destinations,
+            optimal_routes_gdf,
+        )
 
     def find_multiple_closest_locations(
         self,
@@ -739,68 +733,43 @@ class OriginClosestDestination:
         optimal_routes = []
         for dest_name in self.destination_names:
             name_save = column_name + "_{}" + self.destination_names_short[dest_name]
-            nx.set_edge_attributes(base_graph, 0, name_save.format("P"))
 
-            # Add a column to the neighborhoods, to indicate if they have access to any destination POI.
-            # The origins without access are indicated later
-            origins[name_save.format("A")] = "access"
-
-            disrupted_graph.add_node(dest_name, speciallabel=dest_name)
-
-            special_edges = []
-            for n, ndat in disrupted_graph.nodes.data():
-                if (
-                    self.od_key in ndat
+            # The closest destination of this category of all origins is found with a single search.
+            closest_routes = self.get_closest_routes(
+                disrupted_graph,
+                [
+                    n
+                    for n, ndat in disrupted_graph.nodes.data()
+                    if self.od_key in ndat
                     and self.destination_key in ndat
                     and ndat[self.destination_key] == dest_name
-                ):
-                    special_edges.append(
-                        (n, ndat[self.destination_key], {self.weighing: 0})
-                    )
-
-            disrupted_graph.add_edges_from(special_edges)
-
-            list_disrupted_destinations = []
-            list_no_path = []
-            node_checked_has_path = defaultdict(list)
-            for n_ndat in tqdm(
-                disrupted_graph.nodes.data(),
-                desc=f"Finding optimal routes to {dest_name}",
-            ):
-                _new_origins = self._find_optimal_routes(
-                    node_checked_has_path,
-                    list_no_path,
-                    n_ndat,
-                    disrupted_graph,
-                    hazard_name,
-                    list_disrupted_destinations,
-                    pref_routes,
-                    dest_name,
-                    name_save,
-                    optimal_routes,
-                    origins,
-                    base_graph,
-                    destinations,
-                )
-
-                if _new_origins is not None:
-                    origins = _new_origins
-                    self.get_nr_without_access(origins, list_no_path, f" {dest_name}")
-
-            # Remove the special edges
-            disrupted_graph.remove_edges_from(
+                ],
                 [
-                    (n[0], n[1])
-                    for n in disrupted_graph.edges.data()
-                    if n[1] == dest_name
-                ]
+                    n
+                    for n, ndat in disrupted_graph.nodes.data()
+                    if self.od_key in ndat and self.o_name in ndat[self.od_key]
+                ],
             )
 
-            # Remove the closest attribute from the nodes
-            for o in [
-                nn[0] for nn in disrupted_graph.nodes.data() if "closest" in nn[-1]
-            ]:
-                del disrupted_graph.nodes[o]["closest"]
+            (
+                base_graph,
+                origins,
+                destinations,
+                list_disrupted_destinations,
+                optimal_routes_gdf,
+            ) = self._find_optimal_routes(
+                disrupted_graph,
+                closest_routes,
+                hazard_name,
+                pref_routes,
+                dest_name,
+                name_save,
+                origins,
+                base_graph,
+                destinations,
+                f" {dest_name}",
+            )
+            optimal_routes.append(optimal_routes_gdf)
 
         optimal_routes_gdf = pd.concat(optimal_routes)
 
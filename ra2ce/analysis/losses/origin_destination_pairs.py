@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from itertools import product
+from typing import Any, Iterator
+
+import networkx as nx
+import pandas as pd
+
+
+@dataclass
+class OriginDestinationPairs:
+    """
+    All combinations of the origins and destinations, as ((node, origin id), (node, destination id)).
+    The combinations are generated when iterating, so they are never stored.
+    """
+
+    origins: list[tuple[Any, str]]
+    destinations: list[tuple[Any, str]]
+
+    @staticmethod
+    def get_od_id_nodes(graph: nx.MultiGraph) -> dict[str, Any]:
+        """
+        Gets the graph node of each origin / destination id (`od_id`), including the nodes
+        with several (comma separated) ids. When an id occurs at several nodes the first node is used.
+
+        Args:
+            graph (nx.MultiGraph): Graph containing origin-destination nodes.
+
+        Returns:
+            dict[str, Any]: Graph node of each origin / destination id.
+        """
+        _od_id_nodes = {}
+        for _node, _od_ids in graph.nodes(data="od_id"):
+            if _od_ids is None:
+                continue
+            for _od_id in _od_ids.split(","):
+                _od_id_nodes.setdefault(_od_id, _node)
+        return _od_id_nodes
+
+    @classmethod
+    def from_graph(
+        cls, graph: nx.MultiGraph, od_table: pd.DataFrame
+    ) -> OriginDestinationPairs:
+        """
+        Gets the pairs of all origins (`o_id`) and destinations (`d_id`) in the origin-destination table,
+        located at their graph node.
+
+        Args:
+            graph (nx.MultiGraph): Graph containing origin-destination nodes.
+            od_table (pd.DataFrame): Origin-destination table.
+
+        Raises:
+            ValueError: When an origin or destination is not found in the graph.
+
+        Returns:
+            OriginDestinationPairs: The origin-destination pairs.
+        """
+        _od_id_nodes = cls.get_od_id_nodes(graph)
+
+        def _get_od_nodes(od_ids: pd.Series) -> list[tuple[Any, str]]:
+            _missing_ids = set(od_ids) - _od_id_nodes.keys()
+            if _missing_ids:
+                raise ValueError(
+                    "Origins / destinations {} are not found in the graph.".format(
+                        sorted(_missing_ids)
+                    )
+                )
+            return [(_od_id_nodes[_od_id], _od_id) for _od_id in od_ids]
+
+        return cls(
+            origins=_get_od_nodes(od_table.loc[od_table["o_id"].notnull(), "o_id"]),
+            destinations=_get_od_nodes(
+                od_table.loc[od_table["d_id"].notnull(), "d_id"]
+            ),
+        )
+
+    def __len__(self) -> int:
+        return len(self.origins) * len(self.destinations)
+
+    def __iter__(self) -> Iterator[tuple[tuple[Any, str], tuple[Any, str]]]:
+        return product(self.origins, self.destinations)
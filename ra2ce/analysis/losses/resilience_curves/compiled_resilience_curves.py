@@ -0,0 +1,217 @@
+"""
+                    GNU GENERAL PUBLIC LICENSE
+                      Version 3, 29 June 2007
+    Risk Assessment and Adaptation for Critical Infrastructure (RA2CE).
+    Copyright (C) 2023 Stichting Deltares
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Iterable
+
+import numpy as np
+
+from ra2ce.network.network_config_data.enums.road_type_enum import RoadTypeEnum
+
+
+@dataclass(kw_only=True)
+class CompiledResilienceCurves:
+    """
+    Array (tensor) representation of `ResilienceCurves`, to query the curves of
+    many links at once by their (integer) link type and hazard range.
+
+    The curves are padded to the same number of steps along the last axis
+    (`has_step` tells which steps exist). The disruption (as in
+    `ResilienceCurves.calculate_disruption`) and the divisor of each curve are precomputed.
+    Stacked curves (see `stack`) have an additional leading (member) axis on these arrays.
+    """
+
+    link_types: list[RoadTypeEnum]
+    ranges: list[tuple[float, float]]
+    range_bounds: np.ndarray
+    segment_ranges: np.ndarray
+    has_curve: np.ndarray
+    has_step: np.ndarray
+    durations: np.ndarray
+    loss_ratios: np.ndarray
+    disruptions: np.ndarray
+    divisors: np.ndarray
+
+    @classmethod
+    def from_resilience_curves(
+        cls,
+        resilience_curves: dict[
+            tuple[RoadTypeEnum, tuple[float, float]], list[tuple[float, float]]
+        ],
+        ranges: list[tuple[float, float]],
+    ) -> CompiledResilienceCurves:
+        """
+        Compiles the given resilience curves into their array representation.
+
+        Args:
+            resilience_curves (dict[tuple[RoadTypeEnum, tuple[float, float]], list[tuple[float, float]]]): Curve (duration, loss ratio steps) of each link type and hazard range.
+            ranges (list[tuple[float, float]]): Hazard ranges, in order of precedence for intensities on a shared bound.
+
+        Returns:
+            CompiledResilienceCurves: The compiled resilience curves.
+        """
+        _link_types = list(dict.fromkeys(_key[0] for _key in resilience_curves))
+        _link_type_ids = {_link_type: _id for _id, _link_type in enumerate(_link_types)}
+        _range_ids = {_range: _id for _id, _range in enumerate(ranges)}
+        _shape = (
+            len(_link_types),
+            len(ranges),
+            max(map(len, resilience_curves.values()), default=0),
+        )
+
+        _has_step = np.zeros(_shape, dtype=bool)
+        _durations = np.zeros(_shape)
+        _loss_ratios = np.zeros(_shape)
+        _disruptions = np.zeros(_shape[:2])
+        for (_link_type, _range), _curve in resilience_curves.items():
+            _idx = (_link_type_ids[_link_type], _range_ids[_range])
+            _has_step[_idx][: len(_curve)] = True
+            _durations[_idx][: len(_curve)] = [_step[0] for _step in _curve]
+            _loss_ratios[_idx][: len(_curve)] = [_step[1] for _step in _curve]
+            _disruptions[_idx] = sum(_duration * _ratio for _duration, _ratio in _curve)
+
+        # The range bounds split the hazard intensities into segments (each bound and
+        # the interval between two consecutive bounds), each with a single (first) range.
+        _range_bounds = np.unique(np.asarray(ranges, dtype=float).ravel())
+        _segment_values = np.empty(max(2 * len(_range_bounds) - 1, 0))
+        _segment_values[::2] = _range_bounds
+        _segment_values[1::2] = (_range_bounds[:-1] + _range_bounds[1:]) / 2
+        _segment_ranges = np.full(len(_segment_values), -1)
+        for _range_id, (_lower, _upper) in reversed(list(enumerate(ranges))):
+            _segment_ranges[
+                (_lower <= _segment_values) & (_segment_values <= _upper)
+            ] = _range_id
+
+        return cls(
+            link_types=_link_types,
+            ranges=list(ranges),
+            range_bounds=_range_bounds,
+            segment_ranges=_segment_ranges,
+            has_curve=_has_step.any(axis=2),
+            has_step=_has_step,
+            durations=_durations,
+            loss_ratios=_loss_ratios,
+            disruptions=_disruptions,
+            # High value assuming the road is almost inaccessible
+            divisors=np.where((_loss_ratios <= 1).all(axis=2), 1, 100),
+        )
+
+    @classmethod
+    def stack(
+        cls, compiled_resilience_curves: list[CompiledResilienceCurves]
+    ) -> CompiledResilienceCurves:
+        """
+        Stacks compiled resilience curves with the same link types and hazard ranges
+        (e.g. alternative curves of a sensitivity analysis) along a new leading (member) axis
+        of the curve arrays. The link types and ranges (and their order) of the first are used,
+        the steps are padded to the largest number of steps.
+
+        Args:
+            compiled_resilience_curves (list[CompiledResilienceCurves]): The compiled resilience curves to stack.
+
+        Raises:
+            ValueError: When the link types or hazard ranges of the resilience curves differ.
+
+        Returns:
+            CompiledResilienceCurves: The stacked resilience curves.
+        """
+        _first = compiled_resilience_curves[0]
+        _nr_steps = max(_c.has_step.shape[-1] for _c in compiled_resilience_curves)
+        _arrays = {
+            _name: []
+            for _name in [
+                "has_curve",
+                "has_step",
+                "durations",
+                "loss_ratios",
+                "disruptions",
+                "divisors",
+            ]
+        }
+        for _compiled in compiled_resilience_curves:
+            if set(_compiled.link_types) != set(_first.link_types) or set(
+                _compiled.ranges
+            ) != set(_first.ranges):
+                raise ValueError(
+                    "Resilience curves can only be stacked with the same link types and hazard ranges"
+                )
+            _order = np.ix_(
+                [_compiled.link_types.index(_lt) for _lt in _first.link_types],
+                [_compiled.ranges.index(_r) for _r in _first.ranges],
+            )
+            _padding = [(0, 0), (0, 0), (0, _nr_steps - _compiled.has_step.shape[-1])]
+            for _name, _stacked in _arrays.items():
+                _array = getattr(_compiled, _name)[_order]
+                if _array.ndim == 3:
+                    _array = np.pad(_array, _padding)
+                _stacked.append(_array)
+
+        return cls(
+            link_types=list(_first.link_types),
+            ranges=list(_first.ranges),
+            range_bounds=_first.range_bounds,
+            segment_ranges=_first.segment_ranges,
+            **{_name: np.stack(_stacked) for _name, _stacked in _arrays.items()},
+        )
+
+    def get_link_type_ids(self, link_types: Iterable[RoadTypeEnum]) -> np.ndarray:
+        """
+        Gets the position of the given link types in `link_types`.
+
+        Args:
+            link_types (Iterable[RoadTypeEnum]): Link types to look up.
+
+        Returns:
+            np.ndarray: Position of each link type (-1 if it has no resilience curves).
+        """
+        _link_type_ids = {
+            _link_type: _id for _id, _link_type in enumerate(self.link_types)
+        }
+        return np.array(
+            [_link_type_ids.get(_link_type, -1) for _link_type in link_types],
+            dtype=int,
+        )
+
+    def get_range_ids(self, hazard_intensities: np.ndarray) -> np.ndarray:
+        """
+        Bins the hazard intensities into the (first) hazard range that contains them,
+        by a binary search of their segment of the range bounds.
+
+        Args:
+            hazard_intensities (np.ndarray): Hazard intensities to bin.
+
+        Returns:
+            np.ndarray: Position of the range of each intensity in `ranges` (-1 if none).
+        """
+        if not len(self.range_bounds):
+            return np.full(len(hazard_intensities), -1)
+        _positions = np.searchsorted(self.range_bounds, hazard_intensities)
+        _is_bound = (
+            self.range_bounds[np.minimum(_positions, len(self.range_bounds) - 1)]
+            == hazard_intensities
+        )
+        _segments = np.where(_is_bound, 2 * _positions, 2 * _positions - 1)
+        _is_inside = _is_bound | (
+            (_positions > 0) & (_positions < len(self.range_bounds))
+        )
+        return np.where(
+            _is_inside,
+            self.segment_ranges[np.clip(_segments, 0, len(self.segment_ranges) - 1)],
+            -1,
+        )
@@ -16,6 +16,9 @@
 """
 from dataclasses import dataclass, field
 
+from ra2ce.analysis.losses.resilience_curves.compiled_resilience_curves import (
+    CompiledResilienceCurves,
+)
 from ra2ce.network.network_config_data.enums.road_type_enum import RoadTypeEnum
 
 
@@ -118,3 +121,14 @@ class ResilienceCurves:
                 self.get_functionality_loss_ratio(link_type, hazard_range),
             )
         )
+
+    def compile(self) -> CompiledResilienceCurves:
+        """
+        Compile the resilience curves into arrays, to query them for many links at once.
+
+        Returns:
+            CompiledResilienceCurves: The compiled resilience curves.
+        """
+        return CompiledResilienceCurves.from_resilience_curves(
+            self.resilience_curves, self.ranges
+        )
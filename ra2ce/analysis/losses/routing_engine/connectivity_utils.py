@@ -0,0 +1,135 @@
+import heapq
+from collections import Counter, defaultdict
+from typing import Any, Hashable
+
+import networkx as nx
+import numpy as np
+
+
+def get_bridges(graph: nx.MultiGraph) -> set[tuple[Hashable, Hashable, Any]]:
+    """
+    Gets the edges whose removal disconnects their own end nodes (bridges),
+    so no detour exists for them. This is a linear time operation.
+
+    Parallel edges are never bridges. For directed graphs the bridges of the
+    underlying undirected graph are returned, as there is no directed detour for them either.
+
+    Args:
+        graph (nx.MultiGraph): Graph to find the bridges in.
+
+    Returns:
+        set[tuple[Hashable, Hashable, Any]]: Bridges as (u, v, key), as found in `graph.edges(keys=True)`.
+    """
+    _pair_count = Counter(frozenset((u, v)) for u, v in graph.edges())
+    _simple_graph = nx.Graph()
+    _simple_graph.add_nodes_from(graph.nodes)
+    _simple_graph.add_edges_from(graph.edges())
+    _bridges = set(
+        _pair
+        for _pair in map(frozenset, nx.bridges(_simple_graph))
+        if _pair_count[_pair] == 1
+    )
+    return set(
+        (u, v, k) for u, v, k in graph.edges(keys=True) if frozenset((u, v)) in _bridges
+    )
+
+
+def get_components(graph: nx.MultiGraph) -> dict[Hashable, int]:
+    """
+    Gets the (weakly) connected component each node belongs to.
+    Nodes in different components can not be connected, so no path needs to be searched for them.
+
+    Args:
+        graph (nx.MultiGraph): Graph to find the components in.
+
+    Returns:
+        dict[Hashable, int]: Component number of each node.
+    """
+    _components = (
+        nx.weakly_connected_components(graph)
+        if graph.is_directed()
+        else nx.connected_components(graph)
+    )
+    return {
+        _node: _component_id
+        for _component_id, _component in enumerate(_components)
+        for _node in _component
+    }
+
+
+def get_covering_nodes(pairs: np.ndarray) -> np.ndarray:
+    """
+    Assigns each pair of nodes to one of its nodes, such that few distinct nodes are used
+    (greedy vertex cover: the node covering most remaining pairs is assigned first).
+    Used to share a single search among all pairs (edges) assigned to the same node.
+
+    Args:
+        pairs (np.ndarray): Rows of two (integer) nodes.
+
+    Returns:
+        np.ndarray: The node assigned to each pair.
+    """
+    _node_pairs = defaultdict(list)
+    for _pair_id, (_a, _b) in enumerate(pairs):
+        _node_pairs[_a].append(_pair_id)
+        if _b != _a:
+            _node_pairs[_b].append(_pair_id)
+    _remaining = {_node: len(_ids) for _node, _ids in _node_pairs.items()}
+    _heap = [(-_count, _node) for _node, _count in _remaining.items()]
+    heapq.heapify(_heap)
+
+    _covering_nodes = np.full(len(pairs), -1, dtype=np.int64)
+    _is_covered = np.zeros(len(pairs), dtype=bool)
+    while _heap:
+        _count, _node = heapq.heappop(_heap)
+        if -_count != _remaining[_node] or not _remaining[_node]:
+            continue
+        for _pair_id in _node_pairs[_node]:
+            if _is_covered[_pair_id]:
+                continue
+            _is_covered[_pair_id] = True
+            _covering_nodes[_pair_id] = _node
+            _a, _b = pairs[_pair_id]
+            _other = _b if _a == _node else _a
+            if _other != _node:
+                _remaining[_other] -= 1
+                heapq.heappush(_heap, (-_remaining[_other], _other))
+        _remaining[_node] = 0
+    return _covering_nodes
+
+
+def get_component_labels(nr_nodes: int, edge_nodes: np.ndarray) -> np.ndarray:
+    """
+    Gets the connected component of each node of an (undirected) graph given
+    as (integer) edge list, with an array-based disjoint-set (union-find):
+    the roots of the end nodes of all edges are linked at once, followed by
+    path compression, until the end nodes of all edges share their root.
+
+    The label of a component is its lowest node, so the components are labeled
+    in the order in which they are found by `nx.connected_components`.
+
+    Args:
+        nr_nodes (int): Number of nodes (numbered from 0).
+        edge_nodes (np.ndarray): Rows of the two (integer) end nodes of each edge.
+
+    Returns:
+        np.ndarray: Lowest node of the component of each node.
+    """
+    _parents = np.arange(nr_nodes)
+    _sources, _targets = edge_nodes[:, 0], edge_nodes[:, 1]
+    while True:
+        # All parents are roots, as the paths are fully compressed.
+        _source_roots, _target_roots = _parents[_sources], _parents[_targets]
+        _is_split = _source_roots != _target_roots
+        if not _is_split.any():
+            return _parents
+        np.minimum.at(
+            _parents,
+            np.maximum(_source_roots, _target_roots)[_is_split],
+            np.minimum(_source_roots, _target_roots)[_is_split],
+        )
+        while True:
+            _grand_parents = _parents[_parents]
+            if np.array_equal(_grand_parents, _parents):
+                break
+            _parents = _grand_parents
@@ -0,0 +1,325 @@
+from __future__ import annotations
+
+import logging
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Any, Hashable, Iterator, Optional
+
+import networkx as nx
+import numpy as np
+from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import dijkstra
+
+from ra2ce.analysis.losses.routing_engine.connectivity_utils import get_covering_nodes
+
+
+@dataclass
+class CsrGraph:
+    """
+    Integer-indexed adjacency (CSR) representation of a NetworkX (multi)graph,
+    so shortest paths can be computed with `scipy.sparse.csgraph` instead of
+    traversing the NetworkX graph.
+
+    Parallel edges are collapsed into a single adjacency entry with their lowest weight,
+    which is what `nx.single_source_dijkstra` does for multigraphs.
+    Undirected graphs are stored symmetrically (an entry for each direction).
+
+    Edges are disrupted by masking their adjacency entries rather than by mutating a graph.
+    """
+
+    nodes: list[Hashable]
+    edges: list[tuple[Hashable, Hashable, Any]]
+    indptr: np.ndarray
+    indices: np.ndarray
+    weights: np.ndarray
+    edge_entries: np.ndarray
+    edge_masked_weights: np.ndarray
+
+    @classmethod
+    def from_graph(cls, graph: nx.MultiGraph, weight: str) -> CsrGraph:
+        """
+        Compiles the given graph into its CSR representation.
+
+        Args:
+            graph (nx.MultiGraph): Graph to compile.
+            weight (str): Edge attribute used as weight, edges without it weigh 1 (as in NetworkX).
+
+        Returns:
+            CsrGraph: The compiled graph.
+        """
+        _nodes = list(graph.nodes)
+        _node_index = {_node: _idx for _idx, _node in enumerate(_nodes)}
+        _n_nodes = len(_nodes)
+        _edge_data = list(graph.edges(keys=True, data=weight, default=1))
+        _n_edges = len(_edge_data)
+
+        _u = np.fromiter(
+            (_node_index[_e[0]] for _e in _edge_data), dtype=np.int64, count=_n_edges
+        )
+        _v = np.fromiter(
+            (_node_index[_e[1]] for _e in _edge_data), dtype=np.int64, count=_n_edges
+        )
+        _w = np.fromiter((_e[3] for _e in _edge_data), dtype=np.float64, count=_n_edges)
+
+        # Group parallel edges into node pairs.
+        if graph.is_directed():
+            _a, _b = _u, _v
+        else:
+            _a, _b = np.minimum(_u, _v), np.maximum(_u, _v)
+        _pairs, _edge_pair = np.unique(_a * _n_nodes + _b, return_inverse=True)
+        _edge_pair = _edge_pair.ravel()
+        _pair_a, _pair_b = np.divmod(_pairs, _n_nodes)
+        _n_pairs = len(_pairs)
+
+        # Lowest and second lowest weight of the parallel edges of each pair.
+        _order = np.lexsort((_w, _edge_pair))
+        _sorted_w = _w[_order]
+        _group_start = np.flatnonzero(
+            np.r_[True, _edge_pair[_order][1:] != _edge_pair[_order][:-1]]
+        )
+        _group_size = np.diff(np.r_[_group_start, _n_edges])
+        _pair_weight = _sorted_w[_group_start]
+        _pair_second_weight = np.full(_n_pairs, np.inf)
+        _has_parallel = _group_size > 1
+        _pair_second_weight[_has_parallel] = _sorted_w[_group_start[_has_parallel] + 1]
+
+        # Removing the lowest edge of a pair exposes the second lowest one,
+        # removing any other parallel edge does not change the adjacency.
+        _masked_weights = _pair_weight[_edge_pair]
+        _masked_weights[_order[_group_start]] = _pair_second_weight
+
+        # Adjacency entries: one per pair, plus the reverse one for undirected graphs.
+        _entry_pairs = np.arange(_n_pairs)
+        _rows, _cols = _pair_a, _pair_b
+        _pair_reverse_entry = np.arange(_n_pairs)
+        if not graph.is_directed():
+            _reverse = np.flatnonzero(_pair_a != _pair_b)
+            _entry_pairs = np.r_[_entry_pairs, _reverse]
+            _rows = np.r_[_pair_a, _pair_b[_reverse]]
+            _cols = np.r_[_pair_b, _pair_a[_reverse]]
+            _pair_reverse_entry[_reverse] = _n_pairs + np.arange(len(_reverse))
+
+        _entry_order = np.lexsort((_cols, _rows))
+        _entry_position = np.empty_like(_entry_order)
+        _entry_position[_entry_order] = np.arange(len(_entry_order))
+
+        return cls(
+            nodes=_nodes,
+            edges=[_e[:3] for _e in _edge_data],
+            indptr=np.r_[0, np.cumsum(np.bincount(_rows, minlength=_n_nodes))].astype(
+                np.int32
+            ),
+            indices=_cols[_entry_order].astype(np.int32),
+            weights=_pair_weight[_entry_pairs][_entry_order],
+            edge_entries=np.column_stack(
+                (
+                    _entry_position[_edge_pair],
+                    _entry_position[_pair_reverse_entry[_edge_pair]],
+                )
+            ),
+            edge_masked_weights=_masked_weights,
+        )
+
+    @cached_property
+    def node_index(self) -> dict[Hashable, int]:
+        return {_node: _idx for _idx, _node in enumerate(self.nodes)}
+
+    @cached_property
+    def edge_index(self) -> dict[tuple[Hashable, Hashable, Any], int]:
+        _edge_index = {}
+        for _idx, (u, v, k) in enumerate(self.edges):
+            _edge_index[(u, v, k)] = _idx
+            if self.edge_entries[_idx, 0] != self.edge_entries[_idx, 1]:
+                # undirected edge, it can also be referred to in reverse.
+                _edge_index.setdefault((v, u, k), _idx)
+        return _edge_index
+
+    @cached_property
+    def adjacency(self) -> csr_matrix:
+        # The matrix shares `weights`, so masking edges is reflected without rebuilding it.
+        _n_nodes = len(self.nodes)
+        return csr_matrix(
+            (self.weights, self.indices, self.indptr), shape=(_n_nodes, _n_nodes)
+        )
+
+    @contextmanager
+    def without_edge(self, edge_id: int) -> Iterator[CsrGraph]:
+        """
+        Temporarily masks an edge (by its position in `edges`) from the adjacency.
+
+        Args:
+            edge_id (int): Position of the edge in `edges`.
+
+        Yields:
+            Iterator[CsrGraph]: This graph, without the edge.
+        """
+        _entries = self.edge_entries[edge_id]
+        _original_weights = self.weights[_entries]
+        self.weights[_entries] = self.edge_masked_weights[edge_id]
+        try:
+            yield self
+        finally:
+            self.weights[_entries] = _original_weights
+
+    @cached_property
+    def max_distance(self) -> float:
+        # No shortest path can be longer than all (finite) weights together,
+        # whichever edges are masked.
+        _weights = np.r_[self.weights, self.edge_masked_weights]
+        return float(_weights[np.isfinite(_weights)].sum())
+
+    def get_shortest_paths(
+        self,
+        source: int,
+        targets: Optional[np.ndarray] = None,
+        initial_limit: float = np.inf,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Calculates the shortest path tree from a source node (by its index),
+        bounded by a distance limit of `initial_limit`.
+        When targets are given the limit is doubled until all targets are reached
+        or the limit covers the whole graph (the targets are unreachable).
+
+        Args:
+            source (int): Index of the source node.
+            targets (Optional[np.ndarray]): Indices of the nodes that need to be reached. Defaults to None (all nodes).
+            initial_limit (float): Initial distance limit of the search. Defaults to np.inf (unbounded).
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: Distances and predecessors for all nodes
+                (`inf` and -9999 when unreachable or beyond the final limit).
+        """
+        _limit = initial_limit
+        while True:
+            if _limit >= self.max_distance or not _limit > 0:
+                _limit = np.inf
+            _distances, _predecessors = dijkstra(
+                self.adjacency,
+                directed=True,
+                indices=source,
+                return_predecessors=True,
+                limit=_limit,
+            )
+            if (
+                np.isinf(_limit)
+                or targets is None
+                or np.isfinite(_distances[targets]).all()
+            ):
+                return _distances, _predecessors
+            _limit *= 2
+
+    def get_closest_sources(
+        self, sources: np.ndarray, reverse: bool = False
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Calculates for all nodes the distance to their closest source node (by index),
+        with a single search from all sources at once.
+
+        Args:
+            sources (np.ndarray): Indices of the source nodes.
+            reverse (bool): Whether to search on the reversed graph, so the distances are
+                from each node towards its closest source (only relevant for directed graphs). Defaults to False.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: Distances and predecessors for all nodes
+                (`inf` and -9999 when unreachable), the predecessors lead to the closest source.
+        """
+        _distances, _predecessors, _ = dijkstra(
+            self.adjacency.T if reverse else self.adjacency,
+            directed=True,
+            indices=np.asarray(sources, dtype=np.int64),
+            return_predecessors=True,
+            min_only=True,
+        )
+        return _distances, _predecessors
+
+    @staticmethod
+    def get_path(predecessors: np.ndarray, source: int, target: int) -> list[int]:
+        """
+        Reconstructs the path (as node indices) from a shortest path tree.
+
+        Args:
+            predecessors (np.ndarray): Predecessors as returned by `get_shortest_paths`.
+            source (int): Index of the source node.
+            target (int): Index of the (reachable) target node.
+
+        Returns:
+            list[int]: Node indices from source to target.
+        """
+        _path = [target]
+        while _path[-1] != source:
+            _path.append(int(predecessors[_path[-1]]))
+        return _path[::-1]
+
+    def get_routes(
+        self,
+        routes: list[tuple[Hashable, Hashable]],
+        initial_limits: Optional[list[float]] = None,
+        symmetric: bool = False,
+    ) -> list[tuple[float, list[Hashable]]]:
+        """
+        Calculates the shortest route of each (source, target) pair with
+        a single (bounded) search per source, which settles all targets of that source.
+
+        Args:
+            routes (list[tuple[Hashable, Hashable]]): Source and target node of each route.
+            initial_limits (Optional[list[float]]): Initial distance limit of each route,
+                the search of a source starts with the largest of its routes. Defaults to None (unbounded).
+            symmetric (bool): Whether a route may be searched from its target (undirected graph),
+                so routes sharing any end node share a search. Defaults to False.
+
+        Returns:
+            list[tuple[float, list[Hashable]]]: Value and nodes of each route (`inf` and `[]` when unreachable).
+        """
+        if not routes:
+            return []
+
+        _pairs = np.array(
+            [
+                (self.node_index[_source], self.node_index[_target])
+                for _source, _target in routes
+            ],
+            dtype=np.int64,
+        )
+        _limits = (
+            np.full(len(routes), np.inf)
+            if initial_limits is None
+            else np.asarray(initial_limits, dtype=np.float64)
+        )
+        _search_sources = get_covering_nodes(_pairs) if symmetric else _pairs[:, 0]
+
+        _found_routes = [None] * len(routes)
+        _order = np.argsort(_search_sources, kind="stable")
+        _source_starts = np.flatnonzero(
+            np.r_[True, _search_sources[_order][1:] != _search_sources[_order][:-1]]
+        )
+        logging.info(
+            "%s routes are searched with %s searches.", len(routes), len(_source_starts)
+        )
+        for _route_ids in np.split(_order, _source_starts[1:]):
+            _source = _search_sources[_route_ids[0]]
+            _targets = np.where(
+                _pairs[_route_ids, 0] == _source,
+                _pairs[_route_ids, 1],
+                _pairs[_route_ids, 0],
+            )
+            _distances, _predecessors = self.get_shortest_paths(
+                _source, _targets, _limits[_route_ids].max()
+            )
+            for _route_id, _target in zip(_route_ids, _targets):
+                if not np.isfinite(_distances[_target]):
+                    _found_routes[_route_id] = (np.inf, [])
+                    continue
+                _path = self.get_path(_predecessors, _source, _target)
+                if _pairs[_route_id, 0] != _source:
+                    # Searched from the target.
+                    _path = _path[::-1]
+                _found_routes[_route_id] = (
+                    float(_distances[_target]),
+                    self.get_node_ids(_path),
+                )
+        return _found_routes
+
+    def get_node_ids(self, node_indices: list[int]) -> list[Hashable]:
+        return [self.nodes[_idx] for _idx in node_indices]
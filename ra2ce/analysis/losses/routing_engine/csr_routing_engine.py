@@ -0,0 +1,89 @@
+from typing import Any, Hashable
+
+import numpy as np
+
+from ra2ce.analysis.losses.routing_engine.csr_graph import CsrGraph
+from ra2ce.analysis.losses.routing_engine.detour_result import DetourResult
+from ra2ce.analysis.losses.routing_engine.routing_engine_protocol import (
+    RoutingEngineProtocol,
+)
+
+
+class CsrRoutingEngine(RoutingEngineProtocol):
+    """
+    Routing engine that searches the alternative routes on a `CsrGraph`
+    (compiled once) with `scipy.sparse.csgraph.dijkstra`,
+    masking each edge instead of removing it from the graph.
+    """
+
+    csr_graph: CsrGraph
+
+    def __init__(self, csr_graph: CsrGraph) -> None:
+        self.csr_graph = csr_graph
+
+    @staticmethod
+    def search_detours(
+        csr_graph: CsrGraph, tasks: np.ndarray
+    ) -> list[tuple[float, list[int]]]:
+        """
+        Searches the alternative route of each task, only using node and edge indices
+        (so it can also run on a graph attached from shared memory).
+
+        Args:
+            csr_graph (CsrGraph): Graph to search on.
+            tasks (np.ndarray): Rows of (source index, target index, edge id).
+
+        Returns:
+            list[tuple[float, list[int]]]: Alternative value and node indices per task (`inf` and `[]` without detour).
+        """
+        _found_detours = []
+        for _source, _target, _edge_id in tasks:
+            # Detours are mostly local, so the search starts bounded around the edge weight.
+            _initial_limit = 2 * csr_graph.weights[csr_graph.edge_entries[_edge_id, 0]]
+            with csr_graph.without_edge(_edge_id):
+                _distances, _predecessors = csr_graph.get_shortest_paths(
+                    _source, np.array([_target]), _initial_limit
+                )
+
+            if not np.isfinite(_distances[_target]):
+                _found_detours.append((np.inf, []))
+                continue
+            _found_detours.append(
+                (
+                    float(_distances[_target]),
+                    csr_graph.get_path(_predecessors, _source, _target),
+                )
+            )
+        return _found_detours
+
+    def _search_detours(self, tasks: np.ndarray) -> list[tuple[float, list[int]]]:
+        return self.search_detours(self.csr_graph, tasks)
+
+    def get_detours(
+        self, edges: list[tuple[Hashable, Hashable, Any]]
+    ) -> list[DetourResult]:
+        _tasks = np.array(
+            [
+                (
+                    self.csr_graph.node_index[u],
+                    self.csr_graph.node_index[v],
+                    self.csr_graph.edge_index[(u, v, k)],
+                )
+                for u, v, k in edges
+            ],
+            dtype=np.int64,
+        ).reshape(-1, 3)
+
+        _detours = []
+        for _alt_value, _alt_path in self._search_detours(_tasks):
+            if not _alt_path:
+                _detours.append(DetourResult())
+                continue
+            _detours.append(
+                DetourResult(
+                    alt_value=_alt_value,
+                    alt_nodes=self.csr_graph.get_node_ids(_alt_path),
+                    connected=1,
+                )
+            )
+        return _detours
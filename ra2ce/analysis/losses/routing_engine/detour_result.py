@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass, field
+from typing import Any
+
+
+@dataclass
+class DetourResult:
+    """
+    Alternative route found for a disrupted edge.
+    When no alternative route exists the values remain as `nan` and `connected` as 0,
+    as expected by the redundancy analyses.
+    """
+
+    alt_value: float = math.nan
+    alt_nodes: list[Any] | float = field(default_factory=lambda: math.nan)
+    connected: int = 0
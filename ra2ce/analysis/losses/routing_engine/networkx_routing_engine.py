@@ -0,0 +1,49 @@
+from typing import Any, Hashable
+
+import networkx as nx
+
+from ra2ce.analysis.analysis_config_data.enums.weighing_enum import WeighingEnum
+from ra2ce.analysis.losses.routing_engine.detour_result import DetourResult
+from ra2ce.analysis.losses.routing_engine.routing_engine_protocol import (
+    RoutingEngineProtocol,
+)
+
+
+class NetworkxRoutingEngine(RoutingEngineProtocol):
+    """
+    Routing engine that temporarily removes each edge from the NetworkX graph
+    and searches the alternative route with `nx.single_source_dijkstra`.
+    """
+
+    graph: nx.MultiGraph
+    weighing: WeighingEnum
+
+    def __init__(self, graph: nx.MultiGraph, weighing: WeighingEnum) -> None:
+        self.graph = graph
+        self.weighing = weighing
+
+    def get_detours(
+        self, edges: list[tuple[Hashable, Hashable, Any]]
+    ) -> list[DetourResult]:
+        _detours = []
+        for u, v, k in edges:
+            _edge_data = self.graph.edges[u, v, k]
+
+            # remove the edge
+            self.graph.remove_edge(u, v, k)
+
+            _detour = DetourResult()
+            if nx.has_path(self.graph, u, v):
+                # calculate the alternative distance/time and path if that edge is unavailable
+                _alt_value, _alt_nodes = nx.single_source_dijkstra(
+                    self.graph, u, v, weight=self.weighing.config_value
+                )
+                _detour = DetourResult(
+                    alt_value=_alt_value, alt_nodes=_alt_nodes, connected=1
+                )
+            _detours.append(_detour)
+
+            # add edge again to the graph
+            self.graph.add_edge(u, v, k, **_edge_data)
+
+        return _detours
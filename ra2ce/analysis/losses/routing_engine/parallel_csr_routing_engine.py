@@ -0,0 +1,54 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from typing import Optional
+
+import numpy as np
+
+from ra2ce.analysis.losses.routing_engine.csr_graph import CsrGraph
+from ra2ce.analysis.losses.routing_engine.csr_routing_engine import CsrRoutingEngine
+from ra2ce.analysis.losses.routing_engine.shared_csr_graph import SharedCsrGraph
+
+# Graph attached by each worker process (see `_attach_worker`).
+_worker_graph: Optional[CsrGraph] = None
+_worker_shared_memories: list[SharedMemory] = []
+
+
+def _attach_worker(shared_graph: SharedCsrGraph) -> None:
+    global _worker_graph, _worker_shared_memories
+    _worker_graph, _worker_shared_memories = shared_graph.attach()
+
+
+def _search_detours_in_worker(tasks: np.ndarray) -> list[tuple[float, list[int]]]:
+    return CsrRoutingEngine.search_detours(_worker_graph, tasks)
+
+
+class ParallelCsrRoutingEngine(CsrRoutingEngine):
+    """
+    Routing engine that shards the detour searches of the `CsrRoutingEngine`
+    across a pool of worker processes.
+    The graph is placed once in shared memory, so it is not pickled per task,
+    and the results are reassembled in the original edge order.
+    """
+
+    n_workers: int
+
+    def __init__(self, csr_graph: CsrGraph, n_workers: int) -> None:
+        super().__init__(csr_graph)
+        self.n_workers = n_workers if n_workers > 0 else os.cpu_count()
+
+    def _search_detours(self, tasks: np.ndarray) -> list[tuple[float, list[int]]]:
+        if self.n_workers < 2 or len(tasks) < 2:
+            return super()._search_detours(tasks)
+
+        # More shards than workers to balance the (uneven) search times.
+        _shards = np.array_split(tasks, min(len(tasks), 4 * self.n_workers))
+        with SharedCsrGraph.from_csr_graph(self.csr_graph) as _shared_graph:
+            with ProcessPoolExecutor(
+                max_workers=self.n_workers,
+                initializer=_attach_worker,
+                initargs=(_shared_graph,),
+            ) as _executor:
+                _shard_results = list(_executor.map(_search_detours_in_worker, _shards))
+
+        return [_detour for _shard in _shard_results for _detour in _shard]
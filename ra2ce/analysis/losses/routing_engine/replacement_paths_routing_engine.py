@@ -0,0 +1,178 @@
+import numpy as np
+
+from ra2ce.analysis.losses.routing_engine.connectivity_utils import get_covering_nodes
+from ra2ce.analysis.losses.routing_engine.csr_routing_engine import CsrRoutingEngine
+
+
+class ReplacementPathsRoutingEngine(CsrRoutingEngine):
+    """
+    Routing engine that derives the alternative routes of all edges incident
+    to a node from a single shortest path tree rooted at that node (undirected graphs only).
+
+    Removing an edge (root, x) only affects the tree when it is the tree edge of x,
+    in which case the subtree of x gets detached. The alternative route then
+    enters that subtree through a single crossing edge (a, b), so its value is
+    `dist[a] + w(a, b) + dist[b] - dist[x]`, which is evaluated for all edges at once.
+    Edges not on the tree keep the tree route as alternative route.
+
+    As detours are mostly local the tree is bounded by a distance limit,
+    which is doubled until the alternative routes of all edges lie within it.
+    """
+
+    @staticmethod
+    def _get_branches(
+        root: int, distances: np.ndarray, predecessors: np.ndarray
+    ) -> np.ndarray:
+        # Child of the root each node descends from (-1 for the root and unreachable nodes).
+        _nodes = np.arange(len(predecessors))
+        _ancestors = np.where(
+            (predecessors < 0) | (predecessors == root), _nodes, predecessors
+        )
+        while True:
+            _next_ancestors = _ancestors[_ancestors]
+            if np.array_equal(_next_ancestors, _ancestors):
+                break
+            _ancestors = _next_ancestors
+        _ancestors[root] = -1
+        _ancestors[~np.isfinite(distances)] = -1
+        return _ancestors
+
+    def _get_crossing_edges(
+        self, root: int, distances: np.ndarray, branches: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Gets the best edge (a, b) entering each branch (subtree of a child of the root)
+        from outside, other than the edge(s) between the root and the child itself.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray, np.ndarray]: Value of the best alternative route and its nodes a and b, per branch.
+        """
+        _graph = self.csr_graph
+        # Only the adjacency entries of the nodes reached by the tree.
+        _reached = np.flatnonzero(np.isfinite(distances))
+        _starts = _graph.indptr[_reached]
+        _counts = _graph.indptr[_reached + 1] - _starts
+        _entries = np.arange(_counts.sum()) + np.repeat(
+            _starts - np.r_[0, np.cumsum(_counts)[:-1]], _counts
+        )
+        _a = np.repeat(_reached, _counts)
+        _b = _graph.indices[_entries]
+        _branch_b = branches[_b]
+        _is_crossing = (
+            (_branch_b >= 0)
+            & (branches[_a] != _branch_b)
+            & ~((_a == root) & (_b == _branch_b))
+        )
+        _a, _b, _branch_b = _a[_is_crossing], _b[_is_crossing], _branch_b[_is_crossing]
+        _values = (
+            distances[_a]
+            + _graph.weights[_entries[_is_crossing]]
+            + distances[_b]
+            - distances[_branch_b]
+        )
+
+        _best_values = np.full(len(_graph.nodes), np.inf)
+        _best_a = np.full(len(_graph.nodes), -1)
+        _best_b = np.full(len(_graph.nodes), -1)
+        if not len(_values):
+            return _best_values, _best_a, _best_b
+
+        _order = np.lexsort((_values, _branch_b))
+        _branch_sorted = _branch_b[_order]
+        _first = _order[
+            np.flatnonzero(np.r_[True, _branch_sorted[1:] != _branch_sorted[:-1]])
+        ]
+        _best_values[_branch_b[_first]] = _values[_first]
+        _best_a[_branch_b[_first]] = _a[_first]
+        _best_b[_branch_b[_first]] = _b[_first]
+        return _best_values, _best_a, _best_b
+
+    def _search_root_detours(
+        self, root: int, tasks: np.ndarray
+    ) -> list[tuple[float, list[int]]]:
+        _graph = self.csr_graph
+        _found_detours = [None] * len(tasks)
+        _pending = list(range(len(tasks)))
+
+        # Detours are mostly local, so the tree starts bounded around the edge weights.
+        # A detour of value D only uses nodes within distance D of the root,
+        # so it is exact once it does not exceed the limit of the tree.
+        _limit = 2 * _graph.weights[_graph.edge_entries[tasks[:, 2], 0]].max()
+        while _pending:
+            if _limit >= _graph.max_distance or not _limit > 0:
+                _limit = np.inf
+            _distances, _predecessors = _graph.get_shortest_paths(
+                root, initial_limit=_limit
+            )
+            _crossing = None
+            _still_pending = []
+            for _task_id in _pending:
+                _source, _target, _edge_id = tasks[_task_id]
+                _other = _target if _source == root else _source
+                _masked_weight = _graph.edge_masked_weights[_edge_id]
+                _is_tree_edge = (
+                    _predecessors[_other] == root
+                    and _masked_weight
+                    > _graph.weights[_graph.edge_entries[_edge_id, 0]]
+                )
+                if not _is_tree_edge:
+                    # The tree does not use the edge, so its route remains the shortest.
+                    _found_detours[_task_id] = (
+                        float(_distances[_other]),
+                        _graph.get_path(_predecessors, root, _other),
+                    )
+                    continue
+
+                if _crossing is None:
+                    _crossing = self._get_crossing_edges(
+                        root,
+                        _distances,
+                        self._get_branches(root, _distances, _predecessors),
+                    )
+                _best_values, _best_a, _best_b = _crossing
+                _alt_value = min(_masked_weight, _best_values[_other])
+                if _alt_value > _limit:
+                    _still_pending.append(_task_id)
+                    continue
+
+                if not np.isfinite(_alt_value):
+                    _found_detours[_task_id] = (np.inf, [])
+                elif _masked_weight <= _best_values[_other]:
+                    # A parallel edge is the best alternative.
+                    _found_detours[_task_id] = (float(_alt_value), [root, _other])
+                else:
+                    _path = _graph.get_path(_predecessors, root, _best_a[_other])
+                    _node = _best_b[_other]
+                    while _node != _other:
+                        _path.append(int(_node))
+                        _node = _predecessors[_node]
+                    _path.append(int(_other))
+                    _found_detours[_task_id] = (float(_alt_value), _path)
+
+            _pending = _still_pending
+            _limit *= 2
+
+        # Routes were searched from the root, they are returned from the source.
+        return [
+            (_alt_value, _path if _source == root else _path[::-1])
+            for (_source, _, _), (_alt_value, _path) in zip(tasks, _found_detours)
+        ]
+
+    def _search_detours(self, tasks: np.ndarray) -> list[tuple[float, list[int]]]:
+        _found_detours = [None] * len(tasks)
+        if not len(tasks):
+            return _found_detours
+
+        # Few trees are needed when the edges are covered by their most shared end nodes.
+        _roots = get_covering_nodes(tasks[:, :2])
+        _order = np.argsort(_roots, kind="stable")
+        _root_starts = np.flatnonzero(
+            np.r_[True, _roots[_order][1:] != _roots[_order][:-1]]
+        )
+        for _task_ids in np.split(_order, _root_starts[1:]):
+            _root = _roots[_task_ids[0]]
+            for _task_id, _detour in zip(
+                _task_ids, self._search_root_detours(_root, tasks[_task_ids])
+            ):
+                _found_detours[_task_id] = _detour
+        return _found_detours
@@ -0,0 +1,73 @@
+import logging
+
+import networkx as nx
+
+from ra2ce.analysis.analysis_config_data.enums.routing_engine_enum import (
+    RoutingEngineEnum,
+)
+from ra2ce.analysis.analysis_config_data.enums.weighing_enum import WeighingEnum
+from ra2ce.analysis.losses.routing_engine.csr_graph import CsrGraph
+from ra2ce.analysis.losses.routing_engine.csr_routing_engine import CsrRoutingEngine
+from ra2ce.analysis.losses.routing_engine.networkx_routing_engine import (
+    NetworkxRoutingEngine,
+)
+from ra2ce.analysis.losses.routing_engine.parallel_csr_routing_engine import (
+    ParallelCsrRoutingEngine,
+)
+from ra2ce.analysis.losses.routing_engine.replacement_paths_routing_engine import (
+    ReplacementPathsRoutingEngine,
+)
+from ra2ce.analysis.losses.routing_engine.routing_engine_protocol import (
+    RoutingEngineProtocol,
+)
+
+
+class RoutingEngineFactory:
+    @staticmethod
+    def get_engine(
+        routing_engine: RoutingEngineEnum,
+        graph: nx.MultiGraph,
+        weighing: WeighingEnum,
+        n_workers: int = 1,
+    ) -> RoutingEngineProtocol:
+        """
+        Gets the routing engine to search alternative routes on the given graph.
+        When no engine is configured the NetworkX engine is used.
+
+        Args:
+            routing_engine (RoutingEngineEnum): Configured routing engine.
+            graph (nx.MultiGraph): Graph to route on.
+            weighing (WeighingEnum): Weighing used as edge weight.
+            n_workers (int, optional): Number of worker processes (< 1 for all cores),
+                only supported by the CSR engine. Defaults to 1.
+
+        Raises:
+            NotImplementedError: When the routing engine is not supported.
+
+        Returns:
+            RoutingEngineProtocol: The routing engine.
+        """
+        if routing_engine != RoutingEngineEnum.CSR and n_workers != 1:
+            logging.warning(
+                "Parallel execution (n_workers = %s) requires `routing_engine = csr`, running serially.",
+                n_workers,
+            )
+        if routing_engine in [RoutingEngineEnum.NONE, RoutingEngineEnum.NETWORKX]:
+            return NetworkxRoutingEngine(graph, weighing)
+        if routing_engine == RoutingEngineEnum.CSR:
+            _csr_graph = CsrGraph.from_graph(graph, weighing.config_value)
+            if n_workers != 1:
+                return ParallelCsrRoutingEngine(_csr_graph, n_workers)
+            return CsrRoutingEngine(_csr_graph)
+        if routing_engine == RoutingEngineEnum.REPLACEMENT_PATHS:
+            _csr_graph = CsrGraph.from_graph(graph, weighing.config_value)
+            if graph.is_directed():
+                logging.warning(
+                    "The replacement paths routing engine requires an undirected graph, using `routing_engine = csr` instead."
+                )
+                return CsrRoutingEngine(_csr_graph)
+            return ReplacementPathsRoutingEngine(_csr_graph)
+
+        raise NotImplementedError(
+            "Routing engine {} not yet supported.".format(routing_engine)
+        )
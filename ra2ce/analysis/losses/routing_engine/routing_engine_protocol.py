@@ -0,0 +1,20 @@
+from typing import Any, Hashable, Protocol, runtime_checkable
+
+from ra2ce.analysis.losses.routing_engine.detour_result import DetourResult
+
+
+@runtime_checkable
+class RoutingEngineProtocol(Protocol):
+    def get_detours(
+        self, edges: list[tuple[Hashable, Hashable, Any]]
+    ) -> list[DetourResult]:
+        """
+        Gets the alternative route for each of the given edges when (only) that edge is unavailable.
+        The graph the engine was created with is left untouched.
+
+        Args:
+            edges (list[tuple[Hashable, Hashable, Any]]): Edges (u, v, key) to disrupt one at a time.
+
+        Returns:
+            list[DetourResult]: Alternative route for each edge, in the same order as `edges`.
+        """
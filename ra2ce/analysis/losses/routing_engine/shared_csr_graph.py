@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from multiprocessing.shared_memory import SharedMemory
+from typing import Iterator
+
+import numpy as np
+
+from ra2ce.analysis.losses.routing_engine.csr_graph import CsrGraph
+
+_SHARED_ARRAYS = [
+    "indptr",
+    "indices",
+    "weights",
+    "edge_entries",
+    "edge_masked_weights",
+]
+
+
+@dataclass
+class SharedCsrGraph:
+    """
+    Reference to the arrays of a `CsrGraph` placed in shared memory,
+    so (worker) processes can attach to the graph without it being pickled.
+
+    Only the arrays are shared, the attached graph identifies nodes and edges by their index.
+    """
+
+    n_nodes: int
+    arrays: dict[str, tuple[str, tuple[int, ...], str]] = field(default_factory=dict)
+
+    @classmethod
+    @contextmanager
+    def from_csr_graph(cls, csr_graph: CsrGraph) -> Iterator[SharedCsrGraph]:
+        """
+        Copies the arrays of the graph into shared memory,
+        which is released when leaving the context.
+
+        Args:
+            csr_graph (CsrGraph): Graph to share.
+
+        Yields:
+            Iterator[SharedCsrGraph]: Reference to the shared graph.
+        """
+        _shared_graph = cls(n_nodes=len(csr_graph.nodes))
+        _shared_memories = []
+        try:
+            for _name in _SHARED_ARRAYS:
+                _array = getattr(csr_graph, _name)
+                _shared_memory = SharedMemory(create=True, size=max(_array.nbytes, 1))
+                _shared_memories.append(_shared_memory)
+                np.ndarray(_array.shape, _array.dtype, buffer=_shared_memory.buf)[
+                    :
+                ] = _array
+                _shared_graph.arrays[_name] = (
+                    _shared_memory.name,
+                    _array.shape,
+                    _array.dtype.str,
+                )
+            yield _shared_graph
+        finally:
+            for _shared_memory in _shared_memories:
+                _shared_memory.close()
+                _shared_memory.unlink()
+
+    def attach(self) -> tuple[CsrGraph, list[SharedMemory]]:
+        """
+        Attaches to the shared arrays.
+        The weights are copied, as they are masked while searching detours.
+        The returned shared memory handles need to be kept alive as long as the graph is used.
+
+        Returns:
+            tuple[CsrGraph, list[SharedMemory]]: The attached graph and its shared memory handles.
+        """
+        _shared_memories = []
+        _arrays = {}
+        for _name, (_memory_name, _shape, _dtype) in self.arrays.items():
+            _shared_memory = SharedMemory(name=_memory_name)
+            _shared_memories.append(_shared_memory)
+            _arrays[_name] = np.ndarray(_shape, _dtype, buffer=_shared_memory.buf)
+        _arrays["weights"] = _arrays["weights"].copy()
+
+        return (
+            CsrGraph(nodes=list(range(self.n_nodes)), edges=[], **_arrays),
+            _shared_memories,
+        )
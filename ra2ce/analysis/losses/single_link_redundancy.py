@@ -1,6 +1,6 @@
+import logging
 from pathlib import Path
 
-import networkx as nx
 import numpy as np
 import osmnx
 from geopandas import GeoDataFrame
@@ -9,7 +9,13 @@ from ra2ce.analysis.analysis_config_data.analysis_config_data import (
     AnalysisSectionLosses,
 )
 from ra2ce.analysis.analysis_input_wrapper import AnalysisInputWrapper
+from ra2ce.analysis.analysis_result_accumulator import AnalysisResultAccumulator
 from ra2ce.analysis.losses.analysis_losses_protocol import AnalysisLossesProtocol
+from ra2ce.analysis.losses.routing_engine.connectivity_utils import get_bridges
+from ra2ce.analysis.losses.routing_engine.detour_result import DetourResult
+from ra2ce.analysis.losses.routing_engine.routing_engine_factory import (
+    RoutingEngineFactory,
+)
 from ra2ce.analysis.losses.weighing_analysis.weighing_analysis_factory import (
     WeighingAnalysisFactory,
 )
@@ -48,56 +54,72 @@ class SingleLinkRedundancy(AnalysisLossesProtocol):
         # create a geodataframe from the graph
         _gdf_graph = osmnx.graph_to_gdfs(self.graph_file.get_graph(), nodes=False)
 
-        # list for the length of the alternative routes
+        # list for the current value of the edges
         _current_value_list = []
-        _alt_value_list = []
-        _alt_nodes_list = []
-        _diff_value_list = []
-        _detour_exist_list = []
 
         _weighing_analyser = WeighingAnalysisFactory.get_analysis(
             self.analysis.weighing
         )
 
-        # Loop over all edges to temporarily remove them and calculate the alternative route
+        # Get the current value of all edges (completing missing weights in the graph)
+        _edges_remove = []
         for e_remove in list(self.graph_file.graph.edges.data(keys=True)):
             u, v, k, _weighing_analyser.edge_data = e_remove
-            _current_value = _weighing_analyser.get_current_value()
-
-            # remove the edge
-            self.graph_file.graph.remove_edge(u, v, k)
-
-            _alt_value, _alt_nodes, _connected, _diff = np.nan, np.nan, 0, np.nan
-            if nx.has_path(self.graph_file.graph, u, v):
-
-                # calculate the alternative distance/time and path if that edge is unavailable
-                [_alt_value, _alt_nodes] = nx.single_source_dijkstra(
-                    self.graph_file.graph,
-                    u,
-                    v,
-                    weight=self.analysis.weighing.config_value,
-                )
+            _current_value_list.append(_weighing_analyser.get_current_value())
+            _edges_remove.append((u, v, k))
+
+        # Bridges have no alternative route, so there is no need to search for it
+        _bridges = get_bridges(self.graph_file.graph)
+        logging.info(
+            "%s of %s edges are bridges without alternative route, their detour search is skipped.",
+            len(_bridges),
+            len(_edges_remove),
+        )
 
+        # Calculate the alternative route of each edge if that edge is unavailable
+        _routing_engine = RoutingEngineFactory.get_engine(
+            self.analysis.routing_engine,
+            self.graph_file.graph,
+            self.analysis.weighing,
+            self.analysis.n_workers,
+        )
+        _found_detours = iter(
+            _routing_engine.get_detours([e for e in _edges_remove if e not in _bridges])
+        )
+        _detours = [
+            DetourResult() if e in _bridges else next(_found_detours)
+            for e in _edges_remove
+        ]
+
+        _results = AnalysisResultAccumulator(
+            [
+                self.analysis.weighing.config_value,
+                f"alt_{self.analysis.weighing.config_value}",
+                "alt_nodes",
+                f"diff_{self.analysis.weighing.config_value}",
+                "detour",
+            ]
+        )
+        for _current_value, _detour in zip(_current_value_list, _detours):
+            _diff = np.nan
+            if _detour.connected:
                 # calculate the difference in distance
-                _diff = round(_alt_value - _current_value, 3)
-
-                _connected = 1
-
-            _current_value_list.append(_current_value)
-            _alt_value_list.append(_alt_value)
-            _alt_nodes_list.append(_alt_nodes)
-            _diff_value_list.append(_diff)
-            _detour_exist_list.append(_connected)
-
-            # add edge again to the graph
-            self.graph_file.graph.add_edge(u, v, k, **_weighing_analyser.edge_data)
+                _diff = round(_detour.alt_value - _current_value, 3)
+
+            _results.add_row(
+                {
+                    self.analysis.weighing.config_value: _current_value,
+                    f"alt_{self.analysis.weighing.config_value}": _detour.alt_value,
+                    "alt_nodes": _detour.alt_nodes,
+                    f"diff_{self.analysis.weighing.config_value}": _diff,
+                    "detour": _detour.connected,
+                }
+            )
 
         # Add the updated/new columns to the geodataframe
-        _gdf_graph[self.analysis.weighing.config_value] = _current_value_list
-        _gdf_graph[f"alt_{self.analysis.weighing.config_value}"] = _alt_value_list
-        _gdf_graph["alt_nodes"] = _alt_nodes_list
-        _gdf_graph[f"diff_{self.analysis.weighing.config_value}"] = _diff_value_list
-        _gdf_graph["detour"] = _detour_exist_list
+        _results_df = _results.to_dataframe(index=_gdf_graph.index)
+        for _column in _results.columns:
+            _gdf_graph[_column] = _results_df[_column]
 
         # Extra calculation possible (like multiplying the disruption time with the cost for disruption)
         # todo: input here this option
@@ -1,3 +1,6 @@
+from ra2ce.analysis.losses.traffic_analysis.route_link_incidence import (
+    RouteLinkIncidence,
+)
 from ra2ce.analysis.losses.traffic_analysis.traffic_analysis_base import (
     TrafficAnalysisBase,
 )
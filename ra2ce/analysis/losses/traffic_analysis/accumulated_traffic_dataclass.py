@@ -23,15 +23,21 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Union
 
+import numpy as np
+
 
 @dataclass
 class AccumulatedTraffic:
-    utilitarian: float = 0.0
-    egalitarian: float = 0.0
-    prioritarian: float = 0.0
+    """
+    Traffic values, either of a single route / link (`float`) or of several at once (`np.ndarray`).
+    """
+
+    utilitarian: Union[float, np.ndarray] = 0.0
+    egalitarian: Union[float, np.ndarray] = 0.0
+    prioritarian: Union[float, np.ndarray] = 0.0
 
     def __add__(
-        self, other: Union[AccumulatedTraffic, float, int]
+        self, other: Union[AccumulatedTraffic, float, int, np.ndarray]
     ) -> AccumulatedTraffic:
         """
         Overloading of the add (`operator.add` or simply `+`).
@@ -43,7 +49,7 @@ class AccumulatedTraffic:
                 prioritarian=self.prioritarian + other.prioritarian,
                 egalitarian=self.egalitarian + other.egalitarian,
             )
-        elif isinstance(other, float) or isinstance(other, int):
+        elif isinstance(other, (float, int, np.ndarray)):
             return AccumulatedTraffic(
                 utilitarian=self.utilitarian + other,
                 prioritarian=self.prioritarian + other,
@@ -56,7 +62,7 @@ class AccumulatedTraffic:
         )
 
     def __mul__(
-        self, other: Union[AccumulatedTraffic, float, int]
+        self, other: Union[AccumulatedTraffic, float, int, np.ndarray]
     ) -> AccumulatedTraffic:
         """
         Overloading of the multiply (`operator.mul` or simply `*`).
@@ -68,7 +74,7 @@ class AccumulatedTraffic:
                 prioritarian=self.prioritarian * other.prioritarian,
                 egalitarian=self.egalitarian * other.egalitarian,
             )
-        elif isinstance(other, float) or isinstance(other, int):
+        elif isinstance(other, (float, int, np.ndarray)):
             return AccumulatedTraffic(
                 utilitarian=self.utilitarian * other,
                 prioritarian=self.prioritarian * other,
@@ -19,6 +19,8 @@
     along with this program.  If not, see <http://www.gnu.org/licenses/>.
 """
 
+from __future__ import annotations
+
 import geopandas as gpd
 import numpy as np
 import pandas as pd
@@ -71,7 +73,7 @@ class EquityAnalysis(TrafficAnalysisBase):
         )
 
     def _get_accumulated_traffic_from_node(
-        self, o_node: str, total_d_nodes: int
+        self, o_node: str | np.ndarray, total_d_nodes: int
     ) -> AccumulatedTraffic:
         _accumulated_traffic = AccumulatedTraffic(egalitarian=1)
         _accumulated_traffic.utilitarian = self._get_recorded_traffic_in_node(
@@ -83,26 +85,10 @@ class EquityAnalysis(TrafficAnalysisBase):
         return _accumulated_traffic
 
     def _get_route_traffic(
-        self, traffic_data: dict[str, AccumulatedTraffic]
+        self, links: pd.DataFrame, traffic: AccumulatedTraffic
     ) -> pd.DataFrame:
-        def convert_to_df(dict_item: tuple[str, AccumulatedTraffic]):
-            node_id, traffic_values = dict_item
-            u_node, v_node = self._get_key_nodes(node_id)
-            return (
-                u_node,
-                v_node,
-                traffic_values.utilitarian,
-                traffic_values.egalitarian,
-                traffic_values.prioritarian,
-            )
-
-        return pd.DataFrame(
-            map(convert_to_df, traffic_data.items()),
-            columns=[
-                "u",
-                "v",
-                "traffic",
-                "traffic_egalitarian",
-                "traffic_prioritarian",
-            ],
+        return links.assign(
+            traffic=traffic.utilitarian,
+            traffic_egalitarian=traffic.egalitarian,
+            traffic_prioritarian=traffic.prioritarian,
         )
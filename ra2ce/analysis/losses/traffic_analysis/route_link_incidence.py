@@ -0,0 +1,131 @@
+"""                    GNU GENERAL PUBLIC LICENSE
+                      Version 3, 29 June 2007
+
+    Risk Assessment and Adaptation for Critical Infrastructure (RA2CE).
+    Copyright (C) 2023 Stichting Deltares
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+from __future__ import annotations
+
+import ast
+import itertools
+import logging
+from dataclasses import dataclass
+
+import geopandas as gpd
+import numpy as np
+import pandas as pd
+from scipy.sparse import csr_matrix
+
+
+@dataclass
+class RouteLinkIncidence:
+    """
+    Sparse (CSR) route x link incidence matrix of the optimal routes
+    (as found by `OptimalRouteOriginDestination.find_route_ods`),
+    counting how often each route passes each link.
+
+    It is built once, after which the link loads of any weighting of the routes
+    (e.g. their traffic or the traffic of an equity weight scenario) are a single
+    sparse matrix-vector product.
+    """
+
+    links: pd.DataFrame
+    origins: np.ndarray
+    nr_destinations: np.ndarray
+    matrix: csr_matrix
+
+    @classmethod
+    def from_routes(cls, road_network: gpd.GeoDataFrame) -> RouteLinkIncidence:
+        """
+        Builds the incidence matrix of the given optimal routes.
+        Routes departing from a list of origin nodes are skipped.
+
+        Args:
+            road_network (gpd.GeoDataFrame): Optimal routes, with their `origin`, `destination` and `opt_path`.
+
+        Returns:
+            RouteLinkIncidence: Incidence matrix with a row per (non-skipped) route and a column per link `(u, v)`, in order of first appearance.
+        """
+        _is_origin_list = road_network["origin"].str.contains(",", regex=False)
+        if _is_origin_list.any():
+            logging.error(
+                "List of nodes as 'origin node' is not accepted and will be skipped."
+            )
+        _routes = road_network[~_is_origin_list]
+
+        # Hops (links) of all routes, each with the route it belongs to.
+        _opt_paths = [
+            _opt_path if isinstance(_opt_path, list) else ast.literal_eval(_opt_path)
+            for _opt_path in _routes["opt_path"]
+        ]
+        _path_lengths = np.array(list(map(len, _opt_paths)), dtype=int)
+        _path_nodes = np.array(list(itertools.chain.from_iterable(_opt_paths)))
+        _hop_routes = np.repeat(
+            np.arange(len(_opt_paths)), np.maximum(_path_lengths - 1, 0)
+        )
+        _is_hop_start = np.ones(len(_path_nodes), dtype=bool)
+        _is_hop_start[np.cumsum(_path_lengths)[_path_lengths > 0] - 1] = False
+        _hop_starts = np.flatnonzero(_is_hop_start)
+        _hops = pd.DataFrame(
+            {
+                "u": list(map(str, _path_nodes[_hop_starts])),
+                "v": list(map(str, _path_nodes[_hop_starts + 1])),
+            }
+        )
+        _hop_links, _links = pd.MultiIndex.from_frame(_hops).factorize()
+
+        # Duplicate entries (a route passing a link more than once) are summed.
+        _matrix = csr_matrix(
+            (np.ones(len(_hop_links)), (_hop_routes, _hop_links)),
+            shape=(len(_routes), len(_links)),
+        )
+        return cls(
+            links=_links.to_frame(index=False, name=["u", "v"]),
+            origins=_routes["origin"].to_numpy(),
+            nr_destinations=_routes["destination"].str.count(",").to_numpy() + 1,
+            matrix=_matrix,
+        )
+
+    def get_route_weights(self, origin_weights: pd.Series) -> np.ndarray:
+        """
+        Gets the weight of each route from the weight of a single trip of its origin,
+        multiplied by the number of destinations the route leads to.
+
+        Args:
+            origin_weights (pd.Series): Weight of a trip, indexed by the origin node (`o_id`).
+
+        Returns:
+            np.ndarray: Weight of each route (`NaN` for origins without weight).
+        """
+        return (
+            origin_weights.reindex(self.origins).to_numpy(dtype=float)
+            * self.nr_destinations
+        )
+
+    def get_link_loads(self, route_weights: np.ndarray | float) -> np.ndarray:
+        """
+        Gets the load of each link, the sum of the weights of the routes passing it.
+
+        Args:
+            route_weights (np.ndarray | float): Weight of each route, or a single weight for all routes.
+
+        Returns:
+            np.ndarray: Load of each link (in the order of `links`).
+        """
+        return self.matrix.T @ np.broadcast_to(
+            np.asarray(route_weights, dtype=float), self.matrix.shape[0]
+        )
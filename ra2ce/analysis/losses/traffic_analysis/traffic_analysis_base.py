@@ -19,11 +19,9 @@
     along with this program.  If not, see <http://www.gnu.org/licenses/>.
 """
 
-import ast
-import itertools
-import logging
+from __future__ import annotations
+
 from abc import ABC, abstractmethod
-from collections import defaultdict
 
 import geopandas as gpd
 import numpy as np
@@ -32,6 +30,9 @@ import pandas as pd
 from ra2ce.analysis.losses.traffic_analysis.accumulated_traffic_dataclass import (
     AccumulatedTraffic,
 )
+from ra2ce.analysis.losses.traffic_analysis.route_link_incidence import (
+    RouteLinkIncidence,
+)
 
 
 class TrafficAnalysisBase(ABC):
@@ -45,68 +46,57 @@ class TrafficAnalysisBase(ABC):
         """
         Gets the optimal routes based on utilitarian, egalitarian and prioritarian traffic.
 
+        The traffic of all routes is calculated at once, after which the traffic
+        of each link is accumulated with the route-link incidence matrix.
+
         Returns:
             pd.DataFrame: Datafarme with the traffic indices for each of analysis.
         """
         unique_destination_nodes = np.unique(list(self.od_table["d_id"].fillna("0")))
         count_destination_nodes = len([x for x in unique_destination_nodes if x != "0"])
 
-        _traffic = defaultdict(AccumulatedTraffic)
-        for _, _road_network_row in self.road_network.iterrows():
-            o_node, d_node = (
-                _road_network_row["origin"],
-                _road_network_row["destination"],
-            )
-            if "," in o_node:
-                logging.error(
-                    "List of nodes as 'origin node' is not accepted and will be skipped."
-                )
-                continue
-            opt_path = self._get_opt_path_values(_road_network_row)
-            for u_node, v_node in itertools.pairwise(opt_path):
-                _nodes_key_name = self._get_node_key(u_node, v_node)
-                _calculated_traffic = self._get_accumulated_traffic_from_node(
-                    o_node, count_destination_nodes
-                )
-
-                if "," in d_node:
-                    _calculated_traffic *= len(d_node.split(","))
-
-                _traffic[_nodes_key_name] += _calculated_traffic
-
-        return self._get_route_traffic(_traffic)
+        _incidence = RouteLinkIncidence.from_routes(self.road_network)
 
-    def _get_node_key(self, u_node: str, v_node: str) -> str:
-        return f"{u_node}_{v_node}"
-
-    def _get_key_nodes(self, node_key: str) -> tuple[str, str]:
-        return node_key.split("_")
-
-    def _get_opt_path_values(self, _road_network_row: pd.Series) -> list[int]:
-        _opt_path_value = _road_network_row["opt_path"]
-        if isinstance(_opt_path_value, list):
-            return _opt_path_value
-        return ast.literal_eval(_opt_path_value)
+        # Traffic of each route, from its origin to each of its destinations.
+        _route_traffic = (
+            self._get_accumulated_traffic_from_node(
+                _incidence.origins, count_destination_nodes
+            )
+            * _incidence.nr_destinations
+        )
+        _traffic = AccumulatedTraffic(
+            utilitarian=_incidence.get_link_loads(_route_traffic.utilitarian),
+            egalitarian=_incidence.get_link_loads(_route_traffic.egalitarian),
+            prioritarian=_incidence.get_link_loads(_route_traffic.prioritarian),
+        )
+        return self._get_route_traffic(_incidence.links.copy(), _traffic)
 
     def _get_recorded_traffic_in_node(
-        self, origin_node: str, column_name: str, count_destination_nodes: int
-    ) -> float:
-        return (
-            self.od_table.loc[
-                self.od_table["o_id"] == origin_node,
-                column_name,
-            ].values[0]
+        self,
+        origin_node: str | np.ndarray,
+        column_name: str,
+        count_destination_nodes: int,
+    ) -> float | np.ndarray:
+        # The recorded traffic of (an array of) origin nodes, looked up at once.
+        _recorded_traffic = (
+            self.od_table.drop_duplicates("o_id")
+            .set_index("o_id")[column_name]
+            .reindex(np.atleast_1d(origin_node))
+            .to_numpy()
             / count_destination_nodes
         )
+        if np.ndim(origin_node):
+            return _recorded_traffic
+        return _recorded_traffic[0]
 
     @abstractmethod
     def _get_accumulated_traffic_from_node(
-        self, target_node: str, total_d_nodes: int
+        self, target_node: str | np.ndarray, total_d_nodes: int
     ) -> AccumulatedTraffic:
         raise NotImplementedError("Should be implemented in concrete class.")
 
     @abstractmethod
     def _get_route_traffic(
-        self, traffic_data_wrapper: dict[str, AccumulatedTraffic]
+        self, links: pd.DataFrame, traffic: AccumulatedTraffic
     ) -> pd.DataFrame:
         raise NotImplementedError("Should be implemented in concrete class.")
@@ -25,6 +25,9 @@ import geopandas as gpd
 import pandas as pd
 
 from ra2ce.analysis.losses.traffic_analysis.equity_analysis import EquityAnalysis
+from ra2ce.analysis.losses.traffic_analysis.route_link_incidence import (
+    RouteLinkIncidence,
+)
 from ra2ce.analysis.losses.traffic_analysis.traffic_analysis import TrafficAnalysis
 from ra2ce.analysis.losses.traffic_analysis.traffic_analysis_base import (
     TrafficAnalysisBase,
@@ -57,6 +60,23 @@ class TrafficAnalysisFactory:
             )
         return TrafficAnalysis(road_network, od_table, destination_names)
 
+    @staticmethod
+    def get_route_link_incidence(
+        road_network: gpd.GeoDataFrame,
+    ) -> RouteLinkIncidence:
+        """
+        Gets the sparse route x link incidence matrix of the optimal routes, so the
+        link loads of several (equity) weightings of the same routes can be calculated
+        without repeating the traffic analysis.
+
+        Args:
+            road_network (gpd.GeoDataFrame): Optimal routes, with their `origin`, `destination` and `opt_path`.
+
+        Returns:
+            RouteLinkIncidence: Incidence matrix of the routes and their links.
+        """
+        return RouteLinkIncidence.from_routes(road_network)
+
     @staticmethod
     def read_equity_weights(equity_weight_file: Path) -> pd.DataFrame:
         """
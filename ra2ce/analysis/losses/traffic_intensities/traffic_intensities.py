@@ -15,6 +15,11 @@
     along with this program.  If not, see <http://www.gnu.org/licenses/>.
 """
 from dataclasses import dataclass, field
+from functools import cached_property
+from itertools import chain
+
+import numpy as np
+import pandas as pd
 
 from ra2ce.analysis.analysis_config_data.enums.traffic_period_enum import (
     TrafficPeriodEnum,
@@ -26,23 +31,34 @@ from ra2ce.analysis.analysis_config_data.enums.trip_purpose_enum import TripPurp
 class TrafficIntensities:
     """
     Class to store the traffic intensities per day for different trip types.
+
+    The intensities of each traffic period and trip purpose are stored as an
+    array (float32 when read from file) with a row per link id.
+    Links are looked up through a hash index of the link ids, which is built
+    at the first lookup (so the link ids should not change afterwards).
     """
 
     link_id: list[int | tuple[int, int]] = field(default_factory=list)
-    intensities: dict[tuple[TrafficPeriodEnum, TripPurposeEnum], list[int]] = field(
-        default_factory=dict
-    )
+    intensities: dict[
+        tuple[TrafficPeriodEnum, TripPurposeEnum], np.ndarray | list[int]
+    ] = field(default_factory=dict)
+
+    @cached_property
+    def _link_index(self) -> tuple[pd.Index, np.ndarray]:
+        # Index of the (first occurrence of the) link ids, and their row.
+        _link_ids = pd.Index(self.link_id, tupleize_cols=False)
+        _rows = np.flatnonzero(~_link_ids.duplicated())
+        return _link_ids[_rows], _rows
 
     def calculate_intensity(
         self,
         link_id: int | tuple[int, int],
         traffic_period: TrafficPeriodEnum,
         trip_purpose: TripPurposeEnum,
-    ) -> int:
+    ) -> float:
         """
         Calculate the traffic intensity per traffic period for a specific link
         for a trip purpose.
-
         For a simplified graph, the link_id could be a tuple of link_ids.
         In that case the maximum intensity of the links is returned.
 
@@ -52,13 +68,49 @@ class TrafficIntensities:
             trip_purpose (TripPurposeEnum): Trip purpose
 
         Returns:
-            int: The intensity for that (set of) link(s) (vehicles per traffic period)
+            float: The intensity for that (set of) link(s) (vehicles per traffic period)
         """
-        if isinstance(link_id, tuple):
-            return max(
-                self.calculate_intensity(_id, traffic_period, trip_purpose)
-                for _id in link_id
-            )
-        return self.intensities[(traffic_period, trip_purpose)][
-            self.link_id.index(link_id)
+        return self.calculate_intensities([link_id], traffic_period, trip_purpose)[0]
+
+    def calculate_intensities(
+        self,
+        link_ids: list[int | tuple[int, int]],
+        traffic_period: TrafficPeriodEnum,
+        trip_purpose: TripPurposeEnum,
+    ) -> np.ndarray:
+        """
+        Calculate the traffic intensities per traffic period for multiple links
+        for a trip purpose at once.
+        For a simplified graph, a link_id could be a tuple of link_ids.
+        In that case the maximum intensity of the links is returned.
+
+        Args:
+            link_ids (list[int | tuple[int, int]]): The link id(s) of each link
+            traffic_period (TrafficPeriodEnum): Part of the day
+            trip_purpose (TripPurposeEnum): Trip purpose
+
+        Returns:
+            np.ndarray: The intensity for each (set of) link(s) (vehicles per traffic period)
+        """
+        _intensities = np.asarray(self.intensities[(traffic_period, trip_purpose)])
+        if not len(link_ids):
+            return _intensities[:0]
+
+        _link_ids = [
+            _link_id if isinstance(_link_id, tuple) else (_link_id,)
+            for _link_id in link_ids
         ]
+        _segment_lengths = np.fromiter(map(len, _link_ids), dtype=int)
+        _index, _index_rows = self._link_index
+        _flat_link_ids = list(chain.from_iterable(_link_ids))
+        _positions = _index.get_indexer(pd.Index(_flat_link_ids, tupleize_cols=False))
+        if (_positions < 0).any():
+            raise ValueError(
+                f"No traffic intensities found for link {_flat_link_ids[np.flatnonzero(_positions < 0)[0]]}"
+            )
+
+        # Maximum intensity of each segment (tuple) of link ids.
+        return np.maximum.reduceat(
+            _intensities[_index_rows[_positions]],
+            np.cumsum(_segment_lengths) - _segment_lengths,
+        )
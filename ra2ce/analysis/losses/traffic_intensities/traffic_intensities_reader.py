@@ -17,6 +17,7 @@
 import re
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 
 from ra2ce.analysis.analysis_config_data.enums.traffic_period_enum import (
@@ -44,18 +45,19 @@ class TrafficIntensitiesReader(LossesInputDataReaderBase):
         self.csv_columns = [link_id]
 
     def _parse_df(self, df: pd.DataFrame) -> TrafficIntensities:
-        _traffic_intensities = TrafficIntensities()
+        _link_id = []
+        _intensities = {}
         for col in df:
             if col == self.csv_columns[0]:
-                _traffic_intensities.link_id = df[col].tolist()
+                _link_id = df[col].tolist()
                 continue
             _col_parts = re.findall(r"(.+)_(\w+)", col)  # split on last underscore
             _traffic_period = TrafficPeriodEnum.get_enum(_col_parts[0][0])
             _trip_purpose = TripPurposeEnum.get_enum(_col_parts[0][1])
-            _traffic_intensities.intensities[(_traffic_period, _trip_purpose)] = df[
-                col
-            ].tolist()
-        return _traffic_intensities
+            _intensities[(_traffic_period, _trip_purpose)] = df[col].to_numpy(
+                dtype=np.float32
+            )
+        return TrafficIntensities(link_id=_link_id, intensities=_intensities)
 
     def read(self, file_path: Path | None) -> TrafficIntensities:
         return super().read(file_path)
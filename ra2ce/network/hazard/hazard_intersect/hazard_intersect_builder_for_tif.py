@@ -27,7 +27,6 @@ from typing import Callable
 from geopandas import GeoDataFrame
 from networkx import Graph, set_edge_attributes
 from numpy import nan
-from rasterstats import zonal_stats
 from tqdm import tqdm
 
 from ra2ce.network.hazard.hazard_common_functions import (
@@ -37,6 +36,9 @@ from ra2ce.network.hazard.hazard_common_functions import (
 from ra2ce.network.hazard.hazard_intersect.hazard_intersect_builder_base import (
     HazardIntersectBuilderBase,
 )
+from ra2ce.network.hazard.hazard_intersect.windowed_raster_overlay import (
+    WindowedRasterOverlay,
+)
 from ra2ce.network.networks_utils import (
     fraction_flooded,
     get_graph_edges_extent,
@@ -100,35 +102,27 @@ class HazardIntersectBuilderForTif(HazardIntersectBuilderBase):
             gdf = GeoDataFrame(
                 {"geometry": [edata["geometry"] for u, v, k, edata in edges_geoms]}
             )
-            tqdm.pandas(desc="Graph hazard overlay with " + hazard_name)
             _tif_hazard_files = str(hazard_tif_file)
+            _overlay = WindowedRasterOverlay(hazard_tif_file)
             if self.hazard_aggregate_wl == "mean":
-                flood_stats = gdf.geometry.progress_apply(
-                    lambda x, _files_value=_tif_hazard_files: zonal_stats(
-                        x,
-                        _files_value,
-                        all_touched=True,
-                        add_stats={"mean": get_valid_mean},
-                    )
+                flood_stats = _overlay.get_zonal_stats(
+                    gdf.geometry,
+                    ["count", "min", "max"],
+                    add_stats={"mean": get_valid_mean},
+                    desc="Graph hazard overlay with " + hazard_name,
                 )
             else:
-                flood_stats = gdf.geometry.progress_apply(
-                    lambda x, _files_value=_tif_hazard_files: zonal_stats(
-                        x,
-                        _files_value,
-                        all_touched=True,
-                        stats=f"{self.hazard_aggregate_wl}",
-                    )
+                flood_stats = _overlay.get_zonal_stats(
+                    gdf.geometry,
+                    self.hazard_aggregate_wl.split(),
+                    desc="Graph hazard overlay with " + hazard_name,
                 )
 
             try:
-                flood_stats = flood_stats.apply(
-                    lambda x: (
-                        x[0][self.hazard_aggregate_wl]
-                        if x[0][self.hazard_aggregate_wl]
-                        else 0
-                    )
-                )
+                flood_stats = [
+                    (x[self.hazard_aggregate_wl] if x[self.hazard_aggregate_wl] else 0)
+                    for x in flood_stats
+                ]
                 set_edge_attributes(
                     hazard_overlay,
                     {
@@ -173,7 +167,7 @@ class HazardIntersectBuilderForTif(HazardIntersectBuilderBase):
         """
         assert isinstance(hazard_overlay, GeoDataFrame), "Network is not a GeoDataFrame"
 
-        # Make sure none of the geometries is a nonetype object (this will raise an error in zonal_stats)
+        # Make sure none of the geometries is a nonetype object (these get no hazard values)
         empty_entries = hazard_overlay.loc[hazard_overlay.geometry.isnull()]
         if any(empty_entries):
             logging.warning(
@@ -198,23 +192,16 @@ class HazardIntersectBuilderForTif(HazardIntersectBuilderBase):
             )
             validate_extent_graph(extent_graph, hazard_tif_file)
 
-            tqdm.pandas(desc="Network hazard overlay with " + hazard_name)
             _hazard_files_str = str(hazard_tif_file)
-            # Performance sinkhole
-            flood_stats = hazard_overlay.geometry.progress_apply(
-                lambda _geom_vector: zonal_stats(
-                    vectors=_geom_vector,
-                    raster=_hazard_files_str,
-                    all_touched=True,
-                    stats="min max",
-                    add_stats={"mean": get_valid_mean},
-                )
+            flood_stats = WindowedRasterOverlay(hazard_tif_file).get_zonal_stats(
+                hazard_overlay.geometry,
+                ["min", "max"],
+                add_stats={"mean": get_valid_mean},
+                desc="Network hazard overlay with " + hazard_name,
             )
 
-            def _get_attributes(gen_flood_stat: list[dict]) -> tuple:
-                # Just get the first element of the generator
-                _flood_stat = gen_flood_stat[0]
-                return _flood_stat["min"], _flood_stat["max"], _flood_stat["mean"]
+            def _get_attributes(flood_stat: dict) -> tuple:
+                return flood_stat["min"], flood_stat["max"], flood_stat["mean"]
 
             (
                 hazard_overlay[ra2ce_name + "_mi"],
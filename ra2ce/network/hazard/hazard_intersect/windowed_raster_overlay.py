@@ -0,0 +1,242 @@
+"""
+                    GNU GENERAL PUBLIC LICENSE
+                      Version 3, 29 June 2007
+
+    Risk Assessment and Adaptation for Critical Infrastructure (RA2CE).
+    Copyright (C) 2023 Stichting Deltares
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+
+import math
+from collections import defaultdict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Iterable, Optional
+
+import numpy as np
+import rasterio
+from rasterio import features
+from rasterio.enums import MaskFlags
+from rasterio.windows import Window
+from shapely.geometry.base import BaseGeometry
+from tqdm import tqdm
+
+# Value `rasterstats` considers no-data when the raster has no no-data value.
+_DEFAULT_NODATA = -999
+
+
+@dataclass
+class WindowedRasterOverlay:
+    """
+    Overlays (line or polygon) geometries with a raster, giving per geometry the same
+    statistics as `rasterstats.zonal_stats(geometry, raster, all_touched=True, ...)`.
+
+    Instead of reopening the raster for every geometry, the raster is opened once
+    and the geometries are grouped by the raster block in which their window
+    (the raster cells covering their bounds) starts. The window covering a group
+    is read once, after which the window of each geometry is sliced from it and
+    rasterized with its own window transform, so the same cells are selected.
+    """
+
+    raster_file: Path
+    band: int = 1
+
+    def get_zonal_stats(
+        self,
+        geometries: Iterable[Optional[BaseGeometry]],
+        stats: list[str],
+        add_stats: Optional[dict[str, Callable[[np.ma.MaskedArray], Any]]] = None,
+        desc: str = "",
+    ) -> list[dict[str, Any]]:
+        """
+        Gets the statistics of the raster cells touched by each of the geometries.
+
+        Args:
+            geometries (Iterable[Optional[BaseGeometry]]): Geometries to overlay, geometries that are `None` or empty touch no cells.
+            stats (list[str]): Statistics to get, from 'count', 'min', 'max' and 'mean'.
+            add_stats (Optional[dict[str, Callable[[np.ma.MaskedArray], Any]]], optional): Additional statistics, as functions of the masked cells of a geometry. Defaults to None.
+            desc (str, optional): Description of the progress bar. Defaults to "".
+
+        Raises:
+            ValueError: When an unsupported statistic is requested.
+
+        Returns:
+            list[dict[str, Any]]: Statistics per geometry, `None` (or 0 for 'count') when no valid cell is touched.
+        """
+        _unsupported = set(stats) - {"count", "min", "max", "mean"}
+        if _unsupported:
+            raise ValueError(
+                "Statistics {} are not supported, choose from 'count', 'min', 'max' and 'mean'.".format(
+                    sorted(_unsupported)
+                )
+            )
+        _geometries = list(geometries)
+        _add_stats = add_stats or {}
+
+        with rasterio.open(self.raster_file) as _src:
+            _affine = _src.transform
+            _block_rows, _block_cols = _src.block_shapes[self.band - 1]
+
+            # Group the geometries by the block their window starts in.
+            _windows = {}
+            _groups = defaultdict(list)
+            for _i, _geom in enumerate(_geometries):
+                if _geom is None or _geom.is_empty:
+                    continue
+                _windows[_i] = self._get_window(_geom.bounds, _affine)
+                (_row_start, _), (_col_start, _) = _windows[_i]
+                _groups[
+                    (
+                        max(_row_start, 0) // _block_rows,
+                        max(_col_start, 0) // _block_cols,
+                    )
+                ].append(_i)
+
+            _zonal_stats = [None] * len(_geometries)
+            for _group in tqdm(_groups.values(), desc=desc, disable=not desc):
+                _row_start = min(_windows[_i][0][0] for _i in _group)
+                _row_stop = max(_windows[_i][0][1] for _i in _group)
+                _col_start = min(_windows[_i][1][0] for _i in _group)
+                _col_stop = max(_windows[_i][1][1] for _i in _group)
+                _group_array = self._read_window(
+                    _src, ((_row_start, _row_stop), (_col_start, _col_stop))
+                )
+                for _i in _group:
+                    (_r0, _r1), (_c0, _c1) = _windows[_i]
+                    _array = _group_array[
+                        _r0 - _row_start : _r1 - _row_start,
+                        _c0 - _col_start : _c1 - _col_start,
+                    ]
+                    _zonal_stats[_i] = self._get_stats(
+                        self._get_masked_array(
+                            _geometries[_i],
+                            _array,
+                            (
+                                _c0 * _affine.a + _r1 * _affine.b + _affine.c,
+                                _c1 * _affine.d + _r0 * _affine.e + _affine.f,
+                            ),
+                            _affine,
+                            _src.nodata,
+                        ),
+                        stats,
+                        _add_stats,
+                    )
+
+            # Geometries without a window touch no cells.
+            _empty_array = self._read_window(_src, ((0, 0), (0, 0)))
+            return [
+                (
+                    _stats
+                    if _stats is not None
+                    else self._get_stats(
+                        np.ma.MaskedArray(_empty_array, mask=True), stats, _add_stats
+                    )
+                )
+                for _stats in _zonal_stats
+            ]
+
+    @staticmethod
+    def _get_window(
+        bounds: tuple[float, float, float, float], affine: rasterio.Affine
+    ) -> tuple[tuple[int, int], tuple[int, int]]:
+        # Rows and columns of the cells covering the bounds, as in `rasterstats.io.bounds_window`.
+        _w, _s, _e, _n = bounds
+        return (
+            (
+                int(math.floor((_n - affine.f) / affine.e)),
+                int(math.ceil((_s - affine.f) / affine.e)),
+            ),
+            (
+                int(math.floor((_w - affine.c) / affine.a)),
+                int(math.ceil((_e - affine.c) / affine.a)),
+            ),
+        )
+
+    def _read_window(
+        self,
+        src: rasterio.DatasetReader,
+        window: tuple[tuple[int, int], tuple[int, int]],
+    ) -> np.ndarray | np.ma.MaskedArray:
+        # Cells outside the raster get its no-data value (or 0), as in a boundless read.
+        (_row_start, _row_stop), (_col_start, _col_stop) = window
+        _array = np.full(
+            (max(_row_stop - _row_start, 0), max(_col_stop - _col_start, 0)),
+            src.nodata if src.nodata is not None else 0,
+            dtype=src.dtypes[self.band - 1],
+        )
+        _is_masked = all(
+            MaskFlags.per_dataset in _flags for _flags in src.mask_flag_enums
+        )
+        if _is_masked:
+            _array = np.ma.MaskedArray(_array, mask=True)
+
+        _rows = (max(_row_start, 0), min(_row_stop, src.height))
+        _cols = (max(_col_start, 0), min(_col_stop, src.width))
+        if _rows[0] < _rows[1] and _cols[0] < _cols[1]:
+            _array[
+                _rows[0] - _row_start : _rows[1] - _row_start,
+                _cols[0] - _col_start : _cols[1] - _col_start,
+            ] = src.read(
+                self.band, window=Window.from_slices(_rows, _cols), masked=_is_masked
+            )
+        return _array
+
+    @staticmethod
+    def _get_masked_array(
+        geometry: BaseGeometry,
+        array: np.ndarray | np.ma.MaskedArray,
+        origin: tuple[float, float],
+        affine: rasterio.Affine,
+        nodata: Optional[float],
+    ) -> np.ma.MaskedArray:
+        # Masks the no-data cells and the cells not touched by the geometry.
+        # The window origin is computed as in `rasterstats.io.window_bounds`.
+        _is_nodata = array == (nodata if nodata is not None else _DEFAULT_NODATA)
+        if np.issubdtype(array.dtype, np.floating):
+            _is_nodata = _is_nodata | np.isnan(array)
+        if not array.size:
+            return np.ma.MaskedArray(array, mask=_is_nodata)
+        _is_touched = features.rasterize(
+            [(geometry, 1)],
+            out_shape=array.shape,
+            transform=rasterio.Affine(
+                affine.a, affine.b, origin[0], affine.d, affine.e, origin[1]
+            ),
+            fill=0,
+            dtype="uint8",
+            all_touched=True,
+        ).astype(bool)
+        return np.ma.MaskedArray(array, mask=_is_nodata | ~_is_touched)
+
+    @staticmethod
+    def _get_stats(
+        masked: np.ma.MaskedArray,
+        stats: list[str],
+        add_stats: dict[str, Callable[[np.ma.MaskedArray], Any]],
+    ) -> dict[str, Any]:
+        _stats = dict.fromkeys(stats)
+        if "count" in stats:
+            _stats["count"] = int(masked.count())
+        if masked.compressed().size:
+            _accum_dtype = "int64" if np.issubdtype(masked.dtype, np.integer) else None
+            if "min" in stats:
+                _stats["min"] = float(masked.min())
+            if "max" in stats:
+                _stats["max"] = float(masked.max())
+            if "mean" in stats:
+                _stats["mean"] = float(masked.mean(dtype=_accum_dtype))
+        for _stat_name, _stat_func in add_stats.items():
+            _stats[_stat_name] = _stat_func(masked)
+        return _stats
@@ -26,7 +26,7 @@ import networkx as nx
 import numpy as np
 import pandas as pd
 import pyproj
-from rasterstats import point_query, zonal_stats
+from rasterstats import point_query
 from tqdm import tqdm
 
 from ra2ce.network import networks_utils as ntu
@@ -46,6 +46,9 @@ from ra2ce.network.hazard.hazard_intersect.hazard_intersect_builder_for_table im
 from ra2ce.network.hazard.hazard_intersect.hazard_intersect_builder_for_tif import (
     HazardIntersectBuilderForTif,
 )
+from ra2ce.network.hazard.hazard_intersect.windowed_raster_overlay import (
+    WindowedRasterOverlay,
+)
 from ra2ce.network.network_config_data.network_config_data import NetworkConfigData
 
 
@@ -169,25 +172,22 @@ class HazardOverlay:
             gdf = gpd.GeoDataFrame(
                 {"geometry": [edata["geometry"] for u, v, k, edata in edges_geoms]}
             )
-            tqdm.pandas(desc="OD graph hazard overlay with " + hn)
-            flood_stats = gdf.geometry.progress_apply(
-                lambda x, _files_values=_tif_hazard_files: zonal_stats(
-                    x,
-                    _files_values,
-                    all_touched=True,
-                    stats=f"{self._hazard_aggregate_wl}",  # TODO: ADD MEAN WITHOUT THE NANs
-                )
+            flood_stats = WindowedRasterOverlay(
+                self.hazard_files.tif[i]
+            ).get_zonal_stats(
+                gdf.geometry,
+                self._hazard_aggregate_wl.split(),
+                desc="OD graph hazard overlay with " + hn,
             )
 
             try:
-                flood_stats = flood_stats.fillna(0)
                 nx.set_edge_attributes(
                     graph,
                     {
                         (edges[0], edges[1], edges[2]): {
                             rn
                             + "_"
-                            + self._hazard_aggregate_wl[:2]: x[0][
+                            + self._hazard_aggregate_wl[:2]: x[
                                 self._hazard_aggregate_wl
                             ]
                         }
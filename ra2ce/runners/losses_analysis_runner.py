@@ -28,6 +28,10 @@ from ra2ce.analysis.analysis_result_wrapper import AnalysisResultWrapper
 from ra2ce.analysis.analysis_result_wrapper_exporter import (
     AnalysisResultWrapperExporter,
 )
+from ra2ce.analysis.losses.criticality_results_cache import CriticalityResultsCache
+from ra2ce.analysis.losses.losses_base import LossesBase
+from ra2ce.analysis.losses.multi_link_redundancy import MultiLinkRedundancy
+from ra2ce.analysis.losses.single_link_redundancy import SingleLinkRedundancy
 from ra2ce.configuration.config_wrapper import ConfigWrapper
 from ra2ce.runners.analysis_runner_protocol import AnalysisRunner
 
@@ -45,10 +49,26 @@ class LossesAnalysisRunner(AnalysisRunner):
             return False
         return True
 
+    @staticmethod
+    def _get_criticality_results_cache(
+        analysis_config: AnalysisConfigWrapper,
+    ) -> CriticalityResultsCache:
+        _config_data = analysis_config.config_data
+        if _config_data.project.cache_criticality_results and _config_data.output_path:
+            return CriticalityResultsCache(
+                cache_path=_config_data.output_path.joinpath(
+                    "criticality_results_cache"
+                )
+            )
+        return CriticalityResultsCache()
+
     def run(
         self, analysis_config: AnalysisConfigWrapper
     ) -> list[AnalysisResultWrapper]:
         _analysis_collection = AnalysisCollection.from_config(analysis_config)
+        _criticality_results_cache = self._get_criticality_results_cache(
+            analysis_config
+        )
         _results = []
         for analysis in _analysis_collection.losses_analyses:
             logging.info(
@@ -57,7 +77,13 @@ class LossesAnalysisRunner(AnalysisRunner):
             )
             starttime = time.time()
 
-            _result = analysis.execute()
+            # The criticality (redundancy) results are computed once per run.
+            if isinstance(analysis, (SingleLinkRedundancy, MultiLinkRedundancy)):
+                _result = _criticality_results_cache.get_result(analysis)
+            else:
+                if isinstance(analysis, LossesBase):
+                    analysis.criticality_results_cache = _criticality_results_cache
+                _result = analysis.execute()
             _result_wrapper = AnalysisResultWrapper(
                 analysis_result=_result, analysis=analysis
             )
@@ -0,0 +1,188 @@
+import numpy as np
+import pytest
+
+from ra2ce.analysis.losses.resilience_curves.compiled_resilience_curves import (
+    CompiledResilienceCurves,
+)
+from ra2ce.analysis.losses.resilience_curves.resilience_curves import ResilienceCurves
+from ra2ce.network.network_config_data.enums.road_type_enum import RoadTypeEnum
+
+
+class TestCompiledResilienceCurves:
+    @pytest.fixture(name="valid_resilience_curves")
+    def _get_valid_resilience_curves(
+        self,
+        resilience_curves_data: list[
+            tuple[RoadTypeEnum, tuple[float, float], list[float], list[float]]
+        ],
+    ) -> ResilienceCurves:
+        _resilience_curves = {
+            (_link, _hazard): list(zip(_loss, _ratio))
+            for _link, _hazard, _loss, _ratio in resilience_curves_data
+        }
+        # A curve with more steps and a loss ratio above 1.
+        _resilience_curves[(RoadTypeEnum.PRIMARY, (0.2, 0.5))] = [
+            (1.0, 0.5),
+            (2.0, 1.5),
+            (4.0, 0.2),
+        ]
+        return ResilienceCurves(resilience_curves=_resilience_curves)
+
+    def test_compile_equals_resilience_curves(
+        self, valid_resilience_curves: ResilienceCurves
+    ):
+        # 1. Run test.
+        _compiled = valid_resilience_curves.compile()
+
+        # 2. Verify expectations.
+        assert isinstance(_compiled, CompiledResilienceCurves)
+        assert _compiled.link_types == [RoadTypeEnum.MOTORWAY, RoadTypeEnum.PRIMARY]
+        assert _compiled.ranges == valid_resilience_curves.ranges
+        assert _compiled.durations.shape == (2, 2, 3)
+        for _link_type_id, _link_type in enumerate(_compiled.link_types):
+            for _range_id, _range in enumerate(_compiled.ranges):
+                _idx = (_link_type_id, _range_id)
+                assert _compiled.has_curve[_idx] == (
+                    valid_resilience_curves.has_resilience_curve(_link_type, _range)
+                )
+                if not _compiled.has_curve[_idx]:
+                    assert not _compiled.has_step[_idx].any()
+                    continue
+                _has_step = _compiled.has_step[_idx]
+                assert _compiled.durations[_idx][_has_step].tolist() == (
+                    valid_resilience_curves.get_duration_steps(_link_type, _range)
+                )
+                _loss_ratios = valid_resilience_curves.get_functionality_loss_ratio(
+                    _link_type, _range
+                )
+                assert _compiled.loss_ratios[_idx][_has_step].tolist() == _loss_ratios
+                assert _compiled.disruptions[
+                    _idx
+                ] == valid_resilience_curves.calculate_disruption(_link_type, _range)
+                assert _compiled.divisors[_idx] == (
+                    1 if all(_ratio <= 1 for _ratio in _loss_ratios) else 100
+                )
+
+    def test_get_link_type_ids(self, valid_resilience_curves: ResilienceCurves):
+        # 1. Define test data.
+        _compiled = valid_resilience_curves.compile()
+
+        # 2. Run test.
+        _link_type_ids = _compiled.get_link_type_ids(
+            [RoadTypeEnum.PRIMARY, RoadTypeEnum.TRUNK, RoadTypeEnum.MOTORWAY]
+        )
+
+        # 3. Verify expectations.
+        assert _link_type_ids.tolist() == [1, -1, 0]
+
+    @pytest.mark.parametrize(
+        "ranges, expected_range_ids",
+        [
+            pytest.param(
+                [(0.0, 0.5), (0.5, 1.2)], [0, 0, 0, 1, 1, -1, -1, -1], id="Ascending"
+            ),
+            pytest.param(
+                [(0.5, 1.2), (0.0, 0.5)], [1, 1, 0, 0, 0, -1, -1, -1], id="Descending"
+            ),
+        ],
+    )
+    def test_get_range_ids(
+        self, ranges: list[tuple[float, float]], expected_range_ids: list[int]
+    ):
+        # 1. Define test data.
+        _compiled = CompiledResilienceCurves.from_resilience_curves(
+            {(RoadTypeEnum.MOTORWAY, _range): [(1.0, 1.0)] for _range in ranges},
+            ranges,
+        )
+        _hazard_intensities = np.array([0.0, 0.2, 0.5, 0.7, 1.2, -0.1, 1.3, np.nan])
+
+        # 2. Run test.
+        _range_ids = _compiled.get_range_ids(_hazard_intensities)
+
+        # 3. Verify expectations.
+        # A shared bound belongs to the first range containing it.
+        assert _range_ids.tolist() == expected_range_ids
+
+    def test_get_range_ids_equals_first_matching_range(
+        self, valid_resilience_curves: ResilienceCurves
+    ):
+        # 1. Define test data.
+        _compiled = valid_resilience_curves.compile()
+        _hazard_intensities = np.linspace(0, 1.5, 151)
+
+        # 2. Run test.
+        _range_ids = _compiled.get_range_ids(_hazard_intensities)
+
+        # 3. Verify expectations.
+        for _height, _range_id in zip(_hazard_intensities, _range_ids):
+            _expected = next(
+                (
+                    _id
+                    for _id, (_lower, _upper) in enumerate(
+                        valid_resilience_curves.ranges
+                    )
+                    if _lower <= _height <= _upper
+                ),
+                -1,
+            )
+            assert _range_id == _expected
+
+    def test_stack(self, valid_resilience_curves: ResilienceCurves):
+        # 1. Define test data.
+        _compiled = valid_resilience_curves.compile()
+        # The same curves in another order, with less steps and other loss ratios.
+        _other = CompiledResilienceCurves.from_resilience_curves(
+            {
+                _key: [(_duration, _ratio / 2) for _duration, _ratio in _curve[:2]]
+                for _key, _curve in reversed(
+                    valid_resilience_curves.resilience_curves.items()
+                )
+            },
+            list(reversed(_compiled.ranges)),
+        )
+
+        # 2. Run test.
+        _stacked = CompiledResilienceCurves.stack([_compiled, _other])
+
+        # 3. Verify expectations.
+        assert _stacked.link_types == _compiled.link_types
+        assert _stacked.ranges == _compiled.ranges
+        assert _stacked.durations.shape == (2, 2, 2, 3)
+        for _name in ["has_curve", "has_step", "durations", "loss_ratios"]:
+            assert np.array_equal(
+                getattr(_stacked, _name)[0], getattr(_compiled, _name)
+            )
+        for _link_type_id, _link_type in enumerate(_compiled.link_types):
+            for _range_id, _range in enumerate(_compiled.ranges):
+                _idx = (
+                    _other.link_types.index(_link_type),
+                    _other.ranges.index(_range),
+                )
+                assert _stacked.disruptions[1, _link_type_id, _range_id] == (
+                    _other.disruptions[_idx]
+                )
+                assert np.array_equal(
+                    _stacked.loss_ratios[1, _link_type_id, _range_id, :2],
+                    _other.loss_ratios[_idx],
+                )
+        assert not _stacked.has_step[1, ..., 2].any()
+
+    def test_stack_with_other_link_types_raises(
+        self, valid_resilience_curves: ResilienceCurves
+    ):
+        # 1. Define test data.
+        _other = ResilienceCurves(
+            resilience_curves={(RoadTypeEnum.TRUNK, (0.2, 0.5)): [(1.0, 1.0)]}
+        )
+
+        # 2. Run test.
+        with pytest.raises(ValueError) as exc_err:
+            CompiledResilienceCurves.stack(
+                [valid_resilience_curves.compile(), _other.compile()]
+            )
+
+        # 3. Verify expectations.
+        assert (
+            str(exc_err.value)
+            == "Resilience curves can only be stacked with the same link types and hazard ranges"
+        )
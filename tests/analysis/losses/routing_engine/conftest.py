@@ -0,0 +1,28 @@
+from typing import Iterator
+
+import networkx as nx
+import pytest
+
+from ra2ce.common.io.readers.graph_pickle_reader import GraphPickleReader
+from tests import test_data
+
+
+@pytest.fixture(name="base_graph")
+def _get_base_graph_fixture() -> Iterator[nx.MultiGraph]:
+    _graph_file = test_data.joinpath("readers_test_data", "base_graph.p")
+    assert _graph_file.is_file()
+    yield GraphPickleReader().read(_graph_file)
+
+
+@pytest.fixture(name="multi_graph")
+def _get_multi_graph_fixture() -> Iterator[nx.MultiGraph]:
+    """
+    Small graph with parallel edges (between 1 and 2) and a dead end (node 4).
+    """
+    _graph = nx.MultiGraph()
+    _graph.add_edge(1, 2, length=5.0)
+    _graph.add_edge(1, 2, length=2.0)
+    _graph.add_edge(2, 3, length=1.0)
+    _graph.add_edge(1, 3, length=4.0)
+    _graph.add_edge(3, 4, length=1.0)
+    yield _graph
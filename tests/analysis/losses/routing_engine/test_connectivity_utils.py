@@ -0,0 +1,109 @@
+import networkx as nx
+import numpy as np
+
+from ra2ce.analysis.losses.routing_engine.connectivity_utils import (
+    get_bridges,
+    get_component_labels,
+    get_components,
+    get_covering_nodes,
+)
+
+
+class TestConnectivityUtils:
+    def test_get_bridges_excludes_parallel_edges(self, multi_graph: nx.MultiGraph):
+        # 1. Run test.
+        _bridges = get_bridges(multi_graph)
+
+        # 2. Verify expectations.
+        assert _bridges == {(3, 4, 0)}
+
+    def test_get_bridges_of_parallel_dead_end(self, multi_graph: nx.MultiGraph):
+        # 1. Define test data.
+        multi_graph.add_edge(3, 4, length=2.0)
+        multi_graph.add_edge(4, 5, length=1.0)
+
+        # 2. Run test.
+        _bridges = get_bridges(multi_graph)
+
+        # 3. Verify expectations.
+        assert _bridges == {(4, 5, 0)}
+
+    def test_get_bridges_matches_detours(self, base_graph: nx.MultiGraph):
+        # 1. Define test data.
+        _graph = base_graph.copy()
+
+        # 2. Run test.
+        _bridges = get_bridges(_graph)
+
+        # 3. Verify expectations.
+        assert _bridges
+        for u, v, k in base_graph.edges(keys=True):
+            _data = _graph.edges[u, v, k]
+            _graph.remove_edge(u, v, k)
+            assert ((u, v, k) in _bridges) != nx.has_path(_graph, u, v)
+            _graph.add_edge(u, v, k, **_data)
+
+    def test_get_components(self, multi_graph: nx.MultiGraph):
+        # 1. Define test data.
+        multi_graph.remove_edge(3, 4)
+        multi_graph.add_edge(4, 5)
+
+        # 2. Run test.
+        _components = get_components(multi_graph)
+
+        # 3. Verify expectations.
+        assert _components[1] == _components[2] == _components[3]
+        assert _components[4] == _components[5]
+        assert _components[1] != _components[4]
+
+    def test_get_components_directed(self):
+        # 1. Define test data.
+        _graph = nx.MultiDiGraph([(1, 2), (3, 2), (4, 5)])
+
+        # 2. Run test.
+        _components = get_components(_graph)
+
+        # 3. Verify expectations.
+        assert _components[1] == _components[2] == _components[3]
+        assert _components[1] != _components[4]
+
+    def test_get_covering_nodes(self):
+        # 1. Define test data.
+        _pairs = np.array([(0, 1), (2, 1), (1, 3), (4, 3), (5, 5)])
+
+        # 2. Run test.
+        _covering_nodes = get_covering_nodes(_pairs)
+
+        # 3. Verify expectations.
+        assert _covering_nodes.tolist() == [1, 1, 1, 3, 5]
+
+    def test_get_component_labels(self):
+        # 1. Define test data.
+        _edge_nodes = np.array([(5, 1), (1, 4), (2, 6), (6, 6), (4, 5)])
+
+        # 2. Run test.
+        _labels = get_component_labels(8, _edge_nodes)
+
+        # 3. Verify expectations.
+        assert _labels.tolist() == [0, 1, 2, 3, 1, 1, 2, 7]
+
+    def test_get_component_labels_matches_networkx(self, base_graph: nx.MultiGraph):
+        # 1. Define test data.
+        _graph = nx.MultiGraph(base_graph)
+        _graph.remove_edges_from(list(_graph.edges(keys=True))[::3])
+        _node_index = {_node: _i for _i, _node in enumerate(_graph.nodes)}
+        _edge_nodes = np.array(
+            [(_node_index[u], _node_index[v]) for u, v in _graph.edges()]
+        )
+
+        # 2. Run test.
+        _labels = get_component_labels(len(_node_index), _edge_nodes)
+
+        # 3. Verify expectations.
+        assert [
+            sorted(_node_index[_node] for _node in _component)
+            for _component in nx.connected_components(_graph)
+        ] == [
+            np.flatnonzero(_labels == _label).tolist()
+            for _label in dict.fromkeys(_labels)
+        ]
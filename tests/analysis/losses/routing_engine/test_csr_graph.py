@@ -0,0 +1,186 @@
+import math
+
+import networkx as nx
+import numpy as np
+import pytest
+
+from ra2ce.analysis.losses.routing_engine.csr_graph import CsrGraph
+
+
+class TestCsrGraph:
+    def test_from_graph_collapses_parallel_edges(self, multi_graph: nx.MultiGraph):
+        # 1. Run test.
+        _csr_graph = CsrGraph.from_graph(multi_graph, "length")
+
+        # 2. Verify expectations.
+        assert isinstance(_csr_graph, CsrGraph)
+        assert _csr_graph.nodes == list(multi_graph.nodes)
+        assert _csr_graph.edges == list(multi_graph.edges(keys=True))
+        _adjacency = _csr_graph.adjacency.toarray()
+        assert _adjacency[0, 1] == _adjacency[1, 0] == 2.0
+        assert _adjacency[1, 2] == _adjacency[2, 1] == 1.0
+        assert _adjacency[0, 2] == _adjacency[2, 0] == 4.0
+        assert _adjacency[2, 3] == _adjacency[3, 2] == 1.0
+        assert np.shares_memory(_csr_graph.adjacency.data, _csr_graph.weights)
+
+    def test_from_graph_directed(self):
+        # 1. Define test data.
+        _graph = nx.MultiDiGraph()
+        _graph.add_edge("a", "b", length=3)
+        _graph.add_edge("b", "a")
+
+        # 2. Run test.
+        _csr_graph = CsrGraph.from_graph(_graph, "length")
+
+        # 3. Verify expectations.
+        _adjacency = _csr_graph.adjacency.toarray()
+        assert _adjacency[0, 1] == 3
+        assert _adjacency[1, 0] == 1
+        assert _csr_graph.edge_index[("a", "b", 0)] == 0
+        assert _csr_graph.edge_index[("b", "a", 0)] == 1
+
+    def test_without_edge_masks_and_restores(self, multi_graph: nx.MultiGraph):
+        # 1. Define test data.
+        _csr_graph = CsrGraph.from_graph(multi_graph, "length")
+        _lowest_parallel = _csr_graph.edge_index[(1, 2, 1)]
+        _other_parallel = _csr_graph.edge_index[(1, 2, 0)]
+        _single = _csr_graph.edge_index[(2, 3, 0)]
+
+        # 2. Run test and verify expectations.
+        with _csr_graph.without_edge(_lowest_parallel):
+            assert _csr_graph.adjacency[0, 1] == _csr_graph.adjacency[1, 0] == 5.0
+        with _csr_graph.without_edge(_other_parallel):
+            assert _csr_graph.adjacency[0, 1] == 2.0
+        with _csr_graph.without_edge(_single):
+            assert math.isinf(_csr_graph.adjacency[1, 2])
+            assert math.isinf(_csr_graph.adjacency[2, 1])
+        assert _csr_graph.adjacency[1, 2] == 1.0
+
+    def test_get_shortest_paths_bounded_search(self, multi_graph: nx.MultiGraph):
+        # 1. Define test data.
+        _csr_graph = CsrGraph.from_graph(multi_graph, "length")
+        _source = _csr_graph.node_index[1]
+        _target = _csr_graph.node_index[4]
+
+        # 2. Run test.
+        _distances, _predecessors = _csr_graph.get_shortest_paths(
+            _source, np.array([_target]), initial_limit=0.5
+        )
+
+        # 3. Verify expectations.
+        assert _distances[_target] == 4.0
+        _path = _csr_graph.get_path(_predecessors, _source, _target)
+        assert _csr_graph.get_node_ids(_path) == [1, 2, 3, 4]
+
+    def test_get_shortest_paths_unreachable_target(self, multi_graph: nx.MultiGraph):
+        # 1. Define test data.
+        multi_graph.add_node(5)
+        _csr_graph = CsrGraph.from_graph(multi_graph, "length")
+
+        # 2. Run test.
+        _distances, _ = _csr_graph.get_shortest_paths(
+            0, np.array([_csr_graph.node_index[5]]), initial_limit=1
+        )
+
+        # 3. Verify expectations.
+        assert math.isinf(_distances[_csr_graph.node_index[5]])
+        assert np.isfinite(_distances[:4]).all()
+
+    def test_get_shortest_paths_without_targets_is_bounded_once(
+        self, multi_graph: nx.MultiGraph
+    ):
+        # 1. Define test data.
+        _csr_graph = CsrGraph.from_graph(multi_graph, "length")
+
+        # 2. Run test.
+        _distances, _ = _csr_graph.get_shortest_paths(
+            _csr_graph.node_index[1], initial_limit=2.5
+        )
+
+        # 3. Verify expectations.
+        assert _distances[_csr_graph.node_index[2]] == 2.0
+        assert math.isinf(_distances[_csr_graph.node_index[4]])
+
+    def test_get_routes(self, multi_graph: nx.MultiGraph):
+        # 1. Define test data.
+        _csr_graph = CsrGraph.from_graph(multi_graph, "length")
+        _routes = [(1, 4), (3, 1), (1, 2), (4, 4)]
+
+        # 2. Run test.
+        _found_routes = _csr_graph.get_routes(_routes, initial_limits=[1, 1, 1, 1])
+
+        # 3. Verify expectations.
+        assert _found_routes == [
+            (4.0, [1, 2, 3, 4]),
+            (3.0, [3, 2, 1]),
+            (2.0, [1, 2]),
+            (0.0, [4]),
+        ]
+
+    @pytest.mark.parametrize("symmetric", [pytest.param(True), pytest.param(False)])
+    def test_get_routes_equals_networkx(
+        self, base_graph: nx.MultiGraph, symmetric: bool
+    ):
+        # 1. Define test data.
+        _csr_graph = CsrGraph.from_graph(base_graph, "length")
+        _nodes = list(base_graph.nodes)
+        _routes = [(_nodes[_i], _nodes[(7 * _i) % 50]) for _i in range(0, 200, 3)]
+
+        # 2. Run test.
+        _found_routes = _csr_graph.get_routes(_routes, symmetric=symmetric)
+
+        # 3. Verify expectations.
+        for (_source, _target), (_value, _path) in zip(_routes, _found_routes):
+            if not nx.has_path(base_graph, _source, _target):
+                assert math.isinf(_value) and _path == []
+                continue
+            assert _value == pytest.approx(
+                nx.shortest_path_length(base_graph, _source, _target, weight="length")
+            )
+            assert _path[0] == _source and _path[-1] == _target
+
+    def test_get_routes_without_routes(self, multi_graph: nx.MultiGraph):
+        # 1. Run test.
+        _found_routes = CsrGraph.from_graph(multi_graph, "length").get_routes([])
+
+        # 2. Verify expectations.
+        assert _found_routes == []
+
+    def test_get_closest_sources_equals_networkx(self, base_graph: nx.MultiGraph):
+        # 1. Define test data.
+        _csr_graph = CsrGraph.from_graph(base_graph, "length")
+        _sources = list(base_graph.nodes)[:100:10]
+
+        # 2. Run test.
+        _distances, _predecessors = _csr_graph.get_closest_sources(
+            np.array([_csr_graph.node_index[_source] for _source in _sources])
+        )
+
+        # 3. Verify expectations.
+        _expected = nx.multi_source_dijkstra_path_length(
+            base_graph, set(_sources), weight="length"
+        )
+        for _node, _idx in _csr_graph.node_index.items():
+            if _node not in _expected:
+                assert math.isinf(_distances[_idx])
+                continue
+            assert _distances[_idx] == pytest.approx(_expected[_node])
+            while _predecessors[_idx] >= 0:
+                _idx = _predecessors[_idx]
+            assert _csr_graph.nodes[_idx] in _sources
+
+    def test_get_closest_sources_reverse(self):
+        # 1. Define test data.
+        _graph = nx.MultiDiGraph()
+        _graph.add_edge("a", "b", length=1.0)
+        _graph.add_edge("b", "c", length=1.0)
+        _csr_graph = CsrGraph.from_graph(_graph, "length")
+
+        # 2. Run test.
+        _distances, _predecessors = _csr_graph.get_closest_sources(
+            np.array([_csr_graph.node_index["c"]]), reverse=True
+        )
+
+        # 3. Verify expectations.
+        assert _distances.tolist() == [2.0, 1.0, 0.0]
+        assert _predecessors.tolist() == [1, 2, -9999]
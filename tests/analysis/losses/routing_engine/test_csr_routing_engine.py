@@ -0,0 +1,67 @@
+import copy
+import math
+
+import networkx as nx
+import pytest
+
+from ra2ce.analysis.analysis_config_data.enums.weighing_enum import WeighingEnum
+from ra2ce.analysis.losses.routing_engine.csr_graph import CsrGraph
+from ra2ce.analysis.losses.routing_engine.csr_routing_engine import CsrRoutingEngine
+from ra2ce.analysis.losses.routing_engine.networkx_routing_engine import (
+    NetworkxRoutingEngine,
+)
+from ra2ce.analysis.losses.routing_engine.routing_engine_protocol import (
+    RoutingEngineProtocol,
+)
+
+
+class TestCsrRoutingEngine:
+    def test_initialize(self, multi_graph: nx.MultiGraph):
+        # 1. Run test.
+        _engine = CsrRoutingEngine(CsrGraph.from_graph(multi_graph, "length"))
+
+        # 2. Verify expectations.
+        assert isinstance(_engine, CsrRoutingEngine)
+        assert isinstance(_engine, RoutingEngineProtocol)
+
+    def test_get_detours(self, multi_graph: nx.MultiGraph):
+        # 1. Define test data.
+        _engine = CsrRoutingEngine(CsrGraph.from_graph(multi_graph, "length"))
+
+        # 2. Run test.
+        _detours = _engine.get_detours([(1, 2, 1), (2, 3, 0), (3, 4, 0)])
+
+        # 3. Verify expectations.
+        assert _detours[0].alt_value == 5.0
+        assert _detours[0].alt_nodes == [1, 2]
+        assert _detours[1].alt_value == 6.0
+        assert _detours[1].alt_nodes == [2, 1, 3]
+        assert _detours[2].connected == 0
+        assert math.isnan(_detours[2].alt_value)
+
+    @pytest.mark.parametrize(
+        "weighing",
+        [pytest.param(WeighingEnum.LENGTH), pytest.param(WeighingEnum.TIME)],
+    )
+    def test_get_detours_equals_networkx(
+        self, base_graph: nx.MultiGraph, weighing: WeighingEnum
+    ):
+        # 1. Define test data.
+        _edges = list(base_graph.edges(keys=True))
+        _networkx_engine = NetworkxRoutingEngine(copy.deepcopy(base_graph), weighing)
+        _csr_engine = CsrRoutingEngine(
+            CsrGraph.from_graph(base_graph, weighing.config_value)
+        )
+
+        # 2. Run test.
+        _expected = _networkx_engine.get_detours(_edges)
+        _detours = _csr_engine.get_detours(_edges)
+
+        # 3. Verify expectations.
+        assert len(_detours) == len(_expected)
+        for _detour, _expected_detour in zip(_detours, _expected):
+            assert _detour.connected == _expected_detour.connected
+            if _expected_detour.connected:
+                assert _detour.alt_value == pytest.approx(_expected_detour.alt_value)
+                assert _detour.alt_nodes[0] == _expected_detour.alt_nodes[0]
+                assert _detour.alt_nodes[-1] == _expected_detour.alt_nodes[-1]
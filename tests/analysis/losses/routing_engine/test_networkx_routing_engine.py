@@ -0,0 +1,39 @@
+import math
+
+import networkx as nx
+
+from ra2ce.analysis.analysis_config_data.enums.weighing_enum import WeighingEnum
+from ra2ce.analysis.losses.routing_engine.networkx_routing_engine import (
+    NetworkxRoutingEngine,
+)
+from ra2ce.analysis.losses.routing_engine.routing_engine_protocol import (
+    RoutingEngineProtocol,
+)
+
+
+class TestNetworkxRoutingEngine:
+    def test_initialize(self, multi_graph: nx.MultiGraph):
+        # 1. Run test.
+        _engine = NetworkxRoutingEngine(multi_graph, WeighingEnum.LENGTH)
+
+        # 2. Verify expectations.
+        assert isinstance(_engine, NetworkxRoutingEngine)
+        assert isinstance(_engine, RoutingEngineProtocol)
+
+    def test_get_detours_restores_graph(self, multi_graph: nx.MultiGraph):
+        # 1. Define test data.
+        _edges = list(multi_graph.edges(keys=True, data=True))
+        _engine = NetworkxRoutingEngine(multi_graph, WeighingEnum.LENGTH)
+
+        # 2. Run test.
+        _detours = _engine.get_detours([(1, 2, 1), (2, 3, 0), (3, 4, 0)])
+
+        # 3. Verify expectations.
+        assert _detours[0].alt_value == 5.0
+        assert _detours[1].alt_value == 6.0
+        assert _detours[1].alt_nodes == [2, 1, 3]
+        assert _detours[2].connected == 0
+        assert math.isnan(_detours[2].alt_value)
+        assert sorted(multi_graph.edges(keys=True, data=True), key=str) == sorted(
+            _edges, key=str
+        )
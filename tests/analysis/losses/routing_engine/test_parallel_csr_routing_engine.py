@@ -0,0 +1,38 @@
+import networkx as nx
+import pytest
+
+from ra2ce.analysis.analysis_config_data.enums.weighing_enum import WeighingEnum
+from ra2ce.analysis.losses.routing_engine.csr_graph import CsrGraph
+from ra2ce.analysis.losses.routing_engine.csr_routing_engine import CsrRoutingEngine
+from ra2ce.analysis.losses.routing_engine.parallel_csr_routing_engine import (
+    ParallelCsrRoutingEngine,
+)
+from ra2ce.analysis.losses.routing_engine.routing_engine_protocol import (
+    RoutingEngineProtocol,
+)
+
+
+class TestParallelCsrRoutingEngine:
+    def test_initialize(self, multi_graph: nx.MultiGraph):
+        # 1. Run test.
+        _engine = ParallelCsrRoutingEngine(
+            CsrGraph.from_graph(multi_graph, "length"), 2
+        )
+
+        # 2. Verify expectations.
+        assert isinstance(_engine, ParallelCsrRoutingEngine)
+        assert isinstance(_engine, RoutingEngineProtocol)
+        assert _engine.n_workers == 2
+
+    @pytest.mark.parametrize("n_workers", [pytest.param(2), pytest.param(3)])
+    def test_get_detours_equals_serial(self, base_graph: nx.MultiGraph, n_workers: int):
+        # 1. Define test data.
+        _edges = list(base_graph.edges(keys=True))
+        _csr_graph = CsrGraph.from_graph(base_graph, WeighingEnum.LENGTH.config_value)
+
+        # 2. Run test.
+        _expected = CsrRoutingEngine(_csr_graph).get_detours(_edges)
+        _detours = ParallelCsrRoutingEngine(_csr_graph, n_workers).get_detours(_edges)
+
+        # 3. Verify expectations.
+        assert _detours == _expected
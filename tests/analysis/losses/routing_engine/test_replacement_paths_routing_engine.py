@@ -0,0 +1,146 @@
+import copy
+import math
+import random
+
+import networkx as nx
+import pytest
+
+from ra2ce.analysis.analysis_config_data.enums.weighing_enum import WeighingEnum
+from ra2ce.analysis.losses.routing_engine.csr_graph import CsrGraph
+from ra2ce.analysis.losses.routing_engine.detour_result import DetourResult
+from ra2ce.analysis.losses.routing_engine.networkx_routing_engine import (
+    NetworkxRoutingEngine,
+)
+from ra2ce.analysis.losses.routing_engine.replacement_paths_routing_engine import (
+    ReplacementPathsRoutingEngine,
+)
+from ra2ce.analysis.losses.routing_engine.routing_engine_protocol import (
+    RoutingEngineProtocol,
+)
+
+
+def _get_random_multi_graph(seed: int) -> nx.MultiGraph:
+    """
+    Random graph with parallel edges, a self-loop and (possibly) several components.
+    """
+    _random = random.Random(seed)
+    _graph = nx.MultiGraph(nx.gnm_random_graph(40, 70, seed=seed))
+    _graph.add_edges_from(list(_graph.edges())[:10])
+    _graph.add_edge(0, 0)
+    for u, v, k in _graph.edges(keys=True):
+        _graph.edges[u, v, k]["length"] = _random.choice(
+            [1.0, 2.0, _random.uniform(0, 5)]
+        )
+    return _graph
+
+
+class TestReplacementPathsRoutingEngine:
+    def _verify_detours(
+        self,
+        graph: nx.MultiGraph,
+        weight: str,
+        edges: list,
+        detours: list[DetourResult],
+        expected: list[DetourResult],
+    ):
+        assert len(detours) == len(expected)
+        for (u, v, k), _detour, _expected_detour in zip(edges, detours, expected):
+            assert _detour.connected == _expected_detour.connected
+            if not _expected_detour.connected:
+                assert math.isnan(_detour.alt_value)
+                continue
+            assert _detour.alt_value == pytest.approx(_expected_detour.alt_value)
+
+            # The route (possibly another one with the same value) runs from u to v without the edge.
+            assert _detour.alt_nodes[0] == u
+            assert _detour.alt_nodes[-1] == v
+            _route_value = sum(
+                min(
+                    _data.get(weight, 1)
+                    for _key, _data in graph[a][b].items()
+                    if not ({a, b} == {u, v} and _key == k)
+                )
+                for a, b in zip(_detour.alt_nodes, _detour.alt_nodes[1:])
+            )
+            assert _route_value == pytest.approx(_detour.alt_value)
+
+    def test_initialize(self, multi_graph: nx.MultiGraph):
+        # 1. Run test.
+        _engine = ReplacementPathsRoutingEngine(
+            CsrGraph.from_graph(multi_graph, "length")
+        )
+
+        # 2. Verify expectations.
+        assert isinstance(_engine, ReplacementPathsRoutingEngine)
+        assert isinstance(_engine, RoutingEngineProtocol)
+
+    def test_get_detours(self, multi_graph: nx.MultiGraph):
+        # 1. Define test data.
+        _engine = ReplacementPathsRoutingEngine(
+            CsrGraph.from_graph(multi_graph, "length")
+        )
+
+        # 2. Run test.
+        _detours = _engine.get_detours([(1, 2, 1), (1, 2, 0), (2, 3, 0), (3, 4, 0)])
+
+        # 3. Verify expectations.
+        assert _detours[0].alt_value == 5.0
+        assert _detours[0].alt_nodes == [1, 2]
+        assert _detours[1].alt_value == 2.0
+        assert _detours[1].alt_nodes == [1, 2]
+        assert _detours[2].alt_value == 6.0
+        assert _detours[2].alt_nodes == [2, 1, 3]
+        assert _detours[3].connected == 0
+        assert math.isnan(_detours[3].alt_value)
+
+    def test_get_detours_without_edges(self, multi_graph: nx.MultiGraph):
+        # 1. Define test data.
+        _engine = ReplacementPathsRoutingEngine(
+            CsrGraph.from_graph(multi_graph, "length")
+        )
+
+        # 2. Run test.
+        _detours = _engine.get_detours([])
+
+        # 3. Verify expectations.
+        assert _detours == []
+
+    @pytest.mark.parametrize(
+        "weighing",
+        [pytest.param(WeighingEnum.LENGTH), pytest.param(WeighingEnum.TIME)],
+    )
+    def test_get_detours_equals_networkx(
+        self, base_graph: nx.MultiGraph, weighing: WeighingEnum
+    ):
+        # 1. Define test data.
+        _edges = list(base_graph.edges(keys=True))
+        _networkx_engine = NetworkxRoutingEngine(copy.deepcopy(base_graph), weighing)
+        _engine = ReplacementPathsRoutingEngine(
+            CsrGraph.from_graph(base_graph, weighing.config_value)
+        )
+
+        # 2. Run test.
+        _expected = _networkx_engine.get_detours(_edges)
+        _detours = _engine.get_detours(_edges)
+
+        # 3. Verify expectations.
+        self._verify_detours(
+            base_graph, weighing.config_value, _edges, _detours, _expected
+        )
+
+    @pytest.mark.parametrize("seed", range(10))
+    def test_get_detours_equals_networkx_with_parallel_edges(self, seed: int):
+        # 1. Define test data.
+        _graph = _get_random_multi_graph(seed)
+        _edges = list(_graph.edges(keys=True))
+        _networkx_engine = NetworkxRoutingEngine(
+            copy.deepcopy(_graph), WeighingEnum.LENGTH
+        )
+        _engine = ReplacementPathsRoutingEngine(CsrGraph.from_graph(_graph, "length"))
+
+        # 2. Run test.
+        _expected = _networkx_engine.get_detours(_edges)
+        _detours = _engine.get_detours(_edges)
+
+        # 3. Verify expectations.
+        self._verify_detours(_graph, "length", _edges, _detours, _expected)
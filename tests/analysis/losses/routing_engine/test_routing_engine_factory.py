@@ -0,0 +1,99 @@
+import networkx as nx
+import pytest
+
+from ra2ce.analysis.analysis_config_data.enums.routing_engine_enum import (
+    RoutingEngineEnum,
+)
+from ra2ce.analysis.analysis_config_data.enums.weighing_enum import WeighingEnum
+from ra2ce.analysis.losses.routing_engine.csr_routing_engine import CsrRoutingEngine
+from ra2ce.analysis.losses.routing_engine.networkx_routing_engine import (
+    NetworkxRoutingEngine,
+)
+from ra2ce.analysis.losses.routing_engine.parallel_csr_routing_engine import (
+    ParallelCsrRoutingEngine,
+)
+from ra2ce.analysis.losses.routing_engine.replacement_paths_routing_engine import (
+    ReplacementPathsRoutingEngine,
+)
+from ra2ce.analysis.losses.routing_engine.routing_engine_factory import (
+    RoutingEngineFactory,
+)
+from ra2ce.analysis.losses.routing_engine.routing_engine_protocol import (
+    RoutingEngineProtocol,
+)
+
+
+class TestRoutingEngineFactory:
+    @pytest.mark.parametrize(
+        "routing_engine, expected_type",
+        [
+            pytest.param(RoutingEngineEnum.NONE, NetworkxRoutingEngine, id="Default"),
+            pytest.param(
+                RoutingEngineEnum.NETWORKX, NetworkxRoutingEngine, id="NetworkX"
+            ),
+            pytest.param(RoutingEngineEnum.CSR, CsrRoutingEngine, id="CSR"),
+            pytest.param(
+                RoutingEngineEnum.REPLACEMENT_PATHS,
+                ReplacementPathsRoutingEngine,
+                id="Replacement paths",
+            ),
+        ],
+    )
+    def test_get_engine_with_valid_enum(
+        self,
+        routing_engine: RoutingEngineEnum,
+        expected_type: type[RoutingEngineProtocol],
+        multi_graph: nx.MultiGraph,
+    ):
+        # 1. Run test.
+        _engine = RoutingEngineFactory.get_engine(
+            routing_engine, multi_graph, WeighingEnum.LENGTH
+        )
+
+        # 2. Verify expectations.
+        assert isinstance(_engine, expected_type)
+        assert isinstance(_engine, RoutingEngineProtocol)
+
+    @pytest.mark.parametrize(
+        "routing_engine, expected_type",
+        [
+            pytest.param(RoutingEngineEnum.NONE, NetworkxRoutingEngine, id="Default"),
+            pytest.param(RoutingEngineEnum.CSR, ParallelCsrRoutingEngine, id="CSR"),
+        ],
+    )
+    def test_get_engine_with_workers(
+        self,
+        routing_engine: RoutingEngineEnum,
+        expected_type: type[RoutingEngineProtocol],
+        multi_graph: nx.MultiGraph,
+    ):
+        # 1. Run test.
+        _engine = RoutingEngineFactory.get_engine(
+            routing_engine, multi_graph, WeighingEnum.LENGTH, n_workers=4
+        )
+
+        # 2. Verify expectations.
+        assert isinstance(_engine, expected_type)
+
+    def test_get_engine_replacement_paths_with_directed_graph(self):
+        # 1. Run test.
+        _engine = RoutingEngineFactory.get_engine(
+            RoutingEngineEnum.REPLACEMENT_PATHS,
+            nx.MultiDiGraph([(1, 2), (2, 1)]),
+            WeighingEnum.LENGTH,
+        )
+
+        # 2. Verify expectations.
+        assert type(_engine) is CsrRoutingEngine
+
+    def test_get_engine_with_invalid_enum(self, multi_graph: nx.MultiGraph):
+        # 1. Run test.
+        with pytest.raises(NotImplementedError) as exc_err:
+            RoutingEngineFactory.get_engine(
+                RoutingEngineEnum.INVALID, multi_graph, WeighingEnum.LENGTH
+            )
+
+        # 2. Verify expectations.
+        assert str(exc_err.value) == "Routing engine {} not yet supported.".format(
+            RoutingEngineEnum.INVALID
+        )
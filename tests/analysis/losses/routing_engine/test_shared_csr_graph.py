@@ -0,0 +1,30 @@
+import networkx as nx
+import numpy as np
+
+from ra2ce.analysis.losses.routing_engine.csr_graph import CsrGraph
+from ra2ce.analysis.losses.routing_engine.shared_csr_graph import SharedCsrGraph
+
+
+class TestSharedCsrGraph:
+    def test_attach_shares_arrays(self, multi_graph: nx.MultiGraph):
+        # 1. Define test data.
+        _csr_graph = CsrGraph.from_graph(multi_graph, "length")
+
+        # 2. Run test.
+        with SharedCsrGraph.from_csr_graph(_csr_graph) as _shared_graph:
+            _attached_graph, _shared_memories = _shared_graph.attach()
+
+            # 3. Verify expectations.
+            assert isinstance(_shared_graph, SharedCsrGraph)
+            assert _attached_graph.nodes == [0, 1, 2, 3]
+            np.testing.assert_array_equal(
+                _attached_graph.adjacency.toarray(), _csr_graph.adjacency.toarray()
+            )
+            with _attached_graph.without_edge(3):
+                # Masking the attached graph does not affect the shared weights.
+                assert np.isinf(_attached_graph.adjacency[1, 2])
+                assert _csr_graph.adjacency[1, 2] == 1.0
+
+            del _attached_graph
+            for _shared_memory in _shared_memories:
+                _shared_memory.close()
@@ -0,0 +1,166 @@
+import copy
+import gc
+from pathlib import Path
+from typing import Iterator
+
+import networkx as nx
+import pandas as pd
+import pytest
+from shapely.geometry import LineString
+
+from ra2ce.analysis.analysis_config_data.analysis_config_data import (
+    AnalysisSectionLosses,
+)
+from ra2ce.analysis.analysis_config_data.enums.routing_engine_enum import (
+    RoutingEngineEnum,
+)
+from ra2ce.analysis.analysis_config_data.enums.weighing_enum import WeighingEnum
+from ra2ce.analysis.analysis_input_wrapper import AnalysisInputWrapper
+from ra2ce.analysis.losses.criticality_results_cache import CriticalityResultsCache
+from ra2ce.analysis.losses.multi_link_redundancy import MultiLinkRedundancy
+from ra2ce.network.graph_files.graph_file import GraphFile
+from ra2ce.network.hazard.hazard_names import HazardNames
+
+
+@pytest.fixture(name="hazard_graph")
+def _get_hazard_graph_fixture() -> Iterator[nx.MultiGraph]:
+    """
+    Triangle 1-2-3 of which hazard `EV1_ma` disrupts edge 1-2.
+    """
+    _graph = nx.MultiGraph(crs="EPSG:4326")
+    _coordinates = {1: (0, 0), 2: (1, 0), 3: (1, 1)}
+    for _node, (_x, _y) in _coordinates.items():
+        _graph.add_node(_node, x=_x, y=_y)
+    for _rfid, (u, v, _ev1) in enumerate([(1, 2, 1.0), (2, 3, 0.0), (3, 1, 0.0)]):
+        _graph.add_edge(
+            u,
+            v,
+            rfid=_rfid,
+            length=10.0,
+            avgspeed=50.0,
+            EV1_ma=_ev1,
+            geometry=LineString([_coordinates[u], _coordinates[v]]),
+        )
+    yield _graph
+
+
+class TestCriticalityResultsCache:
+    def _get_analysis(
+        self,
+        graph: nx.MultiGraph,
+        threshold: float = 0.5,
+        routing_engine: RoutingEngineEnum = RoutingEngineEnum.NONE,
+    ) -> MultiLinkRedundancy:
+        return MultiLinkRedundancy(
+            AnalysisInputWrapper(
+                analysis=AnalysisSectionLosses(
+                    name="criticality_results_cache_test",
+                    threshold=threshold,
+                    weighing=WeighingEnum.LENGTH,
+                    routing_engine=routing_engine,
+                ),
+                graph_file=None,
+                graph_file_hazard=GraphFile(graph=graph),
+                input_path=None,
+                static_path=None,
+                output_path=None,
+                hazard_names=HazardNames(
+                    pd.DataFrame({"File name": ["ev1"], "RA2CE name": ["EV1_ma"]})
+                ),
+                origins_destinations=None,
+                file_id="rfid",
+            )
+        )
+
+    def _count_executions(
+        self, analysis: MultiLinkRedundancy, monkeypatch: pytest.MonkeyPatch
+    ) -> list[int]:
+        _executions = []
+        _execute = analysis.execute
+
+        def _counted_execute():
+            _executions.append(1)
+            return _execute()
+
+        monkeypatch.setattr(analysis, "execute", _counted_execute)
+        return _executions
+
+    def test_get_key_of_equal_inputs(self, hazard_graph: nx.MultiGraph):
+        # 1. Define test data.
+        _cache = CriticalityResultsCache()
+        _analysis = self._get_analysis(hazard_graph)
+
+        # 2. Run test.
+        _key = _cache.get_key(_analysis)
+
+        # 3. Verify expectations.
+        # The key depends on the content of the graph, not on the graph object.
+        assert _key == _cache.get_key(self._get_analysis(copy.deepcopy(hazard_graph)))
+        assert _key != _cache.get_key(self._get_analysis(hazard_graph, threshold=0.2))
+        assert _key != _cache.get_key(
+            self._get_analysis(hazard_graph, routing_engine=RoutingEngineEnum.CSR)
+        )
+        _other_graph = copy.deepcopy(hazard_graph)
+        _other_graph.edges[1, 2, 0]["EV1_ma"] = 2.0
+        assert _key != _cache.get_key(self._get_analysis(_other_graph))
+
+    def test_get_key_of_released_graph(self, hazard_graph: nx.MultiGraph):
+        # 1. Define test data.
+        _cache = CriticalityResultsCache()
+        _graph = copy.deepcopy(hazard_graph)
+        _key = _cache.get_key(self._get_analysis(_graph))
+
+        # 2. Run test.
+        del _graph
+        gc.collect()
+
+        # 3. Verify expectations.
+        # The hash of a released graph is not kept, so it cannot be reused for a new graph.
+        assert len(_cache._graph_hashes) == 0
+        _other_graph = copy.deepcopy(hazard_graph)
+        _other_graph.edges[1, 2, 0]["EV1_ma"] = 2.0
+        assert _key != _cache.get_key(self._get_analysis(_other_graph))
+
+    def test_get_result_executes_once(
+        self, hazard_graph: nx.MultiGraph, monkeypatch: pytest.MonkeyPatch
+    ):
+        # 1. Define test data.
+        _cache = CriticalityResultsCache()
+        _analysis = self._get_analysis(hazard_graph)
+        _other_analysis = self._get_analysis(hazard_graph)
+        _executions = self._count_executions(_analysis, monkeypatch)
+        _other_executions = self._count_executions(_other_analysis, monkeypatch)
+
+        # 2. Run test.
+        _result = _cache.get_result(_analysis)
+        _result["diff_length"] = 0
+        _other_result = _cache.get_result(_other_analysis)
+
+        # 3. Verify expectations.
+        assert len(_executions) == 1
+        assert not _other_executions
+        # A copy of the result is returned, so altering it does not alter the cache.
+        pd.testing.assert_frame_equal(_other_result, _analysis.execute())
+
+    def test_get_result_from_disk(
+        self,
+        hazard_graph: nx.MultiGraph,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        # 1. Define test data.
+        _analysis = self._get_analysis(hazard_graph)
+        _expected_result = CriticalityResultsCache(cache_path=tmp_path).get_result(
+            _analysis
+        )
+        _executions = self._count_executions(_analysis, monkeypatch)
+
+        # 2. Run test.
+        _result = CriticalityResultsCache(cache_path=tmp_path).get_result(_analysis)
+
+        # 3. Verify expectations.
+        assert not _executions
+        assert tmp_path.joinpath(
+            f"{CriticalityResultsCache().get_key(_analysis)}.pkl"
+        ).is_file()
+        pd.testing.assert_frame_equal(_result, _expected_result)
@@ -0,0 +1,72 @@
+import networkx as nx
+import pytest
+
+from ra2ce.analysis.losses.hazard_executor import HazardExecutor
+
+
+def _count_disrupted_edges(graph: nx.MultiGraph, hazard_name: str) -> int:
+    return sum(1 for *_, _data in graph.edges(data=True) if _data[hazard_name] > 0)
+
+
+class _CountedCalculation:
+    # Counts how often the calculation is pickled (in this process).
+    nr_pickled = 0
+
+    def __getstate__(self) -> dict:
+        _CountedCalculation.nr_pickled += 1
+        return self.__dict__
+
+    def __call__(self, graph: nx.MultiGraph, hazard_name: str) -> int:
+        return _count_disrupted_edges(graph, hazard_name)
+
+
+class TestHazardExecutor:
+    @pytest.fixture(name="hazard_graph")
+    def _get_hazard_graph_fixture(self) -> nx.MultiGraph:
+        _graph = nx.MultiGraph()
+        _graph.add_edge(1, 2, EV1_ma=1.0, EV2_ma=1.0, EV3_ma=0.0)
+        _graph.add_edge(2, 3, EV1_ma=0.0, EV2_ma=1.0, EV3_ma=0.0)
+        return _graph
+
+    @pytest.mark.parametrize("n_workers", [1, 2, 0])
+    def test_map_returns_results_in_hazard_order(
+        self, hazard_graph: nx.MultiGraph, n_workers: int
+    ):
+        # 1. Define test data.
+        _hazard_names = ["EV2_ma", "EV3_ma", "EV1_ma"]
+
+        # 2. Run test.
+        _results = HazardExecutor(hazard_graph, n_workers).map(
+            _count_disrupted_edges, _hazard_names
+        )
+
+        # 3. Verify expectations.
+        assert _results == [2, 0, 1]
+
+    def test_map_sends_calculation_once_per_worker(self, hazard_graph: nx.MultiGraph):
+        # 1. Define test data.
+        _hazard_names = ["EV1_ma", "EV2_ma", "EV3_ma", "EV1_ma"]
+        _CountedCalculation.nr_pickled = 0
+
+        # 2. Run test.
+        _results = HazardExecutor(hazard_graph, 2).map(
+            _CountedCalculation(), _hazard_names
+        )
+
+        # 3. Verify expectations.
+        assert _results == [1, 2, 0, 1]
+        assert _CountedCalculation.nr_pickled <= 2
+
+    def test_initialize_with_all_cores(self, hazard_graph: nx.MultiGraph):
+        # 1. Run test.
+        _executor = HazardExecutor(hazard_graph, 0)
+
+        # 2. Verify expectations.
+        assert _executor.n_workers >= 1
+
+    def test_map_without_hazards(self, hazard_graph: nx.MultiGraph):
+        # 1. Run test.
+        _results = HazardExecutor(hazard_graph, 2).map(_count_disrupted_edges, [])
+
+        # 2. Verify expectations.
+        assert _results == []
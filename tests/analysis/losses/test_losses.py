@@ -2,6 +2,7 @@ from pathlib import Path
 from typing import Iterator
 
 import geopandas as gpd
+import numpy as np
 import pandas as pd
 import pytest
 from shapely.geometry import LineString
@@ -19,8 +20,11 @@ from ra2ce.analysis.analysis_config_wrapper import AnalysisConfigWrapper
 from ra2ce.analysis.analysis_input_wrapper import AnalysisInputWrapper
 from ra2ce.analysis.losses.analysis_losses_protocol import AnalysisLossesProtocol
 from ra2ce.analysis.losses.losses_base import LossesBase
+from ra2ce.analysis.losses.losses_ensemble import LossesEnsemble
 from ra2ce.analysis.losses.multi_link_losses import MultiLinkLosses
+from ra2ce.analysis.losses.resilience_curves.resilience_curves import ResilienceCurves
 from ra2ce.analysis.losses.single_link_losses import SingleLinkLosses
+from ra2ce.analysis.losses.time_values.time_values import TimeValues
 from ra2ce.network.network_config_wrapper import NetworkConfigWrapper
 from tests import test_data
 
@@ -116,12 +120,13 @@ class TestLosses:
         assert isinstance(_losses, LossesBase)
         assert isinstance(_losses, losses_analysis)
 
-    def test_calc_vlh(
+    @pytest.fixture(name="single_link_losses")
+    def _get_single_link_losses(
         self,
         resilience_curves_csv: Path,
         traffic_intensities_csv: Path,
         time_values_csv: Path,
-    ):
+    ) -> Iterator[SingleLinkLosses]:
         def create_linestring(row):
             node_a_coords = (
                 node_coordinates_df.loc[
@@ -141,7 +146,6 @@ class TestLosses:
             )
             return LineString([node_a_coords, node_b_coords])
 
-        # 1. Define test data
         # Define latitude and longitude values for each node
         node_coordinates_data = {
             "node_id": [0, 1, 2, 3],
@@ -210,6 +214,11 @@ class TestLosses:
         _losses._get_disrupted_criticality_analysis_results(
             _losses.criticality_analysis
         )
+        yield _losses
+
+    def test_calc_vlh(self, single_link_losses: SingleLinkLosses):
+        # 1. Define test data
+        _losses = single_link_losses
 
         # 2. Run test.
 
@@ -228,3 +237,90 @@ class TestLosses:
             _result[["vlh_business_EV1_ma", "vlh_commute_EV1_ma"]],
             _expected_result[["vlh_business_EV1_ma", "vlh_commute_EV1_ma"]],
         )
+
+    @pytest.fixture(name="losses_ensemble")
+    def _get_losses_ensemble(
+        self, single_link_losses: SingleLinkLosses
+    ) -> Iterator[LossesEnsemble]:
+        _values_of_time = single_link_losses.values_of_time
+        _resilience_curves = single_link_losses.resilience_curves
+        yield LossesEnsemble(
+            values_of_time=[
+                _values_of_time,
+                TimeValues(
+                    time_values={
+                        _trip: (_value * 2, _occupants + 1)
+                        for _trip, (
+                            _value,
+                            _occupants,
+                        ) in _values_of_time.time_values.items()
+                    }
+                ),
+                _values_of_time,
+            ],
+            resilience_curves=[
+                _resilience_curves,
+                _resilience_curves,
+                ResilienceCurves(
+                    resilience_curves={
+                        _key: [(_duration, _ratio / 2) for _duration, _ratio in _curve]
+                        for _key, _curve in _resilience_curves.resilience_curves.items()
+                    }
+                ),
+            ],
+        )
+
+    def test_calc_vlh_ensemble_equals_members(
+        self, single_link_losses: SingleLinkLosses, losses_ensemble: LossesEnsemble
+    ):
+        # 1. Define test data
+        _losses = single_link_losses
+
+        # 2. Run test.
+        _result = _losses.calculate_vehicle_loss_hours(losses_ensemble)
+
+        # 3. Verify final expectations.
+        assert isinstance(_result, pd.DataFrame)
+        for _member, (_values_of_time, _resilience_curves) in enumerate(
+            losses_ensemble.get_members()
+        ):
+            _losses.values_of_time = _values_of_time
+            _losses.resilience_curves = _resilience_curves
+            _expected_result = _losses.calculate_vehicle_loss_hours()
+            for _column in [
+                "vlh_business_EV1_ma",
+                "vlh_commute_EV1_ma",
+                "vlh_EV1_ma_total",
+            ]:
+                pd.testing.assert_series_equal(
+                    _result[f"{_column}_member_{_member}"],
+                    _expected_result[_column],
+                    check_names=False,
+                )
+
+    def test_calc_vlh_ensemble_quantiles(
+        self, single_link_losses: SingleLinkLosses, losses_ensemble: LossesEnsemble
+    ):
+        # 1. Define test data
+        _members_result = single_link_losses.calculate_vehicle_loss_hours(
+            losses_ensemble
+        )
+        losses_ensemble.quantiles = [0.1, 0.5, 0.9]
+
+        # 2. Run test.
+        _result = single_link_losses.calculate_vehicle_loss_hours(losses_ensemble)
+
+        # 3. Verify final expectations.
+        assert not _result.filter(like="_member_").columns.any()
+        for _column in ["vlh_business_EV1_ma", "vlh_EV1_ma_total"]:
+            _expected_quantiles = np.quantile(
+                _members_result.filter(regex=f"^{_column}_member_").to_numpy(),
+                losses_ensemble.quantiles,
+                axis=1,
+            )
+            for _quantile, _expected in zip(
+                losses_ensemble.quantiles, _expected_quantiles
+            ):
+                assert _result[f"{_column}_q{_quantile}"].to_numpy() == pytest.approx(
+                    _expected
+                )
@@ -1,6 +1,12 @@
+import pandas as pd
 import pytest
 
 from ra2ce.analysis.losses.losses_base import LossesBase
+from ra2ce.analysis.losses.resilience_curves.compiled_resilience_curves import (
+    CompiledResilienceCurves,
+)
+from ra2ce.analysis.losses.resilience_curves.resilience_curves import ResilienceCurves
+from ra2ce.network.network_config_data.enums.road_type_enum import RoadTypeEnum
 
 
 class TestLossesBase:
@@ -13,3 +19,71 @@ class TestLossesBase:
         assert str(exc.value).startswith(
             f"Can't instantiate abstract class {LossesBase.__name__}"
         )
+
+    def test_get_relevant_link_types(self):
+        # 1. Define test data.
+        _resilience_curves = ResilienceCurves(
+            resilience_curves={
+                (RoadTypeEnum.MOTORWAY, (0.0, 0.5)): [(2.0, 1.0)],
+                (RoadTypeEnum.MOTORWAY, (0.5, 1.0)): [(2.0, 0.5)],
+                (RoadTypeEnum.PRIMARY, (0.5, 1.0)): [(4.0, 0.5)],
+            }
+        ).compile()
+        _link_types = pd.Series(
+            ["primary", ["motorway", "primary"], "trunk", ["primary", "motorway"]]
+        )
+
+        # 2. Run test.
+        (
+            _link_type_codes,
+            _relevant_link_types,
+            _errors,
+        ) = LossesBase._get_relevant_link_types(_link_types, _resilience_curves)
+
+        # 3. Verify expectations.
+        _ranges = _resilience_curves.ranges
+        _motorway = _resilience_curves.link_types.index(RoadTypeEnum.MOTORWAY)
+        _primary = _resilience_curves.link_types.index(RoadTypeEnum.PRIMARY)
+        _low, _high = _ranges.index((0.0, 0.5)), _ranges.index((0.5, 1.0))
+        _relevant = _relevant_link_types[_link_type_codes]
+        # A list of link types uses the one with the highest disruption.
+        assert _relevant[:, _low].tolist() == [-1, _motorway, -1, _motorway]
+        assert _relevant[:, _high].tolist() == [_primary, _primary, -1, _primary]
+        assert (
+            _errors[(_link_type_codes[2], _low)]
+            == "'trunk' with range (0.0, 0.5) was not found in the introduced resilience_curves"
+        )
+
+    def test_get_relevant_link_types_of_stacked_curves(self):
+        # 1. Define test data.
+        _curves = {
+            (RoadTypeEnum.MOTORWAY, (0.0, 0.5)): [(2.0, 1.0)],
+            (RoadTypeEnum.PRIMARY, (0.0, 0.5)): [(4.0, 0.4)],
+        }
+        _other_curves = {
+            (RoadTypeEnum.MOTORWAY, (0.0, 0.5)): [(2.0, 0.5)],
+            (RoadTypeEnum.PRIMARY, (0.0, 0.5)): [(4.0, 0.4)],
+        }
+        _resilience_curves = CompiledResilienceCurves.stack(
+            [
+                ResilienceCurves(resilience_curves=_curves).compile(),
+                ResilienceCurves(resilience_curves=_other_curves).compile(),
+            ]
+        )
+        _link_types = pd.Series([["motorway", "primary"], "motorway"])
+
+        # 2. Run test.
+        (
+            _link_type_codes,
+            _relevant_link_types,
+            _,
+        ) = LossesBase._get_relevant_link_types(_link_types, _resilience_curves)
+
+        # 3. Verify expectations.
+        _motorway = _resilience_curves.link_types.index(RoadTypeEnum.MOTORWAY)
+        _primary = _resilience_curves.link_types.index(RoadTypeEnum.PRIMARY)
+        # The link type with the highest disruption differs per member.
+        assert _relevant_link_types[:, _link_type_codes, 0].tolist() == [
+            [_motorway, _motorway],
+            [_primary, _motorway],
+        ]
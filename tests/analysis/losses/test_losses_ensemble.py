@@ -0,0 +1,90 @@
+from pathlib import Path
+
+import pytest
+
+from ra2ce.analysis.analysis_config_data.enums.trip_purpose_enum import TripPurposeEnum
+from ra2ce.analysis.losses.losses_ensemble import LossesEnsemble
+from ra2ce.analysis.losses.resilience_curves.resilience_curves import ResilienceCurves
+from ra2ce.analysis.losses.time_values.time_values import TimeValues
+from ra2ce.network.network_config_data.enums.road_type_enum import RoadTypeEnum
+
+
+class TestLossesEnsemble:
+    def test_from_files(self, time_values_csv: Path, resilience_curves_csv: Path):
+        # 1. Run test.
+        _ensemble = LossesEnsemble.from_files(
+            [time_values_csv, time_values_csv], [resilience_curves_csv], [0.5]
+        )
+
+        # 2. Verify expectations.
+        assert isinstance(_ensemble, LossesEnsemble)
+        assert _ensemble.nr_members == 2
+        assert _ensemble.quantiles == [0.5]
+        _values_of_time, _resilience_curves = _ensemble.get_members()[1]
+        assert _values_of_time.get_value_of_time(TripPurposeEnum.BUSINESS) == 5
+        assert _resilience_curves.has_resilience_curve(
+            RoadTypeEnum.MOTORWAY, (0.2, 0.5)
+        )
+
+    def test_get_members_shares_single_set(self):
+        # 1. Define test data.
+        _values_of_time = [
+            TimeValues(time_values={TripPurposeEnum.BUSINESS: (_value, 1)})
+            for _value in [5, 10, 15]
+        ]
+        _resilience_curves = ResilienceCurves()
+        _ensemble = LossesEnsemble(
+            values_of_time=_values_of_time, resilience_curves=[_resilience_curves]
+        )
+
+        # 2. Run test.
+        _members = _ensemble.get_members()
+
+        # 3. Verify expectations.
+        assert _ensemble.nr_members == 3
+        assert [_member[0] for _member in _members] == _values_of_time
+        assert all(_member[1] is _resilience_curves for _member in _members)
+
+    @pytest.mark.parametrize(
+        "nr_values_of_time, nr_resilience_curves, quantiles, expected_error",
+        [
+            pytest.param(
+                0,
+                1,
+                [],
+                "At least one set of values of time and resilience curves should be given",
+                id="No values of time",
+            ),
+            pytest.param(
+                2,
+                3,
+                [],
+                "The number of values of time and resilience curves sets should be equal (or one of them 1)",
+                id="Different number of sets",
+            ),
+            pytest.param(
+                2,
+                2,
+                [0.5, 1.5],
+                "Quantiles should be between 0 and 1",
+                id="Invalid quantile",
+            ),
+        ],
+    )
+    def test_initialize_with_invalid_members_raises(
+        self,
+        nr_values_of_time: int,
+        nr_resilience_curves: int,
+        quantiles: list[float],
+        expected_error: str,
+    ):
+        # 1. Run test.
+        with pytest.raises(ValueError) as exc_err:
+            LossesEnsemble(
+                values_of_time=[TimeValues()] * nr_values_of_time,
+                resilience_curves=[ResilienceCurves()] * nr_resilience_curves,
+                quantiles=quantiles,
+            )
+
+        # 2. Verify expectations.
+        assert str(exc_err.value) == expected_error
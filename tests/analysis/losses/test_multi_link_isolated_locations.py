@@ -0,0 +1,73 @@
+import numpy as np
+import pandas as pd
+from geopandas import GeoDataFrame, overlay
+from shapely.geometry import Point
+
+from ra2ce.analysis.losses.multi_link_isolated_locations import (
+    MultiLinkIsolatedLocations,
+)
+
+
+class TestMultiLinkIsolatedLocations:
+    def test_get_isolated_edges(self):
+        # 1. Define test data.
+        # Path 0-1-2-3-4 with a dead end 1-5, disconnected by removing edge 2-3.
+        _edge_nodes = np.array([(0, 1), (1, 2), (2, 3), (3, 4), (1, 5)])
+        _is_removed = np.array([False, False, True, False, False])
+
+        # 2. Run test.
+        _is_isolated = MultiLinkIsolatedLocations.get_isolated_edges(
+            6, _edge_nodes, _is_removed
+        )
+
+        # 3. Verify expectations.
+        assert _is_isolated.tolist() == [False, False, False, True, False]
+
+    def test_get_isolated_edges_with_equal_components(self):
+        # 1. Define test data.
+        # Path 0-1-2-3, split in two components of the same size.
+        _edge_nodes = np.array([(2, 3), (1, 2), (0, 1)])
+        _is_removed = np.array([False, True, False])
+
+        # 2. Run test.
+        _is_isolated = MultiLinkIsolatedLocations.get_isolated_edges(
+            4, _edge_nodes, _is_removed
+        )
+
+        # 3. Verify expectations.
+        # The component found first (of node 0) is the largest component.
+        assert _is_isolated.tolist() == [True, False, False]
+
+    def test_intersect_locations_equals_overlay(self):
+        # 1. Define test data.
+        _locations = GeoDataFrame(
+            {
+                "category": ["school", "hospital", "school", "shop"],
+                "geometry": [Point(0, 0), Point(5, 0), Point(1.5, 0), Point(9, 9)],
+            },
+            crs=4326,
+        )
+        _roads = GeoDataFrame(
+            {
+                "edge_fid": ["2_3", "0_1", "1_2"],
+                "i_type_EV1": ["isolated", "flooded", "flooded"],
+                "geometry": [
+                    Point(5, 0).buffer(1),
+                    Point(0, 0).buffer(2),
+                    Point(2, 0).buffer(1),
+                ],
+            },
+            crs=4326,
+        )
+
+        # 2. Run test.
+        _intersected = MultiLinkIsolatedLocations.intersect_locations(
+            _locations, _roads
+        )
+
+        # 3. Verify expectations.
+        assert len(_intersected) == 4
+        pd.testing.assert_frame_equal(
+            _intersected,
+            overlay(_locations, _roads, how="intersection", keep_geom_type=True),
+        )
@@ -0,0 +1,279 @@
+import shutil
+from pathlib import Path
+from typing import Iterator
+
+import geopandas as gpd
+import networkx as nx
+import pandas as pd
+import pytest
+from shapely.geometry import LineString, Point
+
+from ra2ce.analysis.analysis_config_data.analysis_config_data import (
+    AnalysisSectionLosses,
+)
+from ra2ce.analysis.analysis_config_data.enums.weighing_enum import WeighingEnum
+from ra2ce.analysis.analysis_input_wrapper import AnalysisInputWrapper
+from ra2ce.analysis.losses.multi_link_origin_destination import (
+    MultiLinkOriginDestination,
+)
+from ra2ce.analysis.losses.optimal_route_origin_destination import (
+    OptimalRouteOriginDestination,
+)
+from ra2ce.network.graph_files.graph_file import GraphFile
+from ra2ce.network.hazard.hazard_names import HazardNames
+from tests import test_results
+
+
+@pytest.fixture(name="od_graph")
+def _get_od_graph_fixture() -> Iterator[nx.MultiGraph]:
+    """
+    Ladder of two rows of 5 nodes (0-4 and 5-9), origins at 0 and 5, destinations at 4 and 9.
+    Hazard `EV1_ma` disrupts edge 1-2, hazard `EV2_ma` edges 6-7 and 7-8.
+    """
+    _graph = nx.MultiGraph(crs="EPSG:4326")
+    for _node in range(10):
+        _graph.add_node(_node, x=_node % 5, y=_node // 5)
+    for _node, _od_id in [(0, "O_0"), (5, "O_1"), (4, "D_0"), (9, "D_1")]:
+        _graph.nodes[_node]["od_id"] = _od_id
+
+    def _add_edge(u: int, v: int, ev1: float = 0.0, ev2: float = 0.0):
+        _graph.add_edge(
+            u,
+            v,
+            rfid=_graph.number_of_edges(),
+            length=1.0 if u // 5 == v // 5 else 3.0,
+            EV1_ma=ev1,
+            EV2_ma=ev2,
+            geometry=LineString([(u % 5, u // 5), (v % 5, v // 5)]),
+        )
+
+    for _row in (0, 5):
+        for _node in range(_row, _row + 4):
+            _add_edge(_node, _node + 1)
+    for _node in range(5):
+        _add_edge(_node, _node + 5)
+    _graph.edges[1, 2, 0]["EV1_ma"] = 1.0
+    _graph.edges[6, 7, 0]["EV2_ma"] = 1.0
+    _graph.edges[7, 8, 0]["EV2_ma"] = 1.0
+    yield _graph
+
+
+class TestMultiLinkOriginDestination:
+    def _get_analysis(
+        self, graph: nx.MultiGraph, static_path: Path
+    ) -> MultiLinkOriginDestination:
+        _od_table = gpd.GeoDataFrame(
+            {
+                "o_id": ["O_0", "O_1", None, None],
+                "d_id": [None, None, "D_0", "D_1"],
+                "geometry": [Point(0, 0)] * 4,
+            },
+            crs=4326,
+        )
+        _od_table_path = static_path.joinpath(
+            "output_graph", "origin_destination_table.feather"
+        )
+        _od_table_path.parent.mkdir(parents=True)
+        _od_table.to_feather(_od_table_path)
+        return MultiLinkOriginDestination(
+            AnalysisInputWrapper(
+                analysis=AnalysisSectionLosses(
+                    name="multi_link_origin_destination_test",
+                    threshold=0.5,
+                    weighing=WeighingEnum.LENGTH,
+                    save_gpkg=True,
+                ),
+                graph_file=None,
+                graph_file_hazard=GraphFile(graph=graph),
+                input_path=None,
+                static_path=static_path,
+                output_path=None,
+                hazard_names=HazardNames(
+                    pd.DataFrame(
+                        {
+                            "File name": ["ev1", "ev2"],
+                            "RA2CE name": ["EV1_ma", "EV2_ma"],
+                        }
+                    )
+                ),
+                origins_destinations=None,
+                file_id="rfid",
+            )
+        )
+
+    def test_get_edge_route_index(self):
+        # 1. Define test data.
+        _od_routes = [(2.0, [0, 1, 2]), None, (1.0, [2, 1])]
+
+        # 2. Run test.
+        _edge_routes = MultiLinkOriginDestination._get_edge_route_index(
+            _od_routes, False
+        )
+
+        # 3. Verify expectations.
+        assert _edge_routes == {frozenset((0, 1)): [0], frozenset((1, 2)): [0, 2]}
+
+    def test_multi_link_origin_destination_equals_rerouting_all_pairs(
+        self, od_graph: nx.MultiGraph, request: pytest.FixtureRequest
+    ):
+        # 1. Define test data.
+        _static_path = test_results.joinpath(request.node.name)
+        if _static_path.exists():
+            shutil.rmtree(_static_path)
+        _analysis = self._get_analysis(od_graph, _static_path)
+        _od_nodes = _analysis._get_origin_destination_pairs(od_graph)
+
+        # 2. Run test.
+        _result = _analysis.multi_link_origin_destination(od_graph, _analysis.analysis)
+
+        # 3. Verify expectations.
+        for _hazard_name in ["EV1_ma", "EV2_ma"]:
+            _graph_hz = od_graph.copy()
+            _graph_hz.remove_edges_from(
+                [e for e in od_graph.edges(keys=True, data=_hazard_name) if e[-1] > 0]
+            )
+            _expected = OptimalRouteOriginDestination.find_route_ods(
+                _graph_hz, _od_nodes, WeighingEnum.LENGTH
+            )
+            _expected["hazard"] = _hazard_name
+            pd.testing.assert_frame_equal(
+                _result[_result["hazard"] == _hazard_name].reset_index(drop=True),
+                _expected,
+            )
+        assert _result.loc[_result["hazard"] == "EV1_ma", "length"].tolist() == [
+            10.0,
+            7.0,
+            7.0,
+            4.0,
+        ]
+
+    @pytest.fixture(name="od_impact_analysis")
+    def _get_od_impact_analysis_fixture(
+        self, od_graph: nx.MultiGraph, request: pytest.FixtureRequest
+    ) -> Iterator[MultiLinkOriginDestination]:
+        _static_path = test_results.joinpath(request.node.name)
+        if _static_path.exists():
+            shutil.rmtree(_static_path)
+        yield self._get_analysis(od_graph, _static_path)
+
+    @pytest.fixture(name="od_routes")
+    def _get_od_routes_fixture(self) -> Iterator[tuple[pd.DataFrame, pd.DataFrame]]:
+        """
+        Routes without disruption (first) and with disruption by two hazards (second),
+        of which the pair O_1,O_2 - D_0 is disconnected by `EV1_ma`.
+        """
+        _gdf_ori = pd.DataFrame(
+            {
+                "origin": ["O_0", "O_0", "O_1,O_2", "O_1,O_2"],
+                "destination": ["D_0", "D_1", "D_0", "D_1"],
+                "length": [4.0, 2.0, 5.0, 10.0],
+            }
+        )
+        _gdf = pd.DataFrame(
+            {
+                "origin": ["O_0", "O_0", "O_1,O_2", "O_0", "O_1,O_2"],
+                "destination": ["D_0", "D_1", "D_1", "D_0", "D_0"],
+                "length": [5.0, 2.0, 12.0, 4.0, 6.0],
+                "hazard": ["EV1_ma", "EV1_ma", "EV1_ma", "EV2_ma", "EV2_ma"],
+            }
+        )
+        yield _gdf_ori, _gdf
+
+    def test_multi_link_origin_destination_impact(
+        self,
+        od_impact_analysis: MultiLinkOriginDestination,
+        od_routes: tuple[pd.DataFrame, pd.DataFrame],
+    ):
+        # 1. Define test data.
+        _gdf_ori, _gdf = od_routes
+
+        # 2. Run test.
+        (
+            _diff_df,
+            _impact_df,
+        ) = od_impact_analysis.multi_link_origin_destination_impact(_gdf, _gdf_ori)
+
+        # 3. Verify expectations.
+        assert _diff_df["hazard"].tolist() == ["EV1_ma", "EV2_ma"]
+        assert _diff_df.loc[1, "origin_disconnected_abs"].to_dict() == {
+            "O_0": 1,
+            "O_1,O_2": 2,
+        }
+        assert _diff_df["max_increase_abs"].tolist() == [2.0, 1.0]
+        assert _diff_df["mean_increase_pc (%)"].tolist() == [15.0, 10.0]
+        pd.testing.assert_series_equal(
+            _impact_df["diff_length_EV1_ma_pc"],
+            pd.Series([25.0, 0.0, None, 20.0], name="diff_length_EV1_ma_pc"),
+        )
+
+    def test_multi_link_origin_destination_impact_without_routes(
+        self,
+        od_impact_analysis: MultiLinkOriginDestination,
+        od_routes: tuple[pd.DataFrame, pd.DataFrame],
+    ):
+        # 1. Define test data.
+        _gdf_ori, _gdf = od_routes
+        _gdf_ori = _gdf_ori.iloc[:0]
+        _gdf = _gdf.iloc[:0]
+
+        # 2. Run test.
+        (
+            _diff_df,
+            _impact_df,
+        ) = od_impact_analysis.multi_link_origin_destination_impact(_gdf, _gdf_ori)
+
+        # 3. Verify expectations.
+        assert _diff_df.empty
+        assert "max_increase_abs" in _diff_df.columns
+        assert _impact_df.empty
+
+    def test_multi_link_origin_destination_regional_impact(
+        self,
+        od_impact_analysis: MultiLinkOriginDestination,
+        od_routes: tuple[pd.DataFrame, pd.DataFrame],
+    ):
+        # 1. Define test data.
+        _od_table = gpd.GeoDataFrame(
+            {
+                "o_id": ["O_0", "O_1", "O_2", "O_10", None],
+                "region": ["south", "north", "south", "north", None],
+                "geometry": [Point(0, 0)] * 5,
+            },
+            crs=4326,
+        )
+        _od_table.to_file(
+            od_impact_analysis.static_path.joinpath(
+                "output_graph", "origin_destination_table.gpkg"
+            )
+        )
+        _gdf_ori, _gdf = od_routes
+        _, _impact_df = od_impact_analysis.multi_link_origin_destination_impact(
+            _gdf, _gdf_ori
+        )
+
+        # 2. Run test.
+        (
+            _origin_impact,
+            _region_impact,
+        ) = od_impact_analysis.multi_link_origin_destination_regional_impact(_impact_df)
+
+        # 3. Verify expectations.
+        assert list(_origin_impact.columns) == [
+            "o_id",
+            "region",
+            "init_length",
+            "init_destination",
+            "EV1_ma_pc_increase",
+            "EV1_ma_pc_disconnect",
+            "EV2_ma_pc_increase",
+            "EV2_ma_pc_disconnect",
+        ]
+        # O_10 has no routes, it is not related to those of O_1.
+        assert _origin_impact["o_id"].tolist() == ["O_1", "O_10", "O_0", "O_2"]
+        assert _origin_impact["init_destination"].tolist() == [2.0, 0.0, 2.0, 2.0]
+        assert _origin_impact["EV1_ma_pc_increase"].tolist()[2:] == [12.5, 20.0]
+        assert _origin_impact["EV2_ma_pc_disconnect"].tolist()[2:] == [50.0, 50.0]
+        assert _region_impact["init_length"].to_dict() == {
+            "north": 7.5,
+            "south": 5.25,
+        }
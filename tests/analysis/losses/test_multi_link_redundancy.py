@@ -0,0 +1,191 @@
+import copy
+import math
+from typing import Iterator
+
+import networkx as nx
+import pandas as pd
+import pytest
+from shapely.geometry import LineString
+
+from ra2ce.analysis.analysis_config_data.analysis_config_data import (
+    AnalysisSectionLosses,
+)
+from ra2ce.analysis.analysis_config_data.enums.routing_engine_enum import (
+    RoutingEngineEnum,
+)
+from ra2ce.analysis.analysis_config_data.enums.weighing_enum import WeighingEnum
+from ra2ce.analysis.analysis_input_wrapper import AnalysisInputWrapper
+from ra2ce.analysis.losses.multi_link_redundancy import MultiLinkRedundancy
+from ra2ce.analysis.losses.routing_engine.csr_graph import CsrGraph
+from ra2ce.network.graph_files.graph_file import GraphFile
+from ra2ce.network.hazard.hazard_names import HazardNames
+
+
+@pytest.fixture(name="hazard_graph")
+def _get_hazard_graph_fixture() -> Iterator[nx.MultiGraph]:
+    """
+    Square 1-2-3-4 with a dead end 4-5.
+    Hazard `EV1_ma` disrupts edge 1-2, hazard `EV2_ma` edges 1-2 and 3-4.
+    """
+    _graph = nx.MultiGraph(crs="EPSG:4326")
+    _coordinates = {1: (0, 0), 2: (1, 0), 3: (1, 1), 4: (0, 1), 5: (0, 2)}
+    for _node, (_x, _y) in _coordinates.items():
+        _graph.add_node(_node, x=_x, y=_y)
+    for _rfid, (u, v, _ev1, _ev2) in enumerate(
+        [
+            (1, 2, 1.0, 1.0),
+            (2, 3, 0.0, 0.0),
+            (3, 4, 0.0, 1.0),
+            (4, 1, 0.0, 0.0),
+            (4, 5, 0.0, 0.0),
+        ]
+    ):
+        _graph.add_edge(
+            u,
+            v,
+            rfid=_rfid,
+            length=10.0,
+            avgspeed=50.0,
+            EV1_ma=_ev1,
+            EV2_ma=_ev2,
+            geometry=LineString([_coordinates[u], _coordinates[v]]),
+        )
+    yield _graph
+
+
+class TestMultiLinkRedundancy:
+    def _get_analysis(
+        self,
+        graph: nx.MultiGraph,
+        n_workers: int = 1,
+        routing_engine: RoutingEngineEnum = RoutingEngineEnum.NONE,
+    ) -> MultiLinkRedundancy:
+        return MultiLinkRedundancy(
+            AnalysisInputWrapper(
+                analysis=AnalysisSectionLosses(
+                    name="multi_link_redundancy_test",
+                    threshold=0.5,
+                    weighing=WeighingEnum.LENGTH,
+                    n_workers=n_workers,
+                    routing_engine=routing_engine,
+                ),
+                graph_file=None,
+                graph_file_hazard=GraphFile(graph=graph),
+                input_path=None,
+                static_path=None,
+                output_path=None,
+                hazard_names=HazardNames(
+                    pd.DataFrame(
+                        {
+                            "File name": ["ev1", "ev2"],
+                            "RA2CE name": ["EV1_ma", "EV2_ma"],
+                        }
+                    )
+                ),
+                origins_destinations=None,
+                file_id="rfid",
+            )
+        )
+
+    @pytest.mark.parametrize(
+        "routing_engine",
+        [
+            pytest.param(_engine, id=_engine.config_value)
+            for _engine in [
+                RoutingEngineEnum.NONE,
+                RoutingEngineEnum.NETWORKX,
+                RoutingEngineEnum.CSR,
+                RoutingEngineEnum.REPLACEMENT_PATHS,
+            ]
+        ],
+    )
+    def test_execute(
+        self, hazard_graph: nx.MultiGraph, routing_engine: RoutingEngineEnum
+    ):
+        # 1. Define test data.
+        _analysis = self._get_analysis(hazard_graph, routing_engine=routing_engine)
+
+        # 2. Run test.
+        _result = _analysis.execute()
+
+        # 3. Verify expectations.
+        assert len(_result) == 2 * hazard_graph.number_of_edges()
+        assert _result["hazard"].tolist() == ["EV1_ma"] * 5 + ["EV2_ma"] * 5
+
+        _disrupted = _result[_result["connected"].notna()].set_index(["hazard", "rfid"])
+        assert _disrupted.loc[("EV1_ma", "0"), "alt_length"] == 30.0
+        assert _disrupted.loc[("EV1_ma", "0"), "diff_length"] == 20.0
+        assert _disrupted.loc[("EV2_ma", "0"), "connected"] == 0
+        assert math.isnan(_disrupted.loc[("EV2_ma", "2"), "alt_length"])
+
+    @pytest.mark.parametrize(
+        "routing_engine, uses_csr",
+        [
+            pytest.param(RoutingEngineEnum.NETWORKX, False, id="networkx"),
+            pytest.param(RoutingEngineEnum.CSR, True, id="csr"),
+        ],
+    )
+    def test_execute_uses_configured_routing_engine(
+        self,
+        hazard_graph: nx.MultiGraph,
+        routing_engine: RoutingEngineEnum,
+        uses_csr: bool,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        # 1. Define test data.
+        _analysis = self._get_analysis(hazard_graph, routing_engine=routing_engine)
+        _csr_graphs = []
+        _from_graph = CsrGraph.from_graph
+
+        def _from_graph_counted(*args, **kwargs) -> CsrGraph:
+            _csr_graphs.append(_from_graph(*args, **kwargs))
+            return _csr_graphs[-1]
+
+        monkeypatch.setattr(CsrGraph, "from_graph", _from_graph_counted)
+
+        # 2. Run test.
+        _analysis.execute()
+
+        # 3. Verify expectations.
+        assert bool(_csr_graphs) == uses_csr
+
+    def test_execute_in_parallel_equals_serial(self, hazard_graph: nx.MultiGraph):
+        # 1. Define test data.
+        _expected = self._get_analysis(hazard_graph).execute()
+        _analysis = self._get_analysis(hazard_graph, n_workers=2)
+
+        # 2. Run test.
+        _result = _analysis.execute()
+
+        # 3. Verify expectations.
+        pd.testing.assert_frame_equal(_result, _expected)
+
+    def test_execute_does_not_alter_graph(self, hazard_graph: nx.MultiGraph):
+        # 1. Define test data.
+        for *_, _data in hazard_graph.edges(data=True):
+            del _data["length"]
+        _expected_edges = copy.deepcopy(list(hazard_graph.edges(keys=True, data=True)))
+        _analysis = self._get_analysis(hazard_graph)
+
+        # 2. Run test.
+        _analysis.execute()
+
+        # 3. Verify expectations.
+        assert list(hazard_graph.edges(keys=True, data=True)) == _expected_edges
+
+    def test_update_time_fills_missing_time(self, hazard_graph: nx.MultiGraph):
+        # 1. Define test data.
+        _analysis = self._get_analysis(hazard_graph)
+        _df_calculated = pd.DataFrame({"time": [0.5, None]})
+        _gdf_graph = pd.DataFrame(
+            {"length": [10.0, 2000.0, 3000.0], "avgspeed": [50.0, 100.0, 0.0]}
+        )
+
+        # 2. Run test.
+        _df_result, _gdf_result = _analysis._update_time(_df_calculated, _gdf_graph)
+
+        # 3. Verify expectations.
+        assert _df_result is _df_calculated
+        assert _gdf_result["time"].iloc[0] == 0.5
+        assert _gdf_result["time"].iloc[1] == pytest.approx(0.02)
+        assert math.isnan(_gdf_result["time"].iloc[2])
@@ -0,0 +1,213 @@
+import random
+from typing import Iterator
+
+import networkx as nx
+import pytest
+from shapely.geometry import LineString, MultiLineString, Point
+
+from ra2ce.analysis.analysis_config_data.enums.weighing_enum import WeighingEnum
+from ra2ce.analysis.losses.optimal_route_origin_destination import (
+    OptimalRouteOriginDestination,
+)
+
+
+@pytest.fixture(name="od_graph")
+def _get_od_graph_fixture() -> Iterator[nx.MultiGraph]:
+    """
+    Grid of 6x6 nodes with random lengths, some parallel edges
+    and a disconnected node 99.
+    """
+    _random = random.Random(42)
+    _graph = nx.MultiGraph()
+    for u, v in nx.grid_2d_graph(6, 6).edges():
+        for _ in range(_random.choice([1, 1, 2])):
+            _graph.add_edge(
+                u[0] * 6 + u[1],
+                v[0] * 6 + v[1],
+                length=_random.uniform(1.0, 10.0),
+                rfid=_graph.number_of_edges(),
+                geometry=LineString([u, v]),
+            )
+    _graph.add_node(99)
+    yield _graph
+
+
+class TestOptimalRouteOriginDestination:
+    @pytest.mark.parametrize(
+        "origins, destinations",
+        [
+            pytest.param(
+                [0, 7, 21], [35, 14, 2, 30, 99], id="More destinations than origins"
+            ),
+            pytest.param(
+                [0, 7, 21, 99, 30], [35, 14], id="More origins than destinations"
+            ),
+        ],
+    )
+    def test_get_shortest_routes_equals_networkx(
+        self, od_graph: nx.MultiGraph, origins: list[int], destinations: list[int]
+    ):
+        # 1. Define test data.
+        _node_pairs = [(o, d) for o in origins for d in destinations]
+
+        # 2. Run test.
+        _routes = OptimalRouteOriginDestination.get_shortest_routes(
+            od_graph, _node_pairs, "length"
+        )
+
+        # 3. Verify expectations.
+        assert len(_routes) == len(_node_pairs)
+        for (o, d), _route in zip(_node_pairs, _routes):
+            if not nx.has_path(od_graph, o, d):
+                assert _route is None
+                continue
+            _distance, _path = nx.single_source_dijkstra(
+                od_graph, o, d, weight="length"
+            )
+            assert _route[0] == pytest.approx(_distance)
+            assert _route[1][0] == o and _route[1][-1] == d
+            assert nx.path_weight(
+                od_graph, _route[1], weight="length"
+            ) == pytest.approx(_distance)
+
+    def test_get_shortest_routes_with_equally_short_routes(self):
+        # 1. Define test data.
+        # Grid of 3x3 nodes with equal lengths, with many equally short routes.
+        _graph = nx.MultiGraph()
+        for u, v in nx.grid_2d_graph(3, 3).edges():
+            _graph.add_edge(u[0] * 3 + u[1], v[0] * 3 + v[1], length=1.0)
+        _node_pairs = [(o, d) for o in [0, 2, 6, 1, 3] for d in [8]]
+
+        # 2. Run test.
+        _routes = OptimalRouteOriginDestination.get_shortest_routes(
+            _graph, _node_pairs, "length"
+        )
+
+        # 3. Verify expectations.
+        assert _routes == [
+            nx.single_source_dijkstra(_graph, o, d, weight="length")
+            for o, d in _node_pairs
+        ]
+
+    def test_get_shortest_routes_on_directed_graph(self):
+        # 1. Define test data.
+        _graph = nx.MultiDiGraph()
+        _graph.add_edge(1, 2, length=1.0)
+        _graph.add_edge(2, 3, length=1.0)
+        _graph.add_edge(3, 1, length=1.0)
+        _node_pairs = [(1, 3), (2, 3), (3, 2)]
+
+        # 2. Run test.
+        _routes = OptimalRouteOriginDestination.get_shortest_routes(
+            _graph, _node_pairs, "length"
+        )
+
+        # 3. Verify expectations.
+        assert _routes == [(2.0, [1, 2, 3]), (1.0, [2, 3]), (2.0, [3, 1, 2])]
+
+    def test_get_shortest_routes_searches_once_per_run_of_origins(
+        self, monkeypatch: pytest.MonkeyPatch
+    ):
+        # 1. Define test data.
+        _graph = nx.MultiGraph()
+        _graph.add_edge(1, 2, length=1.0)
+        _graph.add_edge(2, 3, length=1.0)
+        _graph.add_node(4)
+        _node_pairs = iter([(1, 2), (1, 3), (2, 3), (1, 4), (3, 3)])
+        _sources = []
+        _dijkstra = nx.dijkstra_predecessor_and_distance
+
+        def _dijkstra_logged(graph, source, **kwargs):
+            _sources.append(source)
+            return _dijkstra(graph, source, **kwargs)
+
+        monkeypatch.setattr(nx, "dijkstra_predecessor_and_distance", _dijkstra_logged)
+
+        # 2. Run test.
+        _routes = OptimalRouteOriginDestination.get_shortest_routes(
+            _graph, _node_pairs, "length"
+        )
+
+        # 3. Verify expectations.
+        assert _sources == [1, 2, 1, 3]
+        assert _routes == [
+            (1.0, [1, 2]),
+            (2.0, [1, 2, 3]),
+            (1.0, [2, 3]),
+            None,
+            (0, [3]),
+        ]
+
+    def test_find_route_ods(self, od_graph: nx.MultiGraph):
+        # 1. Define test data.
+        _od_nodes = [
+            ((0, "O_0"), (35, "D_0")),
+            ((0, "O_0"), (99, "D_1")),
+            ((7, "O_1"), (35, "D_0")),
+        ]
+
+        # 2. Run test.
+        _result = OptimalRouteOriginDestination.find_route_ods(
+            od_graph, _od_nodes, WeighingEnum.LENGTH
+        )
+
+        # 3. Verify expectations.
+        assert _result["origin"].tolist() == ["O_0", "O_1"]
+        assert _result["destination"].tolist() == ["D_0", "D_0"]
+        for _, _row in _result.iterrows():
+            _distance, _path = nx.single_source_dijkstra(
+                od_graph, _row["o_node"], _row["d_node"], weight="length"
+            )
+            assert _row["length"] == pytest.approx(_distance)
+            assert _row["opt_path"] == _path
+            assert len(_row["match_ids"]) == len(_path) - 1
+
+    def test_find_route_ods_without_geometry(self, od_graph: nx.MultiGraph):
+        # 1. Define test data.
+        _od_nodes = [((0, "O_0"), (35, "D_0")), ((7, "O_1"), (35, "D_0"))]
+        _expected = OptimalRouteOriginDestination.find_route_ods(
+            od_graph, _od_nodes, WeighingEnum.LENGTH
+        )
+
+        # 2. Run test.
+        _result = OptimalRouteOriginDestination.find_route_ods(
+            od_graph, _od_nodes, WeighingEnum.LENGTH, with_geometry=False
+        )
+
+        # 3. Verify expectations.
+        assert _result.geometry.isna().all()
+        assert _result.drop(columns="geometry").equals(
+            _expected.drop(columns="geometry")
+        )
+
+    def test_get_route_geometry(self):
+        # 1. Define test data.
+        _graph = nx.MultiGraph()
+        _graph.add_node(1, geometry=Point(0, 0))
+        _graph.add_node(2, geometry=Point(1, 0))
+        _graph.add_node(3, geometry=Point(1, 1))
+        _route_edges = [
+            dict(geometry=LineString([(0, 0), (0.5, -0.5), (1, 0)])),
+            dict(),
+        ]
+
+        # 2. Run test.
+        _geometry = OptimalRouteOriginDestination.get_route_geometry(
+            _graph, [1, 2, 3], _route_edges
+        )
+
+        # 3. Verify expectations.
+        assert _geometry.equals(
+            MultiLineString(
+                [[(0, 0), (0.5, -0.5), (1, 0)], [(1, 0), (1, 1)]],
+            )
+        )
+
+    def test_get_route_geometry_without_edges(self):
+        # 1. Run test.
+        _geometry = OptimalRouteOriginDestination.get_route_geometry(
+            nx.MultiGraph(), [1], []
+        )
+
+        # 2. Verify expectations.
+        assert _geometry.is_empty
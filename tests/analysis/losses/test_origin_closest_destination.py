@@ -1,3 +1,10 @@
+import copy
+
+import geopandas as gpd
+import networkx as nx
+import pytest
+from shapely.geometry import LineString, Point
+
 from ra2ce.analysis.analysis_config_data.analysis_config_data import (
     AnalysisConfigData,
     AnalysisSectionLosses,
@@ -6,6 +13,7 @@ from ra2ce.analysis.analysis_config_data.enums.weighing_enum import WeighingEnum
 from ra2ce.analysis.analysis_config_wrapper import AnalysisConfigWrapper
 from ra2ce.analysis.analysis_input_wrapper import AnalysisInputWrapper
 from ra2ce.analysis.losses.origin_closest_destination import OriginClosestDestination
+from ra2ce.network.graph_files.graph_file import GraphFile
 from ra2ce.network.graph_files.graph_files_collection import GraphFilesCollection
 from ra2ce.network.network_config_data.network_config_data import (
     NetworkSection,
@@ -13,7 +21,197 @@ from ra2ce.network.network_config_data.network_config_data import (
 )
 
 
+@pytest.fixture(name="od_graph")
+def _get_od_graph_fixture() -> nx.MultiGraph:
+    """
+    Path 0-1-2-3-4 with origins at 0 and 4, a destination at 3,
+    and an origin at the disconnected node 9.
+    """
+    _graph = nx.MultiGraph()
+    for _node in [0, 1, 2, 3, 4, 9]:
+        _graph.add_node(_node, geometry=Point(_node, 0))
+    for _node in range(4):
+        _graph.add_edge(
+            _node,
+            _node + 1,
+            length=1.0,
+            rfid=_node,
+            geometry=LineString([(_node, 0), (_node + 1, 0)]),
+        )
+    _graph.nodes[0]["od_id"] = "A_0"
+    _graph.nodes[4]["od_id"] = "A_1"
+    _graph.nodes[9]["od_id"] = "A_2"
+    _graph.nodes[3]["od_id"] = "B_0"
+    return _graph
+
+
 class TestOriginClosestDestination:
+    def _get_analysis(self, graph: nx.MultiGraph) -> OriginClosestDestination:
+        return OriginClosestDestination(
+            AnalysisInputWrapper(
+                analysis=AnalysisSectionLosses(
+                    threshold=0.5, weighing=WeighingEnum.LENGTH
+                ),
+                graph_file=GraphFile(graph=graph),
+                graph_file_hazard=None,
+                input_path=None,
+                static_path=None,
+                output_path=None,
+                hazard_names=None,
+                origins_destinations=OriginsDestinationsSection(
+                    origins_names="A",
+                    destinations_names="B",
+                    id_name_origin_destination="ID",
+                    origin_count="POPULATION",
+                ),
+                file_id="rfid",
+            )
+        )
+
+    def test_get_closest_routes(self, od_graph: nx.MultiGraph):
+        # 1. Define test data.
+        _ocd = self._get_analysis(od_graph)
+
+        # 2. Run test.
+        _closest_routes = _ocd.get_closest_routes(od_graph, [3], [0, 4, 9])
+
+        # 3. Verify expectations.
+        assert _closest_routes == {0: (3.0, [0, 1, 2, 3]), 4: (1.0, [4, 3])}
+
+    def test_find_closest_location_does_not_alter_graph(self, od_graph: nx.MultiGraph):
+        # 1. Define test data.
+        _ocd = self._get_analysis(od_graph)
+        _expected_nodes = copy.deepcopy(list(od_graph.nodes(data=True)))
+        _expected_edges = copy.deepcopy(list(od_graph.edges(keys=True, data=True)))
+        _origins = gpd.GeoDataFrame(
+            {"o_id": ["A_0", "A_1", "A_2"], "ID": [0, 1, 2], "POPULATION": [10, 20, 30]}
+        )
+        _destinations = gpd.GeoDataFrame({"d_id": ["B_0"], "ID": [0], "noHaz_P": [0]})
+
+        # 2. Run test.
+        (
+            _base_graph,
+            _origins,
+            _destinations,
+            _,
+            _optimal_routes,
+        ) = _ocd.find_closest_location(
+            od_graph, copy.deepcopy(od_graph), _origins, _destinations, "noHaz"
+        )
+
+        # 3. Verify expectations.
+        assert list(od_graph.nodes(data=True)) == _expected_nodes
+        assert list(od_graph.edges(keys=True, data=True)) == _expected_edges
+        assert _optimal_routes["origin"].tolist() == ["A_0", "A_1"]
+        assert _optimal_routes["length"].tolist() == [3.0, 1.0]
+        assert _origins["noHaz_A"].tolist() == ["access", "access", "no access"]
+        assert _destinations["noHaz_P"].tolist() == [30]
+        assert _base_graph.edges[2, 3, 0]["noHaz_P"] == 10
+        assert _base_graph.edges[3, 4, 0]["noHaz_P"] == 20
+
+    def test_find_optimal_routes_sums_edges_in_both_directions(
+        self, od_graph: nx.MultiGraph
+    ):
+        # 1. Define test data.
+        # Routes 0-1-2-3 and 4-3-2-1 pass the edges 1-2 and 2-3 in opposite directions.
+        od_graph.nodes[1]["od_id"] = "B_1"
+        _ocd = self._get_analysis(od_graph)
+        _origins = gpd.GeoDataFrame(
+            {"o_id": ["A_0", "A_1", "A_2"], "ID": [0, 1, 2], "POPULATION": [10, 20, 30]}
+        )
+        _destinations = gpd.GeoDataFrame(
+            {"d_id": ["B_0", "B_1"], "ID": [0, 1], "noHaz_P": [0, 0]}
+        )
+        _closest_routes = {0: (3.0, [0, 1, 2, 3]), 4: (3.0, [4, 3, 2, 1])}
+
+        # 2. Run test.
+        _base_graph, _, _destinations, _, _ = _ocd._find_optimal_routes(
+            od_graph,
+            _closest_routes,
+            None,
+            None,
+            "",
+            "noHaz_{}",
+            _origins,
+            copy.deepcopy(od_graph),
+            _destinations,
+        )
+
+        # 3. Verify expectations.
+        assert [
+            _base_graph.edges[_node, _node + 1, 0]["noHaz_P"] for _node in range(4)
+        ] == [10, 30, 30, 20]
+        assert _destinations["noHaz_P"].tolist() == [10, 20]
+
+    def test_update_destinations_with_several_destinations_at_a_node(
+        self, od_graph: nx.MultiGraph
+    ):
+        # 1. Define test data.
+        _ocd = self._get_analysis(od_graph)
+        _destinations = gpd.GeoDataFrame(
+            {"d_id": ["B_0", "B_1", "B_2"], "ID": [0, 1, 2], "noHaz_P": [0, 0, 1]}
+        )
+        # Routes of 10 and 20 people to the node of B_0 and B_1, of 5 and 6 people to B_2.
+        _nr_per_destination = {(0, 1): [10, 20], (2,): [5, 6]}
+
+        # 2. Run test.
+        _destinations = _ocd.update_destinations(
+            _destinations, _nr_per_destination, "noHaz_P"
+        )
+
+        # 3. Verify expectations.
+        # Each route sets all destinations of its node to their total plus the people of the route:
+        # 0 + 0 + 10 = 10 and then 10 + 10 + 20 = 40.
+        assert _destinations["noHaz_P"].tolist() == [40, 40, 12]
+
+    @pytest.mark.parametrize(
+        "od_name, name, expected_ids",
+        [
+            pytest.param("A_0", "A", [0], id="Single origin"),
+            pytest.param("A_0,B_3", "A", [0], id="Origin and destination"),
+            pytest.param("A_0,B_3", "B", [3], id="Destination and origin"),
+            pytest.param("A_12,A_3", "A", [12, 3], id="Multiple origins"),
+        ],
+    )
+    def test_get_od_ids(
+        self,
+        od_graph: nx.MultiGraph,
+        od_name: str,
+        name: str,
+        expected_ids: list[int],
+    ):
+        # 1. Define test data.
+        _ocd = self._get_analysis(od_graph)
+
+        # 2. Run test.
+        _od_ids = _ocd.get_od_ids(od_name, name)
+
+        # 3. Verify expectations.
+        assert _od_ids == expected_ids
+
+    def test_find_closest_location_origin_at_destination(self, od_graph: nx.MultiGraph):
+        # 1. Define test data.
+        od_graph.nodes[3]["od_id"] = "A_3,B_0"
+        _ocd = self._get_analysis(od_graph)
+        _origins = gpd.GeoDataFrame(
+            {
+                "o_id": ["A_0", "A_1", "A_2", "A_3"],
+                "ID": [0, 1, 2, 3],
+                "POPULATION": [10, 20, 30, 40],
+            }
+        )
+        _destinations = gpd.GeoDataFrame({"d_id": ["B_0"], "ID": [0], "noHaz_P": [0]})
+
+        # 2. Run test.
+        _, _, _destinations, _, _optimal_routes = _ocd.find_closest_location(
+            od_graph, copy.deepcopy(od_graph), _origins, _destinations, "noHaz"
+        )
+
+        # 3. Verify expectations.
+        assert _optimal_routes["origin"].tolist() == ["A_0", "A_1"]
+        assert _destinations["noHaz_P"].tolist() == [70]
+        assert [30] in _ocd.results_dict.values()
+
     def test_init_with_category(self):
         # 1. Define test data.
         _config = AnalysisConfigWrapper()
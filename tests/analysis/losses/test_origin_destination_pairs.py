@@ -0,0 +1,85 @@
+import pickle
+
+import networkx as nx
+import pandas as pd
+import pytest
+
+from ra2ce.analysis.losses.origin_destination_pairs import OriginDestinationPairs
+
+
+class TestOriginDestinationPairs:
+    @pytest.fixture(name="od_graph")
+    def _get_od_graph_fixture(self) -> nx.MultiGraph:
+        _graph = nx.MultiGraph()
+        _graph.add_node(1, od_id="O_10")
+        _graph.add_node(2, od_id="O_1,D_1")
+        _graph.add_node(3)
+        _graph.add_node(4, od_id="D_2")
+        _graph.add_node(5, od_id="D_2")
+        return _graph
+
+    @pytest.fixture(name="od_table")
+    def _get_od_table_fixture(self) -> pd.DataFrame:
+        return pd.DataFrame(
+            {
+                "o_id": ["O_1", "O_10", None, None],
+                "d_id": [None, None, "D_1", "D_2"],
+            }
+        )
+
+    def test_get_od_id_nodes(self, od_graph: nx.MultiGraph):
+        # 1. Run test.
+        _od_id_nodes = OriginDestinationPairs.get_od_id_nodes(od_graph)
+
+        # 2. Verify expectations.
+        assert _od_id_nodes == {"O_10": 1, "O_1": 2, "D_1": 2, "D_2": 4}
+
+    def test_from_graph(self, od_graph: nx.MultiGraph, od_table: pd.DataFrame):
+        # 1. Run test.
+        _od_pairs = OriginDestinationPairs.from_graph(od_graph, od_table)
+
+        # 2. Verify expectations.
+        assert len(_od_pairs) == 4
+        assert list(_od_pairs) == [
+            ((2, "O_1"), (2, "D_1")),
+            ((2, "O_1"), (4, "D_2")),
+            ((1, "O_10"), (2, "D_1")),
+            ((1, "O_10"), (4, "D_2")),
+        ]
+        # The pairs can be iterated more than once and sent to other processes.
+        assert list(_od_pairs) == list(pickle.loads(pickle.dumps(_od_pairs)))
+
+    def test_from_graph_with_unknown_id_raises(self, od_graph: nx.MultiGraph):
+        # 1. Define test data.
+        _od_table = pd.DataFrame({"o_id": ["O_1", "O_3"], "d_id": [None, "D_4"]})
+
+        # 2. Run test.
+        with pytest.raises(ValueError) as exc_err:
+            OriginDestinationPairs.from_graph(od_graph, _od_table)
+
+        # 3. Verify expectations.
+        assert (
+            str(exc_err.value)
+            == "Origins / destinations ['O_3'] are not found in the graph."
+        )
+
+    def test_from_graph_matches_exact_ids_of_multi_id_nodes(self):
+        # 1. Define test data.
+        _graph = nx.MultiGraph()
+        _graph.add_node(1, od_id="O_1,D_12")
+        _graph.add_node(2, od_id="D_1")
+        _graph.add_node(3, od_id="O_11,D_2")
+        _od_table = pd.DataFrame(
+            {
+                "o_id": ["O_1", "O_11", None, None],
+                "d_id": [None, None, "D_1", "D_12"],
+            }
+        )
+
+        # 2. Run test.
+        _od_pairs = OriginDestinationPairs.from_graph(_graph, _od_table)
+
+        # 3. Verify expectations.
+        # "D_1" is part of "D_12" (node 1), but only matches node 2.
+        assert _od_pairs.origins == [(1, "O_1"), (3, "O_11")]
+        assert _od_pairs.destinations == [(2, "D_1"), (1, "D_12")]
@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 
 from ra2ce.analysis.losses.traffic_analysis.accumulated_traffic_dataclass import (
@@ -112,3 +113,17 @@ class TestAccumulatedTrafficDataclass:
         assert valid_accumulated_traffic.utilitarian == expected_result.utilitarian
         assert valid_accumulated_traffic.egalitarian == expected_result.egalitarian
         assert valid_accumulated_traffic.prioritarian == expected_result.prioritarian
+
+    def test_multiply_and_add_arrays(self):
+        # 1. Define test data.
+        _accumulated_traffic = AccumulatedTraffic(
+            utilitarian=np.array([1.0, 2.0]), egalitarian=1
+        )
+
+        # 2. Run test.
+        _result = _accumulated_traffic * np.array([2, 3]) + 1
+
+        # 3. Verify expectation.
+        assert _result.utilitarian.tolist() == [3.0, 7.0]
+        assert _result.egalitarian.tolist() == [3, 4]
+        assert _result.prioritarian.tolist() == [1.0, 1.0]
@@ -0,0 +1,109 @@
+import geopandas as gpd
+import pandas as pd
+import pytest
+
+from ra2ce.analysis.losses.traffic_analysis.equity_analysis import EquityAnalysis
+from ra2ce.analysis.losses.traffic_analysis.route_link_incidence import (
+    RouteLinkIncidence,
+)
+from ra2ce.analysis.losses.traffic_analysis.traffic_analysis_factory import (
+    TrafficAnalysisFactory,
+)
+from tests.analysis.losses.traffic_analysis import (
+    TrafficAnalysisInput,
+    valid_traffic_analysis_input,
+)
+
+
+@pytest.fixture
+def valid_routes() -> gpd.GeoDataFrame:
+    yield gpd.GeoDataFrame(
+        {
+            "origin": ["A_0", "A_1", "A_0,A_2", "A_1"],
+            "destination": ["B_0", "B_0,B_1", "B_1", "B_2"],
+            "opt_path": ["[1, 2, 3]", [4, 2, 3], "[1, 2]", "[4, 2, 4, 2]"],
+        }
+    )
+
+
+class TestRouteLinkIncidence:
+    def test_from_routes(self, valid_routes: gpd.GeoDataFrame):
+        # 2. Run test.
+        _incidence = RouteLinkIncidence.from_routes(valid_routes)
+
+        # 3. Verify expectations.
+        # The route from a list of origins is skipped.
+        assert _incidence.origins.tolist() == ["A_0", "A_1", "A_1"]
+        assert _incidence.nr_destinations.tolist() == [1, 2, 1]
+        assert list(_incidence.links.itertuples(index=False, name=None)) == [
+            ("1", "2"),
+            ("2", "3"),
+            ("4", "2"),
+            ("2", "4"),
+        ]
+        assert _incidence.matrix.toarray().tolist() == [
+            [1, 1, 0, 0],
+            [0, 1, 1, 0],
+            [0, 0, 2, 1],
+        ]
+
+    def test_get_link_loads(self, valid_routes: gpd.GeoDataFrame):
+        # 1. Define test data.
+        _incidence = RouteLinkIncidence.from_routes(valid_routes)
+        _origin_weights = pd.Series({"A_0": 10.0, "A_1": 3.0})
+
+        # 2. Run test.
+        _route_weights = _incidence.get_route_weights(_origin_weights)
+        _link_loads = _incidence.get_link_loads(_route_weights)
+
+        # 3. Verify expectations.
+        assert _route_weights.tolist() == [10.0, 6.0, 3.0]
+        assert _link_loads.tolist() == [10.0, 16.0, 12.0, 3.0]
+        assert _incidence.get_link_loads(1).tolist() == [1.0, 2.0, 3.0, 1.0]
+
+    def test_get_link_loads_of_equity_weights_equals_equity_analysis(
+        self, valid_traffic_analysis_input: TrafficAnalysisInput
+    ):
+        # 1. Define test data.
+        _equity_analysis = TrafficAnalysisFactory.get_analysis(
+            valid_traffic_analysis_input.road_network,
+            valid_traffic_analysis_input.od_table_data,
+            valid_traffic_analysis_input.destination_names,
+            valid_traffic_analysis_input.equity_data,
+        )
+        assert isinstance(_equity_analysis, EquityAnalysis)
+        _expected_result = _equity_analysis.optimal_route_od_link()
+        _od_table = valid_traffic_analysis_input.od_table_data.drop_duplicates("o_id")
+        _nr_destinations = (
+            valid_traffic_analysis_input.od_table_data["d_id"].dropna().nunique()
+        )
+
+        # 2. Run test.
+        _incidence = TrafficAnalysisFactory.get_route_link_incidence(
+            valid_traffic_analysis_input.road_network
+        )
+        _origin_weights = pd.Series(
+            _od_table["region"]
+            .map(
+                dict(
+                    zip(
+                        valid_traffic_analysis_input.equity_data["region"],
+                        valid_traffic_analysis_input.equity_data["weight"],
+                    )
+                )
+            )
+            .fillna(1)
+            .to_numpy()
+            * _od_table["values"].to_numpy()
+            / _nr_destinations,
+            index=_od_table["o_id"],
+        )
+        _link_loads = _incidence.get_link_loads(
+            _incidence.get_route_weights(_origin_weights)
+        )
+
+        # 3. Verify expectations.
+        pd.testing.assert_frame_equal(_incidence.links, _expected_result[["u", "v"]])
+        assert _link_loads == pytest.approx(
+            _expected_result["traffic_prioritarian"].to_numpy()
+        )
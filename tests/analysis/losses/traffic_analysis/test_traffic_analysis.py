@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -84,3 +85,23 @@ class TestTrafficAnalysis:
         assert _accumulated_traffic.egalitarian == 1
         assert _accumulated_traffic.prioritarian == 0
         assert _accumulated_traffic.utilitarian == pytest.approx(3.1097, 0.0001)
+
+    def test_traffic_analysis_get_accumulated_traffic_from_nodes(
+        self, valid_traffic_analysis: TrafficAnalysis
+    ):
+        # 1. Define test data.
+        _total_d_nodes = 42
+        _o_nodes = np.array(["A_22", "A_22"])
+
+        # 2. Run test.
+        _accumulated_traffic = (
+            valid_traffic_analysis._get_accumulated_traffic_from_node(
+                _o_nodes, _total_d_nodes
+            )
+        )
+
+        # 3. Verify expectations.
+        assert _accumulated_traffic.egalitarian == 1
+        assert _accumulated_traffic.utilitarian == pytest.approx(
+            [3.1097, 3.1097], 0.0001
+        )
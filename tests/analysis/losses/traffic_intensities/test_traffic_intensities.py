@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 
 from ra2ce.analysis.analysis_config_data.enums.traffic_period_enum import (
@@ -43,3 +44,48 @@ class TestTrafficIntensities:
 
         # 3. Verify expectations
         assert _result == expected
+
+    def test_calculate_traffic_intensities(
+        self,
+        traffic_intensities_data: dict[
+            tuple[TrafficPeriodEnum, TripPurposeEnum], list[int]
+        ],
+    ):
+        # 1. Define test data
+        _traffic_intensities = TrafficIntensities(
+            link_id=list(range(1, 7)),
+            intensities={
+                _key: np.array(_values, dtype=np.float32)
+                for _key, _values in traffic_intensities_data.items()
+            },
+        )
+
+        # 2. Execute test
+        _result = _traffic_intensities.calculate_intensities(
+            [2, (2, 5), 5, (3,), (1, 3, 4)],
+            TrafficPeriodEnum.DAY,
+            TripPurposeEnum.BUSINESS,
+        )
+
+        # 3. Verify expectations
+        assert _result.tolist() == [5, 8, 8, 7, 20]
+
+    def test_calculate_traffic_intensities_unknown_link_raises(
+        self,
+        traffic_intensities_data: dict[
+            tuple[TrafficPeriodEnum, TripPurposeEnum], list[int]
+        ],
+    ):
+        # 1. Define test data
+        _traffic_intensities = TrafficIntensities(
+            link_id=list(range(1, 7)), intensities=traffic_intensities_data
+        )
+
+        # 2. Execute test
+        with pytest.raises(ValueError) as exc:
+            _traffic_intensities.calculate_intensities(
+                [1, (2, 42)], TrafficPeriodEnum.DAY, TripPurposeEnum.BUSINESS
+            )
+
+        # 3. Verify expectations
+        assert str(exc.value) == "No traffic intensities found for link 42"
@@ -1,5 +1,7 @@
 from pathlib import Path
 
+import numpy as np
+
 from ra2ce.analysis.analysis_config_data.enums.traffic_period_enum import (
     TrafficPeriodEnum,
 )
@@ -45,7 +47,8 @@ class TestTimeValuesReader:
         assert isinstance(_traffic_intensities, TrafficIntensities)
         for _traffic_key, _traffic_data_reference in traffic_intensities_data.items():
             assert _traffic_key in _traffic_intensities.intensities
+            assert _traffic_intensities.intensities[_traffic_key].dtype == np.float32
             assert (
                 _traffic_data_reference
-                == _traffic_intensities.intensities[_traffic_key]
+                == _traffic_intensities.intensities[_traffic_key].tolist()
             )
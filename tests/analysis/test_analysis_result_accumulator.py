@@ -0,0 +1,48 @@
+import math
+
+import pandas as pd
+import pytest
+
+from ra2ce.analysis.analysis_result_accumulator import AnalysisResultAccumulator
+
+
+class TestAnalysisResultAccumulator:
+    def test_initialize(self):
+        # 1. Run test.
+        _accumulator = AnalysisResultAccumulator(["u", "v"])
+
+        # 2. Verify expectations.
+        assert isinstance(_accumulator, AnalysisResultAccumulator)
+        assert len(_accumulator) == 0
+        assert _accumulator.to_dataframe().columns.tolist() == ["u", "v"]
+
+    def test_to_dataframe(self):
+        # 1. Define test data.
+        _accumulator = AnalysisResultAccumulator(["u", "alt_nodes", "connected"])
+        _accumulator.add_row({"connected": 1, "u": 1, "alt_nodes": [1, 3, 2]})
+        _accumulator.add_row({"u": 2, "alt_nodes": math.nan, "connected": 0})
+
+        # 2. Run test.
+        _dataframe = _accumulator.to_dataframe(index=pd.Index([10, 11]))
+
+        # 3. Verify expectations.
+        assert len(_accumulator) == 2
+        assert _dataframe.columns.tolist() == ["u", "alt_nodes", "connected"]
+        assert _dataframe.index.tolist() == [10, 11]
+        assert _dataframe["u"].tolist() == [1, 2]
+        assert _dataframe.loc[10, "alt_nodes"] == [1, 3, 2]
+        assert math.isnan(_dataframe.loc[11, "alt_nodes"])
+        assert _dataframe["connected"].tolist() == [1, 0]
+
+    def test_add_row_with_other_columns_raises(self):
+        # 1. Define test data.
+        _accumulator = AnalysisResultAccumulator(["u", "v"])
+
+        # 2. Run test.
+        with pytest.raises(ValueError) as exc_err:
+            _accumulator.add_row({"u": 1, "w": 2})
+
+        # 3. Verify expectations.
+        assert str(exc_err.value) == (
+            "Row columns ['u', 'w'] do not match the result columns ['u', 'v']."
+        )
@@ -0,0 +1,126 @@
+import numpy as np
+import pytest
+import rasterio
+from rasterio.transform import array_bounds
+from rasterstats import zonal_stats
+from shapely.geometry import LineString, Polygon
+
+from ra2ce.network.hazard.hazard_intersect.windowed_raster_overlay import (
+    WindowedRasterOverlay,
+)
+from ra2ce.network.networks_utils import get_valid_mean
+from tests import acceptance_test_data, test_data
+
+_hazard_tif_files = [
+    test_data.joinpath("losses", "static", "hazard", "hazard.tif"),
+    acceptance_test_data.joinpath(
+        "static", "hazard", "future_depth_RP_100_broward.tif"
+    ),
+]
+
+
+class TestWindowedRasterOverlay:
+    @staticmethod
+    def _get_geometries(raster_file) -> list[LineString | Polygon]:
+        # Lines inside, partially outside and outside the raster, of different lengths.
+        with rasterio.open(raster_file) as _src:
+            _left, _bottom, _right, _top = array_bounds(
+                _src.height, _src.width, _src.transform
+            )
+        _width = _right - _left
+        _height = _top - _bottom
+        _random = np.random.default_rng(42)
+        _geometries = []
+        for _scale in [0.01, 0.1, 0.5]:
+            for _ in range(50):
+                _start = (
+                    _random.uniform(_left - 0.2 * _width, _right),
+                    _random.uniform(_bottom - 0.2 * _height, _top),
+                )
+                _geometries.append(
+                    LineString(
+                        [
+                            _start,
+                            (
+                                _start[0] + _random.normal() * _scale * _width,
+                                _start[1] + _random.normal() * _scale * _height,
+                            ),
+                            (_start[0] + _scale * _width, _start[1]),
+                        ]
+                    )
+                )
+        _geometries.append(
+            Polygon(
+                [
+                    (_left, _bottom),
+                    (_right, _bottom),
+                    (_right, _top),
+                ]
+            )
+        )
+        return _geometries
+
+    @pytest.mark.parametrize(
+        "raster_file", [pytest.param(_f, id=_f.name) for _f in _hazard_tif_files]
+    )
+    def test_get_zonal_stats_equals_rasterstats(self, raster_file):
+        # 1. Define test data.
+        _geometries = self._get_geometries(raster_file)
+        _expected = [
+            zonal_stats(
+                _geometry,
+                str(raster_file),
+                all_touched=True,
+                stats="count min max",
+                # Only the masked array is passed, as in `rasterstats` (<0.19).
+                add_stats={"valid_mean": lambda x, _: get_valid_mean(x)},
+            )[0]
+            for _geometry in _geometries
+        ]
+
+        # 2. Run test.
+        _zonal_stats = WindowedRasterOverlay(raster_file).get_zonal_stats(
+            _geometries,
+            ["count", "min", "max"],
+            add_stats={"valid_mean": get_valid_mean},
+        )
+
+        # 3. Verify expectations.
+        assert any(_stats["count"] for _stats in _zonal_stats)
+        assert [
+            {_k: _v for _k, _v in _stats.items() if _k != "valid_mean"}
+            for _stats in _zonal_stats
+        ] == [
+            {_k: _v for _k, _v in _stats.items() if _k != "valid_mean"}
+            for _stats in _expected
+        ]
+        np.testing.assert_array_equal(
+            [_stats["valid_mean"] for _stats in _zonal_stats],
+            [_stats["valid_mean"] for _stats in _expected],
+        )
+
+    def test_get_zonal_stats_without_geometry(self):
+        # 1. Define test data.
+        _raster_file = _hazard_tif_files[0]
+
+        # 2. Run test.
+        _zonal_stats = WindowedRasterOverlay(_raster_file).get_zonal_stats(
+            [None], ["count", "min", "mean"], add_stats={"valid_mean": get_valid_mean}
+        )
+
+        # 3. Verify expectations.
+        assert _zonal_stats[0]["count"] == 0
+        assert _zonal_stats[0]["min"] is None
+        assert _zonal_stats[0]["mean"] is None
+        assert np.isnan(_zonal_stats[0]["valid_mean"])
+
+    def test_get_zonal_stats_with_unsupported_stats_raises(self):
+        # 1. Define test data.
+        _raster_file = _hazard_tif_files[0]
+
+        # 2. Run test.
+        with pytest.raises(ValueError) as exc_err:
+            WindowedRasterOverlay(_raster_file).get_zonal_stats([], ["median"])
+
+        # 3. Verify expectations.
+        assert "['median']" in str(exc_err.value)
@@ -1,3 +1,5 @@
+from pathlib import Path
+
 import pytest
 
 from ra2ce.analysis.analysis_config_data.analysis_config_data import (
@@ -6,6 +8,7 @@ from ra2ce.analysis.analysis_config_data.analysis_config_data import (
 from ra2ce.analysis.analysis_config_data.enums.analysis_losses_enum import (
     AnalysisLossesEnum,
 )
+from ra2ce.analysis.losses.criticality_results_cache import CriticalityResultsCache
 from ra2ce.configuration.config_wrapper import ConfigWrapper
 from ra2ce.runners.losses_analysis_runner import LossesAnalysisRunner
 from tests.runners.dummy_classes import DummyRa2ceInput
@@ -44,3 +47,34 @@ class TestLossesAnalysisRunner:
 
         # 3. Verify expectations.
         assert not _result
+
+    @pytest.mark.parametrize(
+        "cache_criticality_results, expected_cache_path",
+        [
+            pytest.param(False, None, id="Run-scoped cache"),
+            pytest.param(
+                True,
+                Path("output", "criticality_results_cache"),
+                id="On-disk cache",
+            ),
+        ],
+    )
+    def test_get_criticality_results_cache(
+        self,
+        dummy_ra2ce_input: ConfigWrapper,
+        cache_criticality_results: bool,
+        expected_cache_path: Path | None,
+    ):
+        # 1. Define test data.
+        _config_data = dummy_ra2ce_input.analysis_config.config_data
+        _config_data.output_path = Path("output")
+        _config_data.project.cache_criticality_results = cache_criticality_results
+
+        # 2. Run test.
+        _cache = LossesAnalysisRunner._get_criticality_results_cache(
+            dummy_ra2ce_input.analysis_config
+        )
+
+        # 3. Verify expectations.
+        assert isinstance(_cache, CriticalityResultsCache)
+        assert _cache.cache_path == expected_cache_path